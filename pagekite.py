@@ -169,269 +169,333 @@ z87I7~
 '<lSzjZM*&D\U.<@ )ܽ<fr)3qډg)"c`7ąeN4#zY}7񭁇#߼KY&dr
 g-Q:]ޓáՊca!;UV^W&7//@Kᄈ~HNѡG٦} ߞy"Ņ<yj`04:^piDŮbWfo*t*#@>f$ȸԗ%MU{Ao&ٵw.CBkFvMme}D,JصvTʱCTj,?Ub8R4%5bpBN mCru!hxp:iFqbwfT͖tJI+'
 ?k6ÖGMYY(u#0,GۆeH=^Ƨ}?;Wd]IJ;gх I6'VBYNnv`E0&: ,-%àKjY_ⵞ#2e
-ضсQʂpj۰^_Q{\6 nMV)*ǹ9r!Ֆ_UVZP젙"eKrU4grC"{}ȋ BWC?PK    V,  w     pagekite/httpd.py}s6+PwjeN΍jJ⫿^[P$HNwwɥbX,19s`w'6ZQ`pr󬳱	%6Y`tY,3>p&YQD˂wXqxcۯqzr?Z͛6ԟLvv6)g~bMx̓8/.gYϧ CvCocc4KfY,OC.{Jl,0/pba(w-I8}e<RQl#ޞgp:YgA.(p㜳 |'lD ג&rx᛽T5IlmdAg,IP}ڈT[n8a EsО9`>QF-s>]FmW0d`7|O [\`QB@ɂxBWG 7$}ë+vas])uP7&(6ݙeф̓{:=1HZA3j&0|N,N6@yQݝ,^vl	ί< "y2P
-%Tה
-+q{T-̢(u`\k~2)@E@"j8NQC5
-HvJob ?R_Y~EE`hHUqx<-	,ta@jzρ3/^ד)"Eu&a<	$;|卵h:N&jnJ@vKCį
-@f@BȟAEyj;E  l}ڌ kccȇE2yDudG)O@7> -첌ü`?٭@N [К
-o%hͻ	L L\9EͿa1z7QpYI>I*q$1LItQOar((72`wWn5yc[Lf;;jFXuֈM/%aC k.i
-Qpa1 O6 %6aJr0i C*d&'9u&akDm)x=n@/%Α	q012ŀA-o`Ise|'f6dLmdMdOoGPGqv!{K&C,M`8FvGȄQ}%nA.~PM%D5vaUs!mP6N*Z!̖1J_,;_]>t<uB[vV vJt	,@Y 1)ԊvEЕ0{S)*F/__6{]jxo,6>0v"WbgNh^\ay2e@KdpAt'='$C	E\ɄǟM"J7v8 <1vd7}/J:*ʢ<):5YC5	`?$P?BE	tk )PI2b/h:s`MqO'ؚQڀ/V\RKy%U-EｇfQ\twg8*s.Y ,#vQRⱀ-h`8;9]q{9KpHe6 c~~yA,(#;#߇/~r.hq{gPe~1Ny3JXOg&ŤB"6'r"H25ּY85/fVY1V57qXi
-bZx+M
-ۣ0ծ#V +"A6\Ig?|VMJ*Ȓy|ia`imh`VdUfd=nӷ*ܛqpxnڽH_2 e9[{uo#|URlU,tX{hK'2O1I5-t\4Z4?T1P}S"NqJ旆}Z]C}wy#JeE
- Ie3:s4:.UB#p)=|{
-\*q"N#R,N-J_V+<[ y(\ZX
-DKs1<>Pr-stPH/"4]Axu֛[>kٹ80"; R\wS?EA5Ga|O$36nV3>mnh%VVMi6	Qަ7ciٔ7Jlo+glGw4ajyo\?3zj޳p#4w u%4I0Ng6::@v=û>ۤ{j'<	:i234˷8yhQV>)S2,ee@|Q.*vuxaG]Y19(l{l ?v6FmYfe#zx6Aġy͎,?]=",$[PwA6%Ss[:@#[i#ah Z+m7wWpbn"K*҆Q69>z^AaϚ%q y*#ڸ@E۪O-XênU{?7Vsu`9\m%9aP4_V /`Y=q[,qP b,;'ٽU]twkUmӻGe|_mLUo8}+au-;z~A@WF%͏J#XQIsy?E"bn?Saߪ6gS3B\TP{E>	'Lݐ[1`+]ޣ)5+$vI]25{Wѳm{pX쁞UĚϔ6{8L<q+:1hA]5iGvv^+=SҴèJ w#<ЎWarD)^]M~9%HOua.P&T'Rzy!%CoIK )3R9ߧQL6]FPlUVC8M&wv6|U	il);si`Fq2U1I;UXh'l#w8Tچ0~+sW[
-g;⎢"dRf¨-}.1+"
-|knd[TOZEs6TJ2:[)-U[.*['1qDWr/-U9#aE%cf =r%BKyZɹLE@>7hR55m:$n/X&o-Tf$Y'yA0"ϓ6F?j`p[:yҠPULJ7Y3 _X"38a̧Je-^kYX4jk
-Zf&.o4 LpB=f'KwW1-gL h6[\NY=X5;Ħ-rOؠC!M/0Dev5C,]U,-(KMIMY]2~Գdߟ_~1ZI!*Ex:m2?ݗ.ݬْa>s;2 ET'^kI,	|~Rz|Og{wq=5XmScoaSHrl][Jb.sTjP7: ¿:Tb*2#BBbSc`"HY.# U0zkF"S>{pV5RN'n0:._>K#u%ec7$5T|ѭ[#(;((f
-gbgV6e+Y8_vF5l>,5?i I94Ȃr	NY0CGr:dRtǜB'EO,d0t7uC)юf/VMF#S-5M!rs;N<+N䪱uFNd$&I-1mH1dCp 0W<W&/Z[[n@.>*V7<dg"xʖw(5EHc Q88/a-L/)@yc4I8Fu9HZcKP0c>8|BG^KJ9#f gZhvqE3:1XC'd7NXY|ބzFK<C'S$,siNGg<Sd=fnpO9$]C2z*8
-"E$}[ tךu/0L)QvOֱl*x/8!>Gy ;츼@nB欽˨6[+UZCMȣu1㾥iEckno=|<Ȓw׃Y!	Z|?P"f`#?9.jmj?hX. )z=î9a[{g߼e	,l .H	Uئpr0+gB:-ܘqڥj,X9Yiش6	0w|CL+6mX/7)M_gp9C[ZKG<Q}/k.-V?0FJ3鮐z&XIyHuAHdUցNSЈKhrU.zBX[iIIe$ev5fKvxվ{ZyS)fSvpIXbwMW{=:PSa=;`[dFtn$'{M*91R;PPId5ϕY<Uôƙ۸aL\}&}a<"/U?'"֚8 vYpVxp;Y[s\7-jIm9^UL霌'4*zs;ĿPύ%?0&8|[6	3ڡ-xŶe106 mJyJi[Rdx7=zxr~uxxzDK5fjir]w۟OOyJ
-oxaDxM,Ě2FZaA~AIC	A0dʨ΅btZVDa\NfW%)9jUKX!8 ʒ21Lrthc ?N1Lep*f8(rcpȅl<앢7b2"kɽ4nD`vm9lvɻE9eѲ@9LV@Rr4Zn2,0w\P1YB707U {Vہáxq'irjZ/͍ZtmZbIƤ!zTu ڢ(' (@hk1y^+A"8j7t(<ȭ$6!Ķx+çfZBVݧG>DO^ӕ&(gx@omّcmxkvg%w>
-yyo:+{ KW{N.dN>6"P'b *}HwJBꎵ7ۓV9VY&*Wl:R
-YeJcǳ 2n驉;K$hG:Zѐ^OMb*}a{3/\p 4SeoҩDiNO\x¯Yz7}&0,<ؼ3v8&.f鮬_lX>xnN%?GF&[Fg[Ф%U7{-QK\pT05v(%CR/&*tNTkɖj:Bș%Ya-|1Z+F+6a*GDr-SZ69D'3+"RɈ5$³L'jinM
-'{wcX^z.1@#AbG!%ȈǎtMan؄
-tlզinET#t-M%K;,JBjl .ݶQ=S/"p
-IVVwtpmWh{ޱ\ԛU[m 䑳ƒ8qEC=.AlH)l	}3C(c%׀և%nӉvTZD-q[چg;Û>njV
-0o)Z88'ҥCwpb0Eq2{CX[9L;}$E:ahq.c0.'tN7xO:Ƭ4!揊uXصd]4#Sȹ4Oۗj1HCKnbɿӞ=HTŪATf=knn`QW@$W=`LiB]WI{83*e5~-O[o^dSbx$W#ݚ~3SM¢o]D0Я"TL
-[}FCB/j縬	A?HKYF-P4{s&%t(6Kh𽓈}
-J7uHF\ep҄XZfZ{@$];ڶ=0gmAȹG<cO "zFykvRߦuJac1A/k(M0¯ƳN+?n[Q$4`5KBv`Fv.S-7֥7o9_Nm`i-
-{J[!)\ܯdnAx	ZTRubJDn+Mkb~Vz%j52(]j:g^1&/w_`3XuuVK]aH	bHtY拶c=6}O`|9PkX~,I:nv1]"qۗ&tET qWH"nQt-|B~n':,CP9Hڮ;Cb,{vg߁:	!dH[QMKy*8J0Y3ݡ|de2ܕN[ll:B7TO4w}u3 SA6ukq	:gBRC.8p3v+#jP۲h
-RO**໖ER 幱urGVkSk6Ҥ<'D(łZ֑s.8W[mﺇ]` U}9`pN͝h,2@V$!d]<Zdʋ|Ο`͸P!Hʧ`U'=ndXiq|6n[,Ɖc?E9HaH)KϳpI1m`rxʚE1mSēǹT;;URUclWҦ[9LY5%EW@$-{sYˮ,g\\܅'YǤ4,H`ػ*k^g]{ZBvatÜ:| \!Ww=#c{?we4X}C.t!4	L2[M7-)J\TT $#qGA~V.7l~ݶE3*'%VM\~&j}^:>J9ƺ+Ccغ*Js#Iǧj\7~y"ڂLM<x<װ>sû0N5_a).{m
-V$ioSmBJ#>knݑ2.UG_+GY(6)@P,^'NOG<={`:\u w*+ocNQQQ9g;Zp{d>zyA]%xTUۓa|ʕ4R%yx9׭	HAZMhHԈUf8D/	nmRACq3T|/YTI7L%#*)NBt
- S
-~ZloMֻYw:@<P  WKWٷI̽~E5m[zicbԝFSܪ[C9m>C򐎝I1󯈋^O5N66, B+g<f&/#7DO	`G =/jD}R	#0˓U0$?N|4;DqIהjth[osI$j>/xևfS.,unArUDf7h50,U[4zR&LFt܍)rgknZx4E9cז:[m%_7~CnTSĭĹSJZs4dA#r=zVI4[',vzx,G*O
-UC  xl4mkBau/k5(BPP|]58.0X	{	ϟa앪ZcCS*d؊FyP{t?{0(a 5VxFik<)?5{QCrŔjt2}aXͮ^kځ,칆|6iW3o S/97 'rƛ݁^'ZW^GʱlQ']cיP&7*LP˳0ǻE,:ȫ?.Bݞ0RK0JE}qaPͧ2[$#璫֗׫PV`mk(7u}蕑6v8";K3<W>=S;wV6)TP)jZ8**B[[Fr9++ΦFa]MѬUyպUUGn	Zdr&󮦷Ph~.w viF&N	E#a[T$J#@\K<)&-6ƒj2P$WshD	븾DZnkYOB;vx0S<D><:^\U~_;S	N}LyP) sS>{n C'zX=RtX8.sI	@?I^ȭWb&1H.wwvukJ#P-Yb'5+zcԞC֦BuTKo	%s6b tw;cT׳ˣOb$uS	;9QFTk<
-Ƌq;E;xS_^@oQ{%~}OpBЬ.~d閯Uy/f_wmИ)#:Yzv_!>;`oG9S>94'&ƣo&ZML_BalF{RWא":Kon|]WP8TjkWAlk0&F(ȍlaDM,Z O\$}(:0Xu9ysK]nC6z@ta
-^^].rbM@b0ݔ5
-1a;z?&!|6A
-]ÉS^%sߑz̤&JL*?2$F
-da'=h9ZEyJ5,?"WU*XX&<{Y13.&eF_oot+bZ֡mC4n(gL[
-l=y@
-}rjӛ4EX-Sz͛yNDxK\Ն#{aiǧgt7J+Ԏk%G$P2z?/+LaC>k?^ۥӢRB}*+u2].A눮|5J|QX{eH=+Sp% bZ)M`4ς^zD!EVxR}#jΖ,I5cdL}{o- #mv-Y_u(]x| sc{LMy*<S@zPꉮ׷,V=KQfྡ/euDj_3c'xDb~ViGL,8Ox#\cWAyg-Çc_3dJ'ZF79`t#9tj$a{%>} (tA37XRYDAkF?WO$2 1?9HA`of(0dg	G$y 
-t+l؍6%,hQi+x+u (9wDz"uz$D"TPEԢG4q \Kۭv18V;O`wxjfr=x,Y}_5hx>]%SOr}P
-#r)wCqiUEMD>;TޭyVV<"8N޹>Pcᛔ|eJAt.|wo'Ϻߜ^|~?=~#{г,s\;wI\, {FXLdnP>ڶ
-4V0z7}!y..ٟ=s}#:Ό">^9'fVC~b(@M#Bʡh-:y쓜2M9z	QE]4LAlwd! <WD~rdPiFörxHfANaVUw=4OɐWȽ=W}Y(Ek鑁&)O#(ҁ^!_
-wx=IU)|U˯rWO-Lfo?Ѷ4,t%NyL7̗o.f5yF6g%|wd4#V?PK    tZ<!  y    pagekite/pk.pym{F(]@^lg3afdIDOV$(aL ZRfs~@ɓ9s8덋۴wqɬ
-YP&A^7iσEM'2I>U[>trqf7AI4H*E<'EPƛ|'eokhzcV`4UFAXE2dĿۊMiYelRagghdxόY:O˸ $:ϗ*&qVVSߓI$^g"KU!LFQ8jnY7EgEe>"*4-":B[y9Mg`Mb{Q%ŢT3|r{YRI@g(8$Y1t 01nr #AD9)p΂W%b" AyKԁ>lGnF0o%
-(3Xl5GO//6N~
->\Pu9aH@J p8CGG?a]Nσlhx<8<?;`$3"٘&UalYB6N3+&@U
-ވ9P&T0x͂,A M֜A[Wӆ,2_zsRIZ/r2\eW*t+_VIY*@%n kK=Xej$S#=A@'ۇ!:ιKaU8ekkr0UjZUcI9*_n$dYGT(BW몗EDK*X֯e\gMN|)1be{dDI<MG?HeOq<
-)No/&)lu@.앚dς`B![΃.z1L؂;(Y#+`V4T?oz^bZOQ[M $9ɳdccbx!<
-i?l޿/Ar9
-AeM\sL]j>_XHyUe6S3eRU0 IiZ<w
-`Ns@&aOo<kNDWukgUϗq̝em`Ti,)	N4PKư,nkEkOcp8?cLKKX^Yo3ANVnA+k0 lݘ瓘 Ӭ+^UzEvn؏2Er0%]2lM 
-+< T)n5/G&q/@/s&v2!:MO5O&ZL%=@Xe2)V8VWGcAқ:2 .j.3~8?@j+Ōi6Z;WI99'zwUoOX\?	R9ja LB%OG)I@ 0@-;
-[n~ ?`^cq.UL2XrR*D+80J؛JitNƫ(."%y3\+>uKQ.fr>X$Ag{}"Zrϙb_<%7*v/$8,M0C֏@(ߧI6wRq`F:A:`gaÐz<*?C1 | dJ-c$ e*w@1Ө#oxɺ}%z_FG˾p4#V^4Q;KAm{`NRVBM@@E
-@@!!h9R?Ք,B(3^ã%>0!VX%3Myׯyv߁FWGaRAaanBFf)	cYq,ƌFx΁P$FVJ`r2~`PFSH__㱐L;K
-Y/C#uYFZ=Ջu&sDrcQn2pgr9B9H*Yr0-аI
-z=UhI}5/A<`{2)123Mh.WUt-on N\w ^]?B$WI+>Aߴ*;Q."ZJ^߸\xO	Bw6a>.ǯ̽V+ǴEVq YEQFqS
-U *X$$یn<Vx.(P+ 9;k62%@Z_	TEQH!kRL,b1Z%Q}[R 
-kuGC*q. O
-U,=+q7MRE!	ٸEKxrVJX(쮹cas}󊫃jp"AEf^7_ahSif?pЋbeHehJmK5%"G+	3iy3Viva~E%mh<Ap %,6xV>49 L4]JvwMר鮲ɀX;l9y@]./uV ; E5cVg2ý!K'
-<;(vDЋncW;=m{YiPh]\Vg[4(ZMxpLpݛM'4hPAvЪT+V]Aoxl,,x7]qE#2VH{ˋO_)l'1ATs,Qk(#47ܑPZ m.`73gx3K9hTVPMaV#F!B-9D?QU%u#rm޶ 5zNveH/~:<h/
-[}OC!lЬJUp{;N*(j֕nj4vejYqacc$# q	~PStl?|]*R[FWCox\rjZ]F\.%{Ҟ'3nA;lqF\	-KUo@BD)qzˀ(+SܡDq/J$/ ["PΥCtÃ㉧.kyˢang G'2:E1h	Ꙃ|y=SQ@Yfj$i(	GEЪqdNS-}=юfw=`i<Hȱn/ZdLFel?]lE@=It`vnX^mGg(ZGm=N MzP|!S9W񄊦^]PjidKW!tW"
-&4[Æ)lJLW~ZgjJIge䍽iVr (ͪȒ؜{MK\JObDZZ%hi[ׁ7Ľ̗Ѷ-C^~?::U@A28?ysqfT<KfU^#OSCiсNH=hFx?/AL>m0f"W=MdzQ,CvHe}#@S?%:]({ u ʅi4ӌ!@L٧ANAE;Y4fhA@F>NA$tUe^f6*^,QF-s<Yr%
-V2nJ,CWU6hw;X 2*lZtz40= z60<A>fFI<h?I=̚P3 rt9$%M$y9bQyNlRrr	 ~>8$?Cј`X6F|PTEj,y>a%RHN 7)	 0aY#gf24xZ-S$r3F")i䳀X+w=/~Mr(%:F<?a748zc4r^+LZ)R!EuZUd	"g `'(xzaNK'5Ϧ:O4NdQ4;53/KR(m#;2z@^6/<ΆlZQ $^.;"V.yҗPQf1Zdۇjb0kVK)#"C2q֞#AJ*ܭPﺾa71!}R4 0y S_PқXqµMZcCr"oG'7#z(xajNxBYR݉PpXJVUYo*/R*4T~r岃YyC8fBfuxr[O@gH4UjFuhOQt +":fD!!ވyy(yսOiꚓ[EqK֡
-U;}$'65!-'v7}+<+~ձoFD[9XKb1t4KCUNRǝt&\(~DJ}^m{|	ak$~Sק.fcz#:w~.+zJ`CĴc
-O7v+vN﨩eݜ^nrq@~/K"_GRK}lFfQu<YWAvNi][x5N,<X5WKEQu鎂yo7v'VǞb^^׬k'[,zji;pλ-~C˻bxqt_`]gdCjYmvH(ҶS`[@^0T9p7vnqU<si>¨=Fb7!Sgy>X#tB.A݉xa$aS*ׁUVvl<ڝk'β\[tN:tCU,:٢b]KGcޛNwKp;C&O_?4`#52LZDWq% DX\7	iޣc0 6յus_^qa nDpyaRbJ7Ȓ;XkiFt^<p#;B#3LoצwfWrgd 0M3^>H۶OT0db`A^P|ΤsRslm!|PeRX3~0o	xp 1̋0*>%CjJ 0V\AOqW[seQ5l#﯇v.ՎZEMY6č?8ZU`K*TP0FQ%SNz4QΑU;h|OFi$w,7(W<Py~tqڠ͒cR#ղX,Vd>1x}\SKr\	.uXVB%˜ݧliw,!J tTٚ+yt&#VȘ;*0ς
-9 .sD0RQ2ϕ߱FӀ>[fzA"cF!u1;ZGQdhvڰZဖr|Ĳ7]fqSXl:KF2>ms] wQ{ǽ_o0G,@ge:M6P'U?GEV)"=)t{#(u[uP"@8B7KI#Ӏ<ƦfR
-K/Bx}LWn@O>VCfy@Ja$Z._wuX+)V[ݓT٦pZhZtBly,1fVK7Jm;잳"}Ԅ:={l2ZvtrVuGFo^em5O;q	"cЕ<N>:S=
-͆[^_\|;6:a`d{HИg;;THi	[|e-2}9mvkռq++uqCP*%qL rhdY2-a8iN;3A:#k-7
-]1X1.¬%ŊNiMrkSW CWfw|ݗIӂiͩWnM./;w^ML@\65*w%jVSbMuUo[.)f]B.J}w|:2}s@ O D}]BƫV;3:+pkk𾪖Ӣ_\G7`떇ك4}˙WYGdA;($ \\v-R>}K>eJ
-)*2x~Qj`Gfo{c=͆Y)[=OGCrxwpp}ۜ ?%$}m@MM~tF|[SƧBE|M*l8a48?бdSsRUz50?֢CiQ^zbZiT-<sP;-V6k]OPa1EIE8?z ͌MptUhyʫ1XFJ5lbe`柌ÔZ~dR˚e`u1>sa[ׅ&ykكmgs
-U00u!K1I;XȩC6.Ve@zo}ӲMi,`lSmBA 0ODl]E~ybsR/tP27ƝJgag)eWEpi<"$lB9 K)ѵرy=xױn| Gibxv-醴Z
-V)V[SفP?hrVaK!yML/?9kHglǅݜКuKxwɎٲ}*J`dBIPjnT^4SXX4$k<_Q߮Pwq9D-Q]prćax{cc8sGI-CDmxĪ툑#98=><BM2oG ~uό<NG#F/Lqu5t
-C=I0^"/PS)(&AV0`8O"Jmو|(@3BK}E%Հ50 =߾>dÂ44k㛊+UwPfBM2G+0S.Xi,c9}^bJo0QKhl^$Ii|Na^'g{BZ}@>Ebx5H)9=ȶ|qn3l mΆuH%9ĎE )\ȁl M%I2&֒,[I~VzL@/"9umdqY=`.g:|Jgt]ed<zoS5YM1f{D^ٖcQ9xp2Od36lIvtNMס8W~(4ZfR?RP~}O3ցW-L_%CMDM\	A8<qxtpnpRN#zુӕZ[rB_xDwԃ}6UVSgϴjWXxh8p9QDEb4k6M]N{N@j7$dJE??Sĸ>$[r e@`qlsxL];1Ik4Z<\P^AW"0kL`jzIs<^yhl @դ2='`$0;Ofyz֬9>6A6mgNFZvW:꼵!KQ']P8_縪o8吙KW_jBtcs*M.F/cNG9DlV;Sykõc|n !Ku-rM>.ٍK5a:;&o"	ҷCcQ
-rJn{vϹ~<.S=`p	TB&Z
-4;'.m􀩶Xn:OuXµ)@IXNlAG1ٟP^wwxi[a6-kK!@],oظ<5:bѸpzb40nhHk3.n|^^gAU_^q慺m\rZZuzKebeLSM5~Z|fj܇%{(Ipy|Edv&ȡ#qpNB4jHz7RiKǫt^?Sj``}{7o+ vp4dYմHFc7MOW>bMˑ=k*`&"eaƍ;[~#'@ne*'p<O]}8j9dF?0Dh_Pa\iMn^oJ혥6;=ftfA1d~SU}RT她i~|?=BPs'9Bi{m`t!GQxTQʧ%j8.c}.*V
-	6u!iBO_H-!($&b]Ȥ8Hdx^iȥ!6qI.q]ZE>M}P8A (dl]gç$q{"Ve(%I@ka'~j:?<h%=kiZ#8{0b2i6^̄py37^u=
-O)-ӭG~=v(VUlE5tH<ZHSiwyme]f|xcW!cTxTR^{.jy)We#V/@Q-Vvs0"˄lTpoKb{'|q9E̳IfF%mRśuf:l}D/mGUiM.j&ӣnkr F'AN%bM5/sx#'Q~B|iz3#kb(#&AxІuԗ	ڳI!G;/-Ct:/HBjKFn%h5j1*qbq%Y@FQ7dErNz.GK{~m(CdWzskMMSds<fټ>vc^3XCY:ASVh`T: 䣼_8ƹj5~9Ǟ֤Γ7%9@A</kk+xc)PnȠ~Q8߭iڵua?yC(z.lH1ggQF]=t+Μ|*sK2QXͦ.8adׄb C\K7
-$BۯĜ8͒ Ng6@eIonjR6芢OӔŒ{}ͼ[sfl|SpMb$YQ&&^XB0S5ՃulB`y64@>!jvt|c2. ~UߺIYn޿SIylujmUkF7p-PθN`\kHXcQ+q^%!R05wCԼ+EZvmD(]--/z|eǘz/I=cp8d\*(#72YoD׎..n><|h*#ښ?
-?3z09E%_9/U,BZ,8E-b˔:Oʤr&(>j|oyK|\^~E'ҍ̛z:*]c"xlzn]XQ$+5$1_Q1ZRA}]{Yw@5nqkz%G\x K1ƭi1qw2)]~X.kOpsœHhŝ5}-s'j*<'wr|1xHodO؃t*Y7ж7Up/S ;v[.t:Sl2^6^
-E2e/r ,]"a,6O1Jr4Bh,;eO`@֖m݂mon|x훮ޮn6 g|ma0KV8>s-˱_]poiɊH'	锘!޺~OG?/rbۇ},0&u\6=FJ4<FMޠlRDc[t*0ځYS	H^y^Q8s#PnQZHei~ܮOefӅ甿q=
-1q||aoV_rt+<	Vż}j\	Utu.Ids,'zK6N܎{o7j~eǊw#f7#pc*`N6dp^ZߢP%8o[C&tꓱcCNĝT\'Q(]罘>dӬNE</,,KFSUfBr1VŲwIpv&egѼ,c'F.G,(62@5Ė	-6e4BfF;}S/F
-7/nmzȬ\BZ q\&>	 ÑOꠉ6v+BUtt'P*+]էp_]ۓ$1WŢ>l
-sZ&M|G1iAJo%,Z»br(DpWʏhLj-Ӹx4,Yl\ ;W<fE/#JSaUJdUi9l9+nL`M2f4\D;lLي0v2iwV{wxf[A<F 9&L
-0G2Hһ{ٴ[qxz1xZGƤpښ=T*,g+6x"Buy^`)&<qt퀜J ?B@î@ *gߜqbMOUm4;1 h:!'ۂw]5n=:}+0
-6	cprM~M&Bכ˕Wxch%dnm]Üe~sX>IfhO7I
+ضсQʂpj۰^_Q{\6 nMV)*ǹ9r!Ֆ_UVZP젙"eKrU4grC"{}ȋ BWC?PK    S]̲_6       pagekite/httpd.py}ksFwR cloj"zK[Yҕur$A Să|{j7&ӳѺGP,Yxao F(.Q"_^<nìڀi.p8],EXY!Qƫ"wSe%&"JVu|t08 \M8>.h?Cx}rCxI^M.βp\p> YUdb;C-tlqiqdxHWb$"'Q^d%AnXh	df-ĢEHxwQ4R.L,jGcq$E `J>'b@~4Zs
+~Gg7oJ$ubtڀC+
+SWD !y.c1
+*#
+!>]?x?M|???'([SoCG IXo.C><\\~>=l8x~vz1	q	S,lM"g1nCq^W)Z>
+i2nBCGh*ٛrwk7KV4m"zC/M<辷Ho\<߄R#**̋q*hԃYZZsWiJԏ,TqDa^n~g0wP@
+p|~vw-YmᏯx0"Z"{m	A8̋Eqʿ
+GTfei+uU׃|Ti~:~ŋpDѩYLd{wQ0ab8I9@h,׆p*`220AE8],@@r?Ts(WT6ЋU
+l=gL"!+jPiADW*ag4)CXBI8{
+m,4Q|D3 ෡7wa[^3/Z<+r?N\?C qbỦ;1,2 C36WNAyտކז x~s`>y"	4?Es\"4XiQPmX#4tDsB0HW"B+Zaa̧x&!ے(,cEd1dS)d%&N~
+SkHAeq\"xiP7
+ J߫$rp%QaL&L|!Usg@R``{:^kљ AM^X(VijH	n5t=mWx̳@sn |qQR8wݖ$ ,[="!A)"g2{%Ԩ&+ۿp녭Bňza29n1sqKFD¿|c@j*^) A^4v<_\RX>0<n,/Frb8J/\3MCPG'9A)W7k	^x%ps8Qf3JRh-ncC't@E90+nPK@t/qCf#L#>:8/ܯ?bQșЇu*@Y!oLᾭmm ' izZЛ?m0+Ў.Tp4	+	PJH;mQ1+ڝK&PR?/BL[M7-$. +y0(hCVk3F:WoIy<)Tz8kDٽnQăr5Q*/Uq cI*bޮ#vm&J+ 4b8+,iW7pOQr*ɓ+Π?eböݗ4tR]6[urf.AKNWSqs cU.Tͬ^5IÝ.x|Vv[F~wU6'"rm% +>4j SK	j% ѧW̯5P+E@!luľβևY`)^S$ʒ`Pw+XD_&KtL%)!SL"2łG ۆ\%}o$]uĶ*}; wAYUah"=FTqd-$e1aj#л`nV{.+vʮ~O&=5?p3verA2n3srl^URQhUW0nW\=y>FdMVjqLoKX
+PYwpI0[B,.`/=\jFk0<{_
+os N<L A^<,WZ<gy<-ҷfU(,|S)|㉯5<4EI<?lnm<	x&Ee9*/_2~-Npoﵰj7b7 aCfkJ5m{,l VLzD) }@ۜFlG7,	jOߞ^^\zӋ_j1_ATh+kM*?kV(튭wNAY:JWP]mчv@zfK6|,g6 c~D~pH\јα0=F.~z- -踽}yY{}/q%zy3JXOg&Ť"brq9ߥk,ZG/UR̀J̛(S4J1f>z.(J`gz[#֑ +* ϣPY}XoRRY,L4´i{,&$23Kߪjzk&U4-d9a{|i`.WlYuWHqṲgr2-Tז[yR|%2?T5P}K".рN.1_tɣtZeE* Ie3;st:-U=P)aw
+\*ᾋή-GSKҗ "_CsK^3}\!(kgU49&
+R%?<,HEXt"*\>_hfE˛à e3-175ڈf0 x|l&Q I,7ʌ'Y8olv$$G-Tj}67JdcUfӧ۹M@۷|oU{{[D=z=wKM[MF->MSPaћ3i|27zciu3}A#p]@B|釁xmP[hGjo+z퍲75p1Z'];qY{$Le(Vf>_-hsb5`_#*e	<vLܠ&5da?ɷtF6:ՔNl@wOt9fC".CivA6%Q+F8W}gO^F6Ig8 [6sՌU+c_H\{E1y?5jCI_]w4<.-6(2?![k9R=@۹6x?y]V/P$st(| "׈eĲ;|qXЅE₧8t/qCsq<N 6͝yg]\[M,|(c!6繍irAP}8xt}ca8xOAI+3{xk*k *n.OY+t,ҩ=J4%F
+lcjfkh\>aܚ	[:5upfżOql(ŰkS.*3Ruf8lv@٢NBgCgiJE/0zV Ơ&7z6pGqsQK<Yw@?"܅Z^=K"Jzjq{*(5Φn,dXѕ}(-ni eB+]A2NZ81Xq\)7A|uUeD_љ/&{*F$'gANƮ:!%heI݁7:rCkanUA50p≢B'$Jfù ?ʪ*Y5YWch:iTZ
+u:_?(mC匤3Ҧd坺qMtmRSC:Rvq:V=#=r#f )9K俁jeF4Ynskf(hf]G_WauvHC*:% .I6|jTyzm\fmMVe[ʴflrteG>_zti@Q`Ռ*-tv")5;T]شE	PHzSMg˸ßļe139R3F鱨AI2IO.>_v	jiW7[z2W/:ݬllKO(K9L@!$fɅĝ.u*}88\X(Ȯ0G4IHWpᬕuO/.NM@T7tOg9F-L}eL,!(Ԡm4 ȍu%RKS#`BBlS \Km#GT+|my^\79^-{\rŵ<\kжWh$bY(18<tr+gVv.-FXhH
+4k:W׆QQAp8;[Y@%+p Հ^x^2_:=;ϯmK\j4r{}K2Ȃݡ8eu.<ȟsqC7/}dl)h%҇[6moF\j6*j30ev=ԨN\q7~rYf^:UQd$VQZ]ql YV\lҡ?l-^Q:8??=gK|"+ߵV=M[yt(DLs A80`-OL_0Sƨ&hr<*}jC\	)x/	z_ z-vzqE22XNP~铰 ^7F+sO;pC@^OV1ISum\ӳ/p7kٓAkMzxgHmS[e-fq}G(V-q)2"X{/Vq5-d.vkQO.
+`Y[y`l-ǭo4顷$HՃӓ%-bvcRA|h=/mnm8-zW8+F̱fQl$ƺulNqƃ׬]	-ܩuER"ZIJ=D^6۲zWoNO[ׂLm-_knJBQ<juߢqΠo(109xwT>+etx"EJ %.Ozx
+$UUdY%_Xc-Iq*e62w5j{E/|떖js;avOQ:SQy |+^nopOJymoR Wݝkŉ7.hy<(ht3Z *Q@^Ъa\Ďn\Hh\s.~i,"f,uEve}kOdkmr;v8|Vhp;YC4\xff՜zvojJd!M;W;Dv<ڹ򡆺I&Ől {62:wCB[Ԣ-L$M)O	zM0+oG'_ǊTKNk?ESmJym,Jrt
+(RZuآ{ dY+5k$4#dTBVB5t-"]\.ԧf[K"pԪ('\$$޵$g&)z4M~[?OM¡9wKs9!(rT`k$K19+Ekta|kk\i쉿vwwj*h);mAC$UPLc)Cϒny7dP5D!̒1(@olʑ=f߂79C?b}.;% ̏'4Wӥ-QB+8UF,֔B֜<OZ[^`Ae' ZLVy5ϫvv7cuG|)fcmw$#vx]a&ϑC^3aO^c̑Tgq @X	vʖ\mSm'Mnì8[N*PȠ1GSM#lXXvTnxC
+ug
+2`/ӿ-QX;'axҪ>"ͤCg
+XR0Bv[U 흑"}pgiZL0FސO-<V5YY(GPl(T|_-jrX[azsiE<]4<ȼ18*?衬l>{8όRkidjfo	Nas$T2
+f%jl V5vȣ%ERo&*)(.Ԟk;ɖjC.6bG:YiE4-KeTKi~*RkUOg 
+XC*>=JJ<!:aPsskr<Tp?ٻ	å6)}.1x
+J ]a쑽:Lk9xJԑ4UV_[6̛45-*iOU!iMI.d@5ۺ
+ibc/!0Hf8vp%9V{q1*^A>#g%:" vIlc@jbD;*)"~-_m㓍MHo+#L_ZR}`Gֽt9N4P{ \^`?TxOL}$E2Lk"~;/Nt8(^m'=V{j|av =w-:Y1Gd*9ؿe C4!6?L^E*-VRCyXSeJ]J\VajɁq1{+lP*ny߶իlCRy[Lxl7=,:ڕ>A<Z-jΙ49
+94UN=uFU{v\sCi	kH%S
+oΤīE-b]+wS7!WԼņgoDRVǞW
+f޶9IZ&0vMdtơo""fά='I`74VOjVy+$CGRÔm$`=sP5)Q>ٮƳJ/Ķ.sfBU ȖХxzKTF}y4	*oP,p5IԬni-pQf.W3JW
+~˺r7YTPu`JK5Lk\b5)mlg5NgW/بa:jZEő̷pT5k!|HS'g/:ql(ZU<j:#hˢj{kdtQ3uMz q/$!
+P!ߢ3Zv6O4XZ8Lʃ k)$#l;ED!٭Ȩ<UpE%[ET1<2ݩlde0)*UQt!jڰV %@6u[q56βEG/8c)?{NA	; tUj{lU	P.ki$uR0c<rZKd?)JdRX3HHڸcr˔l8WGﺗ	\0ڪо08 o3<b>øߎ4d4SWn$q/X%c{uF2cC/ٱXzg".a$%W;S;ѝ2NxwE|/u^*])^,/CHqT?ֆ+PixC\Sjrm4x/n\_f.(׻8
+p>Gͬ?ɭa?N!%hTYX#|EouPr@m&Q~dVB7MPK D7g'ǈdiQ,//7|CɘCZ\q]e(Y
+3_Q@)ٞ|KD(tC3T2>q	}p)P&T`SmaE CuC}שOv4PykN9dTnkKڀ4>7Pm~߈6	3zc
++icFl4jpCR_D#P֕8ɖ.H3jR&?|0>Pj?R"4/JR6S'dIIsЪKE})_&i\ã;_VTH9v];lLP}(g+Ahz#+EV.z*oBZ{lT%*ʗP&#G vd]^#%&̒0wx_[΍G7W\өbOWIPɲ);sPlv7DTGh=d$B*=eu斏ջl$VlJnLSy` Cz4_--z3*Ep#Q;ƄDcϺʨ4rDnY.SyIRbF@i,:si
+M;D}E:K:FSƕ	%h:YGHWV޻GEBN1f
+UW<~RN~o?1\]i7R@>iuߧyުvw&غm~Ayg`\Aԅ'*J	SUBGkx=Sw%
+w2=}6O{phF҈3x[Yofow~ƒE5
+5g
+ea}nwwaBN sەt텶ۊ,g=!&v3+.]Ml$Z椻9A~a%/x`_z	a}<m7~7ߟv9ܰ[G[!K]MGnIwodtA΢~tqTJBwUU+Bɹ@2
+>kzEK֌mm3̷}01
+?iZ`g!Uszz5мKqmQ=(*صxXdk\_?X[1w'+Vl[{mY#=1սão6c:h^u&
+;QkmЙL7*N]_shqŰuwJ[?3x:sM947DD3?e=ߕvkaYTI0${lW̘E}23
+Dgjn6.Br(PDϯhFUR[Z)-fo,5bOucS+@: v9}VC'Ըȍ8,Ҵ\)oΙe[lsBԃFuo7S'3!-Z9m!+S R8<iBdp"]l,R^i#!UM~QJ=t@_5uնc U|62V]<<6*}4WpU)F2%Ә[|ڟnCNR!X׍	>ˍ$qCG\qDU$aLtaz=`p>IgF{RU
+W%)v&):U2vQb.ʙgMti9kbAmIꝇH%UE`jC#he]tPBTCT7j3
+߈6!.k/baD[Cgoz&5;bO_ ¥,o8g*f /4NMé8@Ʊ]=(`wY4)x.JhOSKҚM(=7;թ5O'GUYB-ѡ<Z]l@S!@"gЫՀNmE>[ UaT xP>XWV!=k&nV?d]|׿.@װ?Q[l%OfOm=w qת%5M#4Bɺ&SX3¸pk0xQ)'{T?3=b7x&NCBOn}nWCZUub{Vȇ&<)J'FPSHª1PkQyUD/zWCt
+qDNǆ\=ZW/'!BuJ!s:kSehϫP̇1%1~>DTJFȺv4>Al?]eqP6hOQqXӸn>FUTdh_s~ޕ7yoD5,hjTjB 49_En;RȺ-hyo^ i߈+a݃mBźhcr \ɼcHVU׃*u^}_st-Bd(;=ӷ^ߛ4-8ҕ=9	6#G8~feH ^lԄQIJG&Cc#,~K^QTSեNUM$=Ek%gUxWdnoݵv*4tco"w ~;S	Ώ.rRyS;OpQáz6  HƐ$F['H;1TK7*DvcY$[I\sKGl/V$VŜY2j%hpww++6UoZ]ڒ@'0536J`t[Og9:(b$h/>sįg=	mhY9 bo1a:Z=q;;>}k@^ǔP,<V0[w_Z
+g sC_$<nշ%M5|wL--ս(O/h/Y	LL`pHoex<~]>Mvh8I
+:IRLk,cX:^+Y@S>#T{ꅣTէQrPd㿪DWijE仑͑ɒ9LjO
+%ˍ*WvXd5ϭ-wBo󁃃 SK<R-"Y&ZϠLky>厇\9Q1ӹs.Nᳩ$MxOҔ\L
+ZCoak>pSB([N\e#UdX$Ê9:&+{ws_?L{ VF姡SF%Iײm(x UFdo#q&(X*bnmڒԊ招^jH.sɟlIUr$vM겦ӚѨ)̨	mxՍS
+^BWUឬiHZZյ8W3r@Yҁ8<jDVaJ}Տp|}yuJcYKc*TQ,?֝oe1ZXMG9bWziٳ?8-O8{djX/M#꓃*՚-1II5sdLvS-:Hb▮o$8XyGME|Q0#C?N]b2YdL|N>qhF!hT[,jL`,m!WԮ8V!I?Tg>F)^N")5ZwqKǝ7^|8895T>Ri`2D\)_#e7`iwAT (
+Cn3rȹgCxt*Q錮o1X8_FYؖW{ɑ	XpZW3}n@Xڦ,G%лa < FQlcf8V~ y<fԈqm1B+C.Ct~IS7kxkƫe>6#Uƪjeah|Uz,K󌆬ث=>D<h_rnQ@>ܳ|R;Zk.SE;X1]\9M|ŴmjA D\z[ww08<aO'w^l 7-,/7?,WY**XIC\jwsx8vW9y&4XDCC	ot{W2qAtu3v8);Ó%ػ\G>i۩ӻɋLSQ6jCsvauKT6{2Ѽ$B":gt(Ӑ=v);큿Qc5ՕO3!_Ov;tT[~]6viS-'VIi+({Z	Dv.{MvoYo÷~\^0J0wB)6ǍΥS*.2]G"·sE@GN
+>LZ<`q+Z<kkS"Z|󨩺Uh9S;$&UB!Uj8R'<')D:ķ(cy=`z1vJj|\;{{J/ELRV8KS3g0
+PJ/)R}Y^57SPrr|Ǿ&:RoEzUFmz@q<+RVk,7*}WX*!CjQķZ86x?͹IPK    S]CTM      pagekite/pk.pym{F(]_6Ep%:Y҈R2YE10 hIo; JJL,ꫯ6.nRn
+\Tȋ&ɢT,,O6etN|eߥb'ٍ(y4"$rQ.4Q&[|J㲷41/jUH˼D4)tUcVl|I$/hf
+KmC?GÓPgF<Ic2* {;;[{;{;]B8*J?O+{"f?"K*
+1(C-⼈cQ.*xWbe0dI s*Ef^|wr)|.l5Ii<PЍ19oTKZM@BKԁ>lQe#7Dz#C]$M2Ū竴+ǣ'?O.~3nsxR `Ne#t|tvp4pz.8<?;{B "buNTO0%,K:/ЯHL.9P&T0xEW]Q@>e{wzyq2r[ZjڐLy=×"j9owXNSVE&^JU<?*$u-`-ldʸ JUGH>?>Myv]$*ߪ_ӛDިmHUcq9*_nxY#*3,ЕeQdA4R=oqJ],`gB)p>+~ͯXY4*^,߷E`yYDxM?DN[i hbi
+ze?zΰNBm\a`lY'cDgLk-=*qYط;(Y
+ƋpYbπ]g_^^װw@GSvU,	N,8=8n??o~tؿU?WH/y"L2-t_d4]%XyUe6N2* ɕYR|f_L?SW7zƵ`{&i%V ?fNFݚYU2]ƌ*-">#ƉwmmtYΒ_c'Pc`ɬuI	+ }\m&-ȊeDUZQ[h܍4F[d5XѪe.?&̯-6/|dhUȫ\~QHѝ*֭r7єIo@2l2aIFxU-x7,<x2"*QӺ(iWr/<%xl?@l	)hdTd0c CS/Ukj<U^Dc${YxdE%_y?/NoWMoaMu3ٚ9;:0)S>_g4E6?-̍ף`}K /ug&T?$`^c1\_~=d39[YXJK#ޥit3{'V].M
+Z%x0/Q1ԏtr,i"^`bxH9Z#y Yy^
+\+y/	{]YzEaJy ݡrĥIH+E2wYPbt0"*X>g(z ?> A\wXy"h殈lDOZ4cdJuGcKP
+F*G?Av,Pht\mRQCeAΓ0kx4y&˶L.?-_l/޾}Mt?aףGb鰬G`fXX+^ɑE@q.u6prjG#!DG7:CU{R= *IGAЕ8d|IN)6^穳,|,z[
+ZkӶBuT_h)Viў#i˗zRE1> U,P8~G>gNvEZ ˿THЧ
+]^|#i)gsTEU٥?"E\>͐	LP)am	Zh 8`s(tE\Qȕk	*@ZJ,Hőz,9ռ<$iROD~Ve\ZV\X$1LrUW
+2,-hp% 5+psBOjQ; i3tOcxv"T2jd^\pn,l`<:>.ǯ̽VIu>V
++IEM)	EA2VmUawN@HL"9:55骼M	WE4pVS5CHaI~:~}eI$&@;AS
+Tic/xPѡد<p-){W  t*M\iSxrVJXkc~kcҫjn?Jq44{ԛ
+jچ3B/}=^ {sJ[}PZx˓N? ;oj9܀_QIj YG͒h?zsWLpX6&6"4A!J,U6A>_NqBnhy*,VeP	r088;%
+w!kqݺڽh`MKG<>DeuͰ@#MxAl)bJg?'Qlg8 i(^k\V+V]AdQlOr8Y[>}uwP4?`SM2c뎴5^(l! ATKTi΁(4wܑP /`/a_Ds<Z'HeK]+Xڡ߰1\}lB_N(q熺:жBoGQ=2dbW?SpzW Հ6g6h%*|{s	Z-Xغ7{k/Z?ޏ*VA{ 5"U2Co$cNC}78$!54@3:nW|ݱ66P]p{.G|4е׍MdMHO^ޟ/uas VեZ*(NˀD U;C!cЛY%@6Ϋ>yq|z0hmP	W|0Җ;GϝB3\F@Z[G'L_3-ny~G1y;
+$qwD>D%d&dzg/_^?Oφ'@^ߎ]t4<j몠-ö"8@]M,ZS3yrPF	o4&|D%\kU"Os.<!P Prϒ<vAaC)!e1c\gB&$_laFZJoZMOT5LoLv[2(lC=7ǃ]V4..vyYH*Yۿ8a8=4ARvQ=(_H}Z5JPϲq0iTbD:?h$LOLU1D+tu'є_i<Y4@@nj	s `LUŌ 2J+=pʛ =_'FnQhy@aZ	:3x[v6OgH;sܘ|^7aQCkry6{z!yěi?ƣC|hWlI}JX)kUV}
+cyjUd	&M8=|JYhm,PGmh!&YRVϊgmUH_iŠ?G%D5KX!&
+$9=!l>Zp`亠.,0VA"&ZeroW$7|\!\5+Rw"o7iA~BdUَɖ6&acBBX;M_%E@X,eX4@~|{tL8 ^kNMA(g70_P hwUu]|C[Q{eU'W>z";T*#Ѽ-檅`8WڹF]wkƏ5?+9a^=v#5%Mm@Mw{?/l	k)kŷr%m;41I(՛:h̊2"Ho#`!i[-ȝ<m:R	d >A$&劎'竔nNdhĔH6ԧoxtŒvzY0ZyCzYRWG@,Q"|iG˭J\㮡|8ϖczBQ
+s}M)ȝ;B|ը:46$eܨ=%̲CI,Ɍd^5l=HӥJTM$~J
++Y@cA3@AAi"2n~8-i:>08Dbގ·'RgP;_vQ@9z%,,-en<L}RǏ-ΝSugRjǁuhY=2h)P%V zx4U@vt8R$IpkiN }7-WQahG&DSt?+|{^3zLmw	Lh$D6ՇW3cdߠ?3{2eKlr_x*ד@qt%<`="Y SV;"<<uPEXnA^B.C"wiwcQ ؤm2?$#lTV
+NrtZ"O8 5#1(50p49epla0hkk^Uy*۳Ao=XZg>QǙl2j<rl|-'k l!ĐHǐ<[\عPT`@WLeR@IjAK3B<PCW\]Z]WHgͤEM\ϵef`"VC<ƶ:.ŀֲfi B7Axd(6Uh!nE#
+dS֝@e{H0668+nXFEp,#brM'Rj##K49Í)\Q$G >>=l򂤝v3TV>◩#3=*("ɪD
+E}@ä޻>o&`L
+ػL9J /z%Z,]d;u!'͚[Ks톷:ᗩb'W;~˴T20%}tϞD3M?Qd ùsTY\hZ[m#]E YF讗,K7/pMrcq5tEO60P&zĝwڻ\JF6ͶZ'\\3l4qo:YTrwز1*z83O_3#^wI:{k<uՔYhXG}NS@s8r8m?g)Q^^88R:Y,-Ϣd9&WڋCjб+cua*!J)-Ʉl堲ttE>k \8H|c+p/A}nl`>K=PtWa
+DGx<F5~ zï:vδVm6iYIu_3Bڕ(Gǳrղ׳MamfIRƸFk2zaM+"'Р@SgG$](w_gV:̇]l3AlZy= ({)F/\W2[KI^۬!aY[[$iL+>
+ɄϸH|)3d<Y(J=c, ku~S1Q,9:L9e3ڏ kk|-߫~ddJzGqU<@gl.]r|4b,K#^}PHn̒zdK\??s/UG(6pG!$S@)e~IL*?F-Sh5?4`6LNDp><=[X0mK[[i\HSe7|KsIHd9As6nYPck&pTg^/~	f.ՄAjk"@U%$j55>Q֦>L{e
+P|ivK;>E),P1$4);>	g؎8W=Aa!C}9wmNȗOSQ[Yu:wǮ>į2U:G|4Zrc[̎g:&SO-q~=AW56lȐ
+OyY	/;]x8$a麼vo*冣T-Kڐ+jg@}PiĩdVJs>)+LL+1Lk%.sQ:FCsZy$-ܺ"yǌI'=?<wr.ZdT#i^Iv҂V@{1^r(G%&k\ѴIYT$V|djSt'sZhavwLԟ%h:G½K
+Yoy}7ǌ4QT,,A>֏O'ia3QkhU:z}EAlT> JtO
+tih>E/š~NgLq0Hnn#}ړi'V1"ӞfQw	T͇	=3\z̧y?l$CNCyae-OU壟ȝƧO{ca\&#IZ,Ŧ,.F$\Hҕ{~tp7 )P/vJFukt:W!xX,E}tCT렺WiGWۺxS<:	]M >%ԮgZ(Y7f7I5XzSeb4o3Kb.zwɥ!REs2I~Qw*c<:@70k$fSק.BH?w~.kyJ`CĄc<`o-XYםQSEU?q=˚[93Yn}/*4Y^ٯcs˒V/C8K߾;5i8B]s㋈-{{}M4m5Mİ 	d@n:[iѺ8~5pME|/JSGǵC@a:tPJ#_:O7ǘ
+wdzYɴkρɚ91l/SDjՓb:8'ހ.3k`s8N6qJnWx<yS:oqb.RL]s>kEJXHG-+M$₭}:K?Ա.b.--Ƿ*Vqҏ~OSkLz//aF_Hi/k>ME;hYГٚ)Sh$ Fo#CЗe[g]8t*:1ro5qthl!RZɋ6ٽ@2[ 3F[P**)յuL!!\*DѰ̌	DkGcsI8R6qYm,7A=ICJ̀h!)\|Gcvme/=6IM("]kO0]TÖ&Gg.ZֵO׭3ܘP2wju6UԁmM`"mTFUSs0E_QR!qϱC?aTxM/ۿ
+OȥqA2ُ:4RQ׋aD~8yۣ>k\'<,R/HЋNeFRe*w.(cGtK1zIHwOL׬.zibRRf>,d;g2!z1\hxr8@?]Gox,I}qiH0̆	RعYP.`@2A=f˾0<:IDnz|ge(J#iThnk~wM4p-m~̙?YIj3Ro[ihû+S$eƘWÅ?nwgPGNb1Κ]*q{2UΗ]i|Sn}$:D9M揬XkG~ikӑ[w9{q#v#g傣:pg6	ǋy.BzT6JeW##;V\6ÕJtcr,=!b3J|Qt){5TCBOh
+^kE;?Q$cJM]dZFT3gpA*(5R38ﾻeztOGWWZ!6VNԭ]`O
+H]ٕX4Bv v 	SV:<WKe$<R
+1xJcmrL&$`UJ$^얣Y乣In2q))Lǣ@
+6T$[O}O"m~e#ej͹b&yv yYNY2Kv.ފr>*%vS.Wh1=cCm#yp}A$Ճ!M'/	\ARӲLCR%`ɼ\-+L-	⨪kt6Krv>{|.=[ 1R P^\ddE}5l=[i@۽A4ZLfTX%v:VG3wlFVhԢHOl4[fU=iN6#'	CBkUΎze%}?.+:iROZKdỦ=?-}X3ڨY1Z-vķë狤 	w́lRZKO,;5_b)h$yOpSbƕi{S<2$XY7b6lYit4on19V3rv,nzo/z')M\ݤc,A`#(:|	6kXHC3$xNUcJ{QedKl"Z"cEi!_w@4kě1 fG:Z*`Ju{3X.`ZTit-_Cs#=`N(kD[d@`[,ɲR߳>}#tL=wdل.AWKm
+f)Ӡ(A[6eeǃ޸zU	!KSMk˵~_\yG*y*	3/CaY;O	WMvsOWPL<)CD,v:#JUƕǫȓ>xw0]bs㝹42YSEoS8~\("I͝esTcTB#E"rH_Ѱ8<u
+I4VȣcVt|@ϧz2K#Ԑݥ~tJu3$dʢoBY(9nH^8a|Z$	baFUY;Ѩ.1EjX&^4ڧqg[]r0LC
+
+tK<})(%+NRM}>M6S豍ؑă"lt7k#HR.b6~ӿִvCݐ	]Q7kynC qö&P)fT*_,_S%ZCpn;D(Lc~ffOljK/[EUsx-X%\ڏʶs%ϊ BXD]͛60B[i5h!:̘2ʹ(3jfVKgBI~p(PԢ3$316ͬY_jG0=hƈɶ77={~Y{vEEgznXqMeT.ȡc;zu#QF`arpɁ|<nt[a*<P̼#9dS `	~!`#dYވ-KK!c>o|zX9x.իsPmG~3rB.1Q	cr?`5$/~~k=crWx^eA[N\Gw̫m5UzVnML6+'rLowGK*_M2!Մ}|dЋovԆ[^_4$*e)/ײ>}zkzc{٬	@=7mCsYJ9=sZm!kC3WO+=[CA<?Att%{gɚjᢿyfODSɾQ46c9F1X[&cNT)aRS׎U3)MtXiUsJ%[pCͭjy<-ǋ3qy KdUJ)}o],2^-b{=%?INܛ]7%HTygQVɸ,1fq50܏ЩvGaFm/XCu'}`|Y)/xW]t~4>^x" Rv'7KHعڽzѦD?k|[j猣莛T0>:qPqxtq>Աr+b]|+MG^ӒZt} mxtMdk9iT>oaÎ}k||XJVO0)AmՓؤ29 zaJhhq3?D$c3416<G;uA8c~)SBSd:aUBKX%G./ܳpغv%Ɣ胠qYȹIvku7-^_6N[tgZ'߇^Yׇ~-IEgQf*
+>6'5㒡7
+vUbZ~-}P(.P;ܖ++ឰ8n_e8܎t73a/2s_V+^j2ŭ<My+Y;@E
+◲a71 TXSٞ9Ik}9ȗP2hl`VЫ`kĩu[-tgc//P6q+!E#'?0,^"Japf41fFeB~i;ZǊqSAo9Uj%S/gQ;|67('&6zS$ /<`ְRF_ZPoj.if[#(w	"840~ڡZVozfEX  !,M6JU\$+3;M)q?͗4OfndN>vXXH(6*d!~(RaUZρYg㝗Q (Cz''9zmyDuMP>-PSC:o o(qXm@C;awOG'wZ&_g'8r;ۆ]hSgV&4z/צ6{Źu,fB;u3՞>Pq"}ig׻.lê'sbR1򎓃,!X=y8urXśmr ;Os$iph4txg9#.D^/I7F,JgN.?K@y٩GE>֦pPT5gVqCFo
+[QGv(\=^i2MVm$.N]A[i m.ׄKpxLnYƍN|*< fh٤3'R]mc5<(qpzr2<فDkDsZkUghUq<4d4@`Y= `vKrHn^ߟ[fdyfuJ@ǡ&0;J䌸IP(irƣY@E@2A̓""/@o٧<*sӕ␵ʐ0-h>w9977_H:RZw;kYҢvtSBYO^ۺ)^hFr࠵[o:ۻe
+Ô'yn0ݒڷuKRutxa4+ [D6j;ٚYqD:P:`5hk;mkzq2_rtLL3C;ΥkmKO3ӣ~0 u4e "?lhPm?/%%p `]p1
+Tpt=/ŭ0zcp(RhTV!udpOþRm( )y"Kq }Ǌɲ`˯8MI/f,Y{+0me)U;+h?aZq0a6)h#<% PFtM,A|'}51}/@d {+&awvx8ǄUX8sy<\h?;?8L]Aԗ7A2 XmT2U&;]RntTbUv-)˦wq#2nKs%a2]w<%N/͎MCGp#02v7RiJ2&f4T``X{W?Wjύ50 MOW}蟔c@]Sa`eǌ;^X%;ҡk 72}Q}!J-̙L>n;k\r>uҋl+ykPlB0~ҍy]R:Uɼj;ti^"ߝztNry(gds	i`MDG]&WWH_ʎY`QNO0[G4S(s O"~#8RrNL!0L
+0Fqd07y~"=.ǎS'1p6
+\ndfM}ߩd`rdl]ǧ$q{"VQ2Uגka'~j:4ht-gw²?38ܠA::>'LͽW]Sl{shׯ
+Ψ:_4P3IЌK_R	^sYK3<L_;dd}-R:w{F7)|ey'Hvd
+Dqb<[ ^ eFCjzG,#QۜW7t4x^T,/ilR5c:muh͸M(^?-棵=  88U<V_a<3^Web3%7h.g9=+4+VXkbHP4!5L&nVi!Ov_{vW$Ki.Zk6+*xPh6w^LiHJf,W#߬raU2=2A,"͎lyj?cBJ^t}Ҟ!˧]̬e})HtYۀ1*I#)+>$[G(O+NnnJ⡖j>wn;V֤SȀ0%lmNܴ?x
+ε$5M'k~t8tUBTΗtoum
+ q\*I;2W˓k0qǳBbaTT~-UR}qq<S MSrAK!g	Cǋ%y/>;.E9omnp/!tŜM$0h}o4 %û0`s=X bkRb4wk탓l1(Lm[s<>OJxVշ.rZAv$tߛ-XRUVQ][T<a:YrIWN_FH$1 "Y\*s0@YyW'ڑh+@&\E/:sh4ey:W3([n=;XzqeIb代!SZe[u(
+2/:\W|GVxc/s7_rVYmX>+9U|k@O1D}rD(<Ye:/UBZ,8E-b˔:˸r&<jM:9ڷ
+6(#7½zF9z^NMa`-*~CA8ovk/W ^G8kz%^sX;Bn;_(Mw
+\k5bDxZDsZ2l|78cIyl܀iW4A`*4iw2q.!xw&ӫ<U8ȋ%s}K6dX7SOR\/a<bgO`ݧ.ݞWu] P^gR?rq9_n,%qe%,FIEXN9<
+Lۈ$qT-9$>mah;[;n^Rma0KRw*ir,F(mv7v$Wwq%WחdFppt8<_rjǧ,{'u]&7ρM:7
+MܫJ 4Egk5XD7T1^ٷ^QT^g'~7uxE;P3rNq@]Qr10Xn ~V#4߳k`IxUE$e72$B*;n,+Ƿ%8H7'VQn7LK|?M-{+1nҸ ]{&qΛqϑZ^f1uM-Vx֛1v1I0!Mrl8/oQ7N{yQ^`Ԗ]AS5&զdvV/<B=!A}q
+Nc$13Uf+lS	NEsJAtK]ÍN)pE!M̤ИBݗKыs7c/yjx\z]vz4l\) ؓ}.@ E<X%nV4cqqNB@r}dJm:/aSh36nⶴZ4s>z$2q{)FqTLo犔-	b@qY>]]ZX>Y#l^B`|);99+勘_b5,'%5['2bvJSL
+]loSg˽0Y2s_@"?C,h)4yq-sc$EPkۻ߷GD`7{3CɃ!s$%o~6+rvw-\m<̪#Omy^[u:YlWX+^|gCL`_XzisoAΛ6
+^\:$C$H&g6]"Ʊ/!ܨaB5n=:}+0dh I}0""Tno> )rH[wrs6t'Q*%|Oצ_f FM]fc_m_MX/2E:W}2uz%N%s=}~|0<ǈj@f"2NjmHJҼQA|AguԊ0UNm|u|xӥc
+1:2,莿AŐ
+)KqpelϓMHן(h~W͒;j!J7^'y<ʤd!$MbVݫ(*aMht%Hh)|cGY(x;		<+#04;ϨԛZӏᅵ8D/bߠ<^@-Ӥΐ#['ŘV+9|^Gۑ XJaŨOSДfxɻ110]3M uqlF/Yy[E<~ɟh<ESt/:Ǉ]<M]\E5B)bvpB]s:'kjh΂Ot}̹z=׆a˶|f@y-+u2oO63Lqt`l)P^V7
+70wP>T%m0-mIVfXVEjw62%{C٬ud7/1pHSaxz&dX:}H6=?-iW}ͺo2eN~OF*}H.툖K쇼[e w7<~;1{ :sjZljmϞHCM4'`3GvciI@?) BR˒ˠ&wס`n[V}ƪK g[¼6v$:"A=ѥ5049kbMC8T(j JVw^5By
+մTiKl:P2|}a8RUU%/~M!R7v}4CiXk68{ba~bo-^d%o$)Kwǥ5;m,oT>o-ߥt~6k[!;Xy kplO?7  <yG` p"1P%/?K|wT2&2v1}(.Q^|y%Q,-QڿO|D\T\pN`'[TkU
+S]y1˜PZMk6Pᐂ_cs {_0g5(8:W=숿C?<t"V:%K.9/2P7x}Gjqee38>2
+zo4gv>#bC 
 
-V9uozs_Y\[ȬUZB]*.;Hw?S?GS	Jq跜cBqt]7_GXp6Y+F/t1$4³}m=Ob4!]m>7Am<SxPFkgfE[x(
-[b	lc7HZ7/v_UsG6}V~i|£M>(p,%`&zؤ GFTo7yahvVC{7/r͵&+$;uFzoP,hOhE0C@Ėh0$y1&ቢ~~/;Ͻދw:b^ۆ׽7h]S 7
-N'$	{">1|NHI53@gN匒\y?
-8ws
-g'd:B՝N`xJ_wF1zB굑r.Hcؾ{5%ĦE'>ؤmƶ 8,i~g]n͂tKk(I7:J+FFݟSqse2)9نMpP_Ux~`|Uqr4y-}p}GxuXΒ#\B5:/+Wߟג\={ʆlWMdGn#1gD?BۆG*	А4ہ`1P~q,{Uׯ_YH\J
-]e%xP6v8ƺf[@|6L4[	5Ax<rUOx(iduw^#oձ;X#z'Gs$#¯)RƮﱀf(v!KcgOl3,]BO,ہ3v%oۚ)N07?q2ʌ|kYr.tceH~fV nefQ?OX<Gnpww->@I,&BjqQD21{(kW)|7_+vw
->Hb9nW	WrO//u
-R$SU$y1ۊzaDvKC3y!"p% $ՈՠhFć&{paQ/dS9}%2:T*7zg>U7qw)z{
-"	?B0ͩC@Y`S&S(t8̰㺎tB$[)cx&;#b-GeQ|.MN`RIϘ[C5BN',t2QöʺKUV"6ww:@jrͷ^[jMNE (78)ܶ	nYpc Fs+)gy(F?모4A\BL[s-,ˉ[OСz3MD 54}TjM37;Ln@0(R?:lq ##9ys,mT\M`z'/Ԗ3rk,kZV<.xN0
-E6+y±h}4NZNʝմ2Rޮr.Рu!q>X~rgN-<`8NLVZYy ZL<L7oHJ9$-bӢZU(SvEr @d0*JW<!1"~U~45,lWo ?PVZ~aNcSKn]pŶ/j`-\T3r@wxyër8>"7O+na.d `U@""[[ɖv܍vo_x[xrIC-gۆj}BȤ)jJ_^+2&問
-^wT~g_pFӕbI[<@?P9hnЏ-+r_}Xno%!s@i(.։jiqa^7Rmu;kjj.4tv;- J,E{ac] mxTF?90aĤkJFFY(g2g:	:M#};SGr?d6ҳ'Y3әBH~qz)9mKEcszÅGdk:Wxη|F[䆡ơyF0|j"aQl'A<nL滫H+xΔן&Z_.UضP1H&/imG:9XubЎl[Mݸ׏Í	w\%V$1*1Oor-qrK+$,|9DYޮ8ַغ</Wg;:w޼Mt#&aĈ-(zmV8'P"/ɵ9(Md,п͉ՆC%YQ_palK^'5qU8`=2gw_G}:ho1S
-1Ơ$=	>ZTn^KfWHE	uS-ֹ^*ApL#>Yj6?cGAd-N\I˽uz{^]3IFln&7O!2\F?_\N&GzڳJ`z -f?'HJx+aVo(8NO$w~)*֏APYڪ-ݫ+VbÒy̻:)KvD$k[jjW۾Xq{LuӶfݬ:C|jmwiMmWHC[gov.4]#\? e5)c}zZ9#o$K*)`D1I(KkE-4mR*mM;YyL,'KUUF~h<ITK?;0zwt|=MbxŭɏxXX1IslNncq,{<:K,JR?F+::E	U$6\s@";9_)G@ͅA{	{40$S}I˿l G ͂6=Ak ^(?A/|)R*[QC(/Mр"_'z_Do-vߺP#/4xid{0Kst`gX<n;
-&*)hU *E$C|/L=%(2StzlɉPXg5I93EغIk,
-:'uŧXCD7lN͑_6w|~Eos?:,~>>+V%S8g| ]BAH&)		J]>UfO{aNU!-'|gI*-ʬ)yֶT=VOxx<pn5v=;©\-Ӥk6dk긒F-DH_ݺv$#sUv̡d5dn#oR<g.Fo87/vw_>qh]{fm"tawkM^\Dwjxx|1:>==+8GcoZTRQJ3Ub0|ޓγM^8Kݬ7O,̈|:za՜ڥE n蟊t̃neÁoB̳mYP6ܶ r_bXB|%I
-z2gu^x!
-3'\MĳO2o9ը
-9|U&?s0QT%jQv<3@J=J\gs|q Ubؑ%N>^ܹ&G1bׇ[udjuGS)ߤ*o7$t~U)?n԰(5=.iM1cM>?Иn1o6aP F$`WA[rj4Y*s8h7.` @`N/ΓpPry]EHGVV!;;*1K@ſP䁄B.!H/2"yESYpƓLi.~(o@ RMI\
-Z`elbJ"6<;4'VOz湷nN(ϏZvg?AI(=qn _Em7y>DU5fJYIy$2K-,p4(dR^Ƣp|lxgcN>A0=<~o*w3=[#lͱepp_s@QՂc?2Ǹ8EU4"V䩖||$̔}]W]'LGܷߟ X&ѷui5NFT	nZRSf-EsbYՒ%*š-P:.wOK5N}`kyl;?7ɖyaF]p0Lv`48` e3f
-1@FٮbAM
-Gƥ:ne4׻@A({!{νP#)@xbjtJaq&I8Ë((gV<~Q#X*gznI/Ûh	tE/Î
-w%=¸-i2缘ie;=tx3㤏)%B{pl[#e	ܖmqKD_ӅKX%K@0ɞjCz&%MH9~_/4qgkEG98Ժ}?;"0*usEB(Z8
-UЍYEWl4kNxT+d. DM]*-3rCE,UܹFGq<^#=BaQ ˄audM駨CY%@R~c2ukEMR@= *r8wG&xs4@YSq7ûS}eWfmmeH4sjIeX[Mm,\<,WI@髾LޮR4pP~6'0jQky*^n
-#oz&)+Ч&/L
-M@UAN}FptrD:NŋݹzM.hw|CVI(|CUh̯	#f|}0vVvy"i(_[ ,E!M
--˘]5d_K.O'q1%j93v݊vщ'2/TKKR^,}La639H}jl|DS7XD5"PH$a"-:d0b׏ʞ)/ Kٕ`l><gs4O!t1#vi[c.NxaۇbJ8Xgx@b'0jO *~k	oÓFu2(UmqOB1w覀YEӚ\@Kapf.jcm6t&Ozǵqrzru|,6N;etAavMRɯYUr8ՎnA![Gaiɏ<*ZJ}vA@5lP|Ъ<u{˥<W򪔩r>}ܫ
-4訶~VjH2vjɞ5ǩPi#[!-LQ]WT{jIn_?a[;LYzou,UķP˦y|naq8÷<A#ùqştN'D	?b0̼KB1A4ܷpKƙGLfʒb6Hidi;.k=)]t}hxOmhKFXtYI1l/)=ZH2V#CNwT82,ZZ4jyY-\[ݔ.<2P7pd[	ΉY	ԝay7j%5Ѫ)j ˳<%ĐFb ](`i˾H1RYwu,s6QޣFȌD$pZ61Kz>:w1<MJmIؾp{NW^%yk	bൢ_h{VƼRz7ߥtu$^LB6iIql& +@&G|#YњDǸJ쬯%A4䗥~Y/VcGm	gh`f!G1uS
-	<-q$$Ǚ b$H<Wre:,m\Im0e̚U5Fx䇓ӏ'M)u-l6>:qV&BcayL>d	QiA%'}9fwﯮk OZW͙?ffMb9[f)om QlzkBq*fQ䫛[4Esr*)#o<	~cаU4ӉHղ5"+tSVEeH[$4V<t4g2^fVkmR6|l^zQ뾮^n:D޷5"Qx,p.J?&L}k Fʑ\uvzMvAk	VI@|؞:2/Z7Q9cVtDs=7,yd'v(nDZV)oZ.,KwW]Fm6ٹiquT)&ӷϳҝ(ɧ@cLAY)Y9[=1WTSCob<O B+'P?u:|cFϱ.iN.ŏN(kmh$V oS;cTU<55֪OG_c=ąy&&9xL|-)rM?EQz8AYeo{c1JoX' Oa<+pT-njdBPA97ß&O$'q56=c&/P{rkthsq`1Zj
-jkߊաv\LMSE:M`GA$xV>kX3Z)F̈́'$>>Etu\]A%:o[h, MـwlGGXA"9(d/;>]h]1:)_H־_LbO0':>@^ע1. ѹI'AZ1H.,R9)PYyv9XR֑U@ZD=mM&(jA`H3-|F&@%3@vL~*eZZ(Rt!PGN(2\ulni"qR[X;{ԡAԬHaHKG2@;|,|}7A+dQ#15!XQ*Ft'^a3v'3ך`+5^+@8K֨JLasNqO\<Ѷ}/zn,yB3yy4YnE4x-c
-T5tŀc\:>dh,*l.jߥtFiH#%dFnaȂZ|Đ5t-!vx /rYsZ^έ{;=PlB*%(R[Ӏ*mZlXGwE
-&sĘg\Y&Ag77]M)o*nŊlH1RS VK7YJ3`k+@I ˰)qU]Z1AX:g{lmnlc= l[BaOu"\t,0\(TxZvSZUs
-{4ڷI}8Qx(,~sm*(hx1<n5_3>jvgtFSk0kaܯ2Zh"jVa1և6+W%zM(wP.NLnCzkRI7oGѿ+UA,Sp;Z^s6]eqsOQ!	"D5QQEόB)ƝYmq~1fyϧlSj}B{DL}s"Xv[WFΪ4|w-Uw1P&<U0}өJ757hlǀh.iJx$)+
-ɡRTS!-刉PXd	S :RBrՏ4%_hEfD/UiI ڢ qm_ý	77GΎcR(W\"n`?2; 7Y&ܯ\osT#YP	rO)]HA;=4CHfĸx1^-*9X=d˦w#0a`7$wW.] q&YQPZ:*`ȕ4|C:|DGHCU_mϻC-K[BАy7"Fƚ\kօp3)uAqRLHdJu81T6YN~N{IiGzx9',vUBr`xv}B~aEx_<RټLS_JQ|18+8cnqi+Tx.K~͊2CF'$[`.V:
-CSXIc5P	0_`Z) v-IdP	F;?^jɹƩtobDZ(4'N,4!9tЪ`]*3]!\Y,|%C9{
-eFTD	[߽0aGYݖ|^Q'h cN34,Bs*ަ2֒YP1iDu,@ChńM[WF ^iKMG+Wvj+=tl|(dDGޯ8j^ltU=տ! ey 1(<_zǥTYךa[g{EY>VQjq
-	mez$fXir8֐HOֲ=)Rzפ,:ʑ|>#4g[]]EsUe#)t-%F# 	G P
-t?6ϲ<~j&[V>Dű}z<pOW 47wTos _[uhnMP'5UW0:@9(xMk@<]R)F\؜ mEHXJ˘b:fRHshٟAvcU:Ro_X~\r7O$k~ꉕ]X\r}lkBW*qțt?iW~ax V+]OZR>֔|`ɬj
-@^.{Y)d5neDKͶJ%$1Mt,C\|c{,3o~6+`ح*_lf~S]oRTà3<^XM O8<͓bH?crS*st8F^ƹNqz6Txq<pzqyq"oKkR*5_*|?2i
-URȠ]*U۝?yu7%Iq,<˷sQg 1Tv?YGPܠA5h32x/= Ֆ^iMJeccމ,)	"}`rL@7+xCb]Kqnc&>mWfex%Z1	ܜ[1'2;mJ`D}ZB7<{1}	I	?X]ȑ"UȗV:{d]}?{;&Ar&bg,Am榜< dԩ5MAA;!3]Pt߰%Y: Ԅx)UG{JGZ)Kfy7|z8)jZfk[CohOo!>|4^ya*gt>_'J>)x-abԠ$0Iq4N5xnq_:tAc14_?mһ+߉ F#ְxz9\\^	5ܦkwjJrkZ<~-[h_֎Kr=W yxónYR +}`O}c*Welyy7KKtn=NIqWUnHRKS0 v@gŽSO،1Q9u	پH`28Ě-J0u1)ҠߛnsY+F&LW!L2eH&M"o Ѐ26|%ԭԉ|6^dPX~߾@X@ԵgZ׮G#f\~lw.ן|T10<F:86W>n4VUuGTs+]~qov{LQKNaԶdey/8m|u^<|;:;=>i$m蔂DGG3$a3g"xhީ!vBVH|R[ᆃԢDRRy񛋹'6pw-սx\Z%3)G"m!wPع{pdc+5;sElp2Vu6k}?%o:@**9@z2-3l>F.EhNp,"=dӬ'ȇM5vuA}:0KxD?~ͣTq穿'$ AɒeX2h-
-vܕA/~:98mJ=v+'i&M<~BWSYH$h
- 'I0fƛ~bc	jYrTC1aj;QАQˢIM,]|@ů:͵L#SPUbN½E|hnƲmDXʷ2=.<OoV_:v&@ƁȮs~ jׅ=a_Y
-GRpM?t"5=8bWJsф'Oi^_%h-c{|&oSVgCDS9W˛"&*TS~4󫖺NM7NT1pM7]-l*|\rWc=P~W wZ7~Ĕީ LohKWzLGG'?pt˫e}x}ժ+.d.ޟߟ/m#Ō7-7278W=xˉ-x,|{(lբl9ִ3un׌=<S{<@Gf l΅vCAXyaW3LZTj,Okqm!Vj5`T4&@nks[/+ԍF^LiQQGnb (n`GA< mC~g/耘!V
-IP: qf)=(%L*Qh{Sә#??ON/2.ʄ$\_b`3|Ѧ5OO⧳t!nv)#vϞc&h*<E5{rOW;Oʓ&&QT">OMf߸;N,%f=H+1GVDCvMܦVCH	O6 ;Yʊ\LUN2:#Y}G(RЋx6Kѳ9? mfX=OF{~^{wx>Td)Dvʈ,=@:
-=ߜZB5~fUqyNm3K
-%~H~퉾%=iUgt{JoI @$/rbZ*$^Bl*rc& grc9P@\Qk0
-a)Au弄PXnnѹq6_[G.ZjX^}o<Nslw2,Yg][r*Y[uY-д*f]j^dd
-ǁyq:}=DO4Rt	{x6=-¨5X}-255@g*Z*ɝSø]RtYdyP9@25E;4Y}X{l#ĭ?~}!jF>c㿺Ql"g*ljqG/M`ܮ}Sc.vW߿V4\gVxi*8.0WС.unLMiVjSMǎ}+u|iǱWjװ~#lmM5u)" ŵe$t꠹*g|Oq\3NUU&A~q\3+UӟW)]`ynvX"v9aU%ħ<]O||z8"Fv}T|4 |TwG#nN	ʘ`Sr6:ұ. ޴&MjLýs㹢[Q~Zd4^f(䟠?:1Mqy=
-<:iV5vuWwIuχl(#>0泭eV/reI\%
-吷[-nq2~uuNyC[C^tŗM'$ERSRߪ{JfE
-x;U4ta`̚QS̢YS#%i5( @9vWMCp#`bb3ͦ}>+W Ŕ$π_ExSi2OFNk.8&"Ag)XuC1v..$miFτcg9ƘZlx |gǼ쨀C@]iݩgLql鲘	c.ǒBewH࣠km\$3d.W:5NDa LOU<4xld`lĆ~Tap   IS/{rr3zXi}idsp6\7iYʹ"Z8w7ebCeUG&Kqm~G5T1{'Zeg,5R
-WVGڰb')Rz6}q`&7	؅-ҡscx̖uǶ^O*Β8xp0h=ņ Xp ݲoi;&a*#:%Zn*Ӗy(&4^UhwfBrĳ!U0E]Jz^wh/iY:kX&<! j Z!k{LY!&Jf3ӈ{`4<5jֳ5ۧ	6Q9hJ}ij̇2u9Wt%L SEA85ُNgOUU^x$ vیJlI_R_TG~czep&8_c7]wpxJUԗlq)rooƊ<,>(WNBĻXEhB+X7;OU!'[Or$;Hj)Cx@٨VNyn,P䍃z)Դ7;%	G$2ێda@)p(g	?sxkZp,
-%gmyH5\UiHAXe<)+d|/UL+;&FVR=P]GDNVW7ot,V'\Ze¿^c-BxI%u.Hh5(4M>WfREHၖuN
-g"\ۺxI,ZJe	V	R22;eFe8$d〤E(2nd]M ۀV)rU,eI>61,?$ޑgBG3n9R6AM=;BufU~kF4_)VGfá?	P9=u;iRI3zdUZy .9+zOz%@סzAkcݟ-*Z;|qm:EKiKzfƦb~tִh'%-?(`! ]	5np o:(ݴ-^*Gqw"f#n2vklk /:_m7w\Tmri|鏟tޟ4BUGw#ANn(?eoFXP1-nGEG_U&kO46f`ɤo@|o^P/EDkkXcJpZ^\ǙרP@wm6K`Ɍlo\1{$ˢN Tq3'2yȠݻˁ|hSyE<ECjn.^;rakU-֚+O$<"+ߡ/iHJN)@>IQnIB_cW(,%|^v3iek(Q_OB$7v<d]%&]Bu¬OWdc/[1	3ŋ[ɿ5Ldr2kW(×8X+rӆ2qkzZ_u*$u'y灾˶YL݀bfo%wHVY޾,tyBbJ 9EZGH)ȱ(%037~7pWNw}ōnZ9;m7{(;4:9e-(-4˾]<ВD7|ֺK8P/$ܕeϜ"":U\S-sa? 䳄}#cl48)&i|- 9K36ϲ;8KiK(tfߵT94*b#yPVuCMdN6Ќf}ߺGz0ʿ|fW~ΚpJsbDa+2uwʧ@wܩgVGN$\tjpb\W%[zˁe2X Pw}MgT~1]Y]	A$dU_WD{bal
-MO4%NBv,ש_wE3u%ad5xnzN$78laiwi! '˨y3Cf62#ʸگ#jqnf`7Cǩ#lw;\vu}c;@bsB?i*m=⇹^k_7x1d8=aW0"=v4Mt(D
-iMNŨ`Q	WkT1̛\{|{pyS7%0 qFdR0~(᭐tWau$+ʔζLv`~KN@&j5W$7rKEr0$KirC5)Ti=fp՝/Ύ<٣"cDho!;.lc2.KeL˵0{W\c^ڿM?(w\YZn-h3n * PchÏ#2)
-n|]F}8! C"j@gmOA.E#0TnkW-3S:D(4ږm))O^!H;!wJӇSKeSJO<_|WM'݆J3|7Nh^<\5;lQׇ\xg/W>gaAeYXOyynil.C1]Zʇ_pl0zvq5Jh$^ddIzh7^!w<[L9t14Yd=/ycś'`$xJnӮD]Xwvڄƞ:Aeq܀)S$il^!m듯$*Ht<Jk)fHk<Wt7PʲUKbJ)&:W7VQkVmm|!TKkI/3GQHj\Q>O< eBƶvM[%qO֐8F[4y p*F`=/۠!Nɤ3~lP˻|2ao]d"+Xdy$@V2ѧnr<Ɛ-UN/p6
-#iCO7sJl6hj0ܽ+}¬;>}-2s~$hDa}t?Lg#t.撸
-Q/aUģ8$'! '4M Z0h5D7e;_cd+/rF6gI3Al.{0P
-ȕR*ˈAࡔzkSkcFds9k҄zUT:¤΋.Q9B/ oP
-h/3G1$6Kdp~/![?AW*ԛܚ{VojA(V\(L&cR!u"J$*}{*U'pxS:
-=CD S=bz'm9LzF97_~@ wjǬܚ3fJC 7AZ$n~cݺ6ЌFG-Ṏ(on}zxdZ ²-aF0n?0au8@#(4ft#ĭ`ё*DX{e77֔$P(vixp
-<fe>ዤzEdmrWm="p|ȖCf5ҼAU~E-!cO7:_	#t$<[XXξ#;8~'. #'7ҝɑeD5PQKp%B6DF1Vi(Y:I$d슣6?t9^ q.RBe*Z-L90i#G$N0vZ,("H2e"4l3zPK7AЗklxkVX"vm#mٸcۿޭ?JLXs09v`@DP<JHNThpb~	TiF<
-;IU jåߥ`346yΌE)Qu30xٲlziM4Ok2jUeOG`xdT[7jOy5DͮS)(ר~?% \tA>a N9fP+XGBvHqBGsjXV{P5M"bnSUP.5=5c%8cbDF`<Ԣ+D9  _MlSb'#"n1֖*iXنlk݊440e5s<Bm)(ޥrz
-sb<!犸}Cp1mU}VvYιrf#\AxFƎDP_I7"L/ָqd\XFt?zIzE[9/F%"jU=@C,BzZ;?QI$֠VҮ焰DG2s!k"J=j"h1gS#+DqJf 4ž e	ل[?Rlr1n3fuPHZKÁZV'-S:Z1ÙL$G@
-*m}dD<juzXGvBd8$>z`$	>XdYxGDƫy;LWPDVp*ԋ&Q$GFQefcgN's"<	튎`U[*7sG*lx`mjЗ?QD~PeYD@QmB*<ëv!V0fc꽧 Ē9
-"pف3yL)SsqYhRİS8}Ǳ6juvΌ,7_go+p4͘D$rӶ+ؾoz6z|#	$(Y@%G~(6+]{r)Tz3nϹ8Qgج*E6hPSQ2jfZbB#8&V0GwMk9K_qqP:v5*WNSg?s^J
-X!ȳ)l.[p|:`QSۏasFqRhr]ϵj/*~k7|Wo]E7f㑃?H	-ΰi0+
-%<+WcΉǝ(soj&{T٨Xu`|ܕx"AOP]']A	|6x@$+zy*pY~X][J)qF2'C bmj,VjjHR^tgZBe)%U]4V!XP~fROe#JP#ҭ_mh'НӬHeW-	`Y?..N!B0ƫw;~=yg<gi"kn~ϝUt{gY緻^hZΟM5K-__W_u7lmͫΫ;ol;y@yyxyCVu
-&^VT'4Ź7DTw)ꞿr6*,i7ѣCPWXcO<Tb$)&vI`oVඤ,;g]݊wm7Z0œvftT
-/gh{r߶u&z{_Λ]~u3u8k4ۧ;?)Huz!NaՄqs: 
-7]n=ѻj6>\K:[m;Ƶ;";+q)V9FzmsgՏ~GIQfM>fT~\̌<+%͐ϨWZL(J@iƍDw$ 䞱dKN(*$+!W_twNEr*@v/Vc00.ڡRcR1hWE|p҄Iv]2EJQ6gnG&邖K^J9CD)5rn	K`ZzăGaW9&䣌x문^szL҄$UEww)l!,NR8xtIp!/펩Mc}r8L>mO_$5/mrNKZtQOu~xdx*Yմy`	VL|udpЙK5D존g2oIx"'­Δkvwr?0F5N#M]4VQЃeXLwIɜ?◁vɟVy6VzV@Bcl4ɯI6piqhЩMo'4eSYpFE0Y&n7riSjld[osb|Ʃ^)UN'x6fΈ:3(2l<K5!V/z1)i)vv.n[6̧Y.|rQ KJNk`cm/.\s~y¹ǅ&{K&B1F],
-!FJ=3A+xUGҿjZM1.۬zM\N
-ฟ4O[ S'I_d%,ÍF]勼h/|Qk8)>iJMD+CL&߸Zϥ2VWR#u3	E[N@e6hqI#9}b6$@(Lޤ
-pwIUviR_[PTTr#ϖ΄*fNRjYV?*&:y_=V_n@xi	C,9}YS҆ϵtʼ__:RȨ{Ř|6F׿vt5f+Wvi|ր1EWs}RauMГÿp)irFqje>2r˯Vy8=zc`tl|Xͼ5f='ih2g@PaԷTKɄ"t2d	q,J=q0"($Qʛt]JH]eyJіp䪘+`$AF(XW>UMaziwO\
-]Ŵ-;&7qfTM6R19*}%=EבSNk(㭙{P!D(:36%B9˴sw"3_tHM O?1,
-?qY9dw)Zow^m[q!\s^;猧_:#Ā16@(- KZ%OB	< BX,I%irPA$MٴryͿAqwruobm'}bݴ	LY\R:}إ!yvT?N/pDh\M5v$+h5F
-2ɒTOW]Yi3YRHaȽ©c&eצT*Wy
-ot-w5V.0_?Րh;"yOGm7X>3I:fe#caʺQ<lPT%aT&9ԒDn+h8I)$$be`.x'2SReg&3D`	Š:DI̋̚BL{㔝,BIA|\Pmi]"
-A`k+U4=φ>I,
-C-W9AkH=L3ILb{v.3,ACWkzrV|T^uu=#zk؊Mj{j66p^F5,ʣl֡86ę0]pޞDD孧fwKbv9]ophb 7JDޤ#@kn/Q7FQ{J ղ|M:翚K.mw%2tLHٔ˙9NR,(N(fPC+g[d[W8v8%.`<a-sU8ds6]^J+g5h5!AuB81%BVQWj
-4sv'HyjUd\1	T[+̍adU.3ӈmbWީϪL#Ƣ9(ɣ%%7ۏlLq'fт%hny#w)&+ܳV+*99zEH_Lv'<d.#:--#F8e.2J'Rw1׀!dxq|꨽j(/k2ߥbL
-ϙ͊S6gæ^j늓DG+fE$K_3Ɩd,qyJZbJǗpEcB1Vjh]M
-EX{}<$27ƙ*"Syu2c/Eυtwpk;K!m*^=YV*^,3"9$]ҌErXqz &2|Dd5@mS&HDYr@`Cw%+$N3
-|r@-颈ѯGMP+ֳeiZMo?꺘QeiZivډypfጳS,?c.+Ge4=mk}JJ8{dڷBX#M![P(VE,/tm;:L7X; Jc-t[~ܲk(V.N-15qh')	RebRi'ZIKak:'}bwCquMNBЭK3}wqE@+kivx"ww]TOG''mLtPLfg'҅o"EƬ| ?dQj.>B1[,7nE;ԀNl6Ԇ4XtD!D`\
-	E⋄=ܡʪPlzO-Af5s$5wtPd>M5!D4\.*5m\G>+ާbXӞ;t	YAKڋ,gf	M
-Иyn/㖥O
-::`leG:T.aG{uz\dpo6Z5,Zy!w4?r#<!s=(ˉyrɿL;BP?NL3?JP(sPz5	Kǽ!I~0?!;(;u.Qzm?gt114]N.dD?<,`yKr+$gN5F,)CsS{]CkmBXi2Dhq<`TV}vtLRI̹hҾ<?kAJ" xʼEk8+6gϕ&NFpeYAT5ja]{21j{GN07JR4r\J/h#TSBc!Bz@;֗PR.dx 
-Wꇧ?̭?Ė]o&@Pq܀V;OHŏH\,*גvpS1]F!TTRgLKƠNfb 1~1-&Quc5?w7'G/J k^wASYSG:"!WۗG2$2Ϫ}JZV2h!7	7f-'6x=`UI*QM((hQ!=*(0)佡xRVCg_{Jel8%N>Н칛|?vntƻ,'PC`Ѷo yZ0_{װ|Ŏzz빫W0h$ϪM(Wq'_]Fx΁"ϦR^$%⸏N#mF:N3 @7=bJ,xVmoR|%;Fa
-]*h;9K\E	>p< )_4>CsUy%huݕ7cxv
-|;+7<J p<D/7fKL5rN#:F/x:6FȋRչΐP9ɛ=0!+UD&⦤[ʇAQGWZw +Yʗvv{H̫?K66goER&NNuZk+ߜLh;#|Rc84Y%PrC$DhYmҝWy
-#CP1;{E'_F35/s6uY9a`1~L%?O_TsZo#4VE)2v֭(ۆB"5 <ȣKFr:Yh˯K$n6Hp_xagaV%c> h V&r\A'
-F+/tG]M(DI0z.fZ97""ۢN4[u"W|8|d ! u{Ixl$"h[Km75$fٸvjG\ej36ҕē.n^LnE>͗_*RùISJm@?-ZB%@ 	]!ƹKؗP+ <e朽кq^4zGzQMg:!a#վ*5F"|N JwK嗒͝~?WV)8Mz]/k:7ݝmwM̧'[VsY9쏑+i63.A$:YZ$]yT3z5CVZuc4b`CfTrϦz`xJm]W\t[<]ZVY@la.7.Y:[,y8KbJo$W/ es$ D郯)
-<dc5G>>2	J#mױZ֡|TaIʏSZu{
->
-=E1N.WU;ef3I -XF{-ʿa]Fů1}PP@s	WEBtʲg6gi|OY1	zrA5XScgKZ@cTDـ1
-bA_lI))])$in |xJUqZ_aY1$y7/0h1Z/nC,jtcPyp?A=xh^ŅR
-l5@S z/~Tt0D/LaAgTʸfݢUQ,X:#e0=o4c3̛fK2|jYOX[C&_qzߠk<AX4c	ɴv)V/F{3vͫgiy)iJ'˕?P% dE2I_vZAt kq.^pÚer]!݆̈uAKC;M3>5i'(ۛ~v5aZN~^(+9HT̫pTGĥaRnbqo29JtM=CBv;[M&2x#XC~E̔n+M*Yת>zt~tr#hf	>y^pVܰ@,_u+P暁;sIħ`YI=0
-NỵC=4j
-i"#՜>.9^8EoaH|_fgng$X+fCSui?1קȖ҂jmݡ|d
-< SE@B꣛^ǥztu逞q,n+@3.%SaApG>#"b=
-_k4]󾡈M~:~懙'dUވk"|`I
-8VYmQ,%[J)^\kõWC~ؘDN%ա1af f{_ ˞dA f# M0'jh.jyyx>h1e
-9;y9G	8Fd =3rJη94rG-cP'PH"f;T||FjI/R]@ٔs$Cz>VxgN)ަ}.wCuou>ӥf2</_>/[FcGè15,쐴exDmtB!H*KdeclQtbmqc>e=l<Z90٭V"8{2Eet^UQT嫫}U-#8ve۞XUhs(T6!
-B/O+yרpeh@ڏ!EA_1Ǯ *i.lO	8bɖ
-8iDFUrFGd(Y#҆~/NSܱ]FSqkZ	S%*ˏIu"J9yڒ\9BVeW2io
-qflu|__s5א wȒNX|rYs̕s9;৵9-F"h
-401R:<nބ</aNPC%frJ!)ll1xO D[[Z56TC&9љ-3̋!n5.Ć7ҁ 46bGSnǙy?"XC'X#YK	/S`U<e@}u|7qN-%b<S2ldW L~JyT<2xUCU,N~mI;
->am66}E!"6:ʨIMW:EVI"DF/YMf1wG0bMWw<`6X\)2zVU!qdE<#  7*Ge
-~k;[`ˆl4L􃙶u.dAI)p;;SIЭG7'H'3T]b1 kU_Js޻|>!zv*{,nP/^rVk{GGѻnE;;s&2&-{񕮆pkf;XL:`ݡP]Q/ˡ6҉d %k(Q D굝Ύq	'իRzR9Ue?7G]>MX :2ǴG,r$$.?ԋ`ά5aD+x+jt\k\Ӫ
-q:EVp֖ltEl%gٜ3zy4=<2ݲ@̦is-b0K^y*1})g|O]N n˃OǃOG,>ɧz{ݝ\]r0:*8o/%Q.ʾ~}O_$y@h(.>ٜ fP+2ȐPkƍ.nhĭ@K<KY	26тc3D[ٷшy=VD<+g
-BT ("WNj%$NN/+s+s!5CH$M̆!nel8Sjt^
-o-;Ǆ~ Wҁ|)/"!/KXx_ӥܘh1ŷU U6ώ^t&BG6}%r?O]6'\jS7ɛLGJ[)!<)H#`#ɴTjS봖2Ou8{]\ٰMaVa1>~74drٌBW@Ձ`/R}5o/(V`5aNeh6>fI?kU;qgx(\+uwzxt_ϸ[q"޵4"cotTl
-#q,mJoΉ4X#gQ~:4I:`DhH׷JFpL6sL"-Py aʮ}> ((w4@-=~f)˱D.ؕr>&Z1-Tr׃ yMNQ/q28Gd/O>F,it(tcmkDUCXugSc}xxkՌtpT
-$˹M/Ur,'\Q"Iq;k)٧DUv".tQ&0
-LՋuCϚ&A/ΚNW3*.dV7.ʉϒ>9g\U
-,	BdoD1sfzh2&SKuXNb?og+dWpVk@LrUEnWbhpzwI`a~Vv;p):1#	wv4Vx8<.Q\BLJfo:1HTO<q4z׵˫}''9\p(HL$Az>`5h]8ކTCi !TVзYmw贈o=e׼IK%]9ݫ<oZSR,nljlteacbX6уoK\smIJ\pkIA9.d"jO['OtX{};c}/R	8l@:uywT%G&ofg"_.c}-
-şqqHkhnT}8Mnh&9A~lF!"co"sa}ĥתm,ی3`0ȺI2x'O#47aԹF
-:ucٮL/[p6N%";LݷَqC[d;t.ؠJ|%$S8\g8p_ۇAFgm;<X]Yt~[<= y%I5$gbc9iM>ɯ=-tjo[*hzp{Ã$@=wG~WRNXiN09<_$&jM0 P\oY??OȔӶtv"k8	}Xlyx
-+*;zVE%p<_d O؝?Ew$ݛL7PLTd'Ьp(/bIMFF%&kS+]gN͗Eۿ1ŮٳKZH:_'O@@NtZȅUCZ0%Iv롶©H%G>\-JNHn(FO672D69y:4Wyݽ_:W<=.#2ݜ;isZ7C&Iy(BҾ>wY.|7y_;ӹW?6C䠸5Ǚ^5@5['!gm(K$V1+5-S;AFrI̸gz.Zmx+iwCɴy=i(F[W\|<9~/taVHYU&2z ZKzj S%:dڛ)i!GMw;xs[?xc*>c mbh'1_?$VP`.CF5ۛs
-]+b5|=ᝮtu^V%u\õrMg>+3MSz޲fV30K,=KVbʥLzHb[xr/5pi%U,v$'9|oʈO4Hl:j߁Z-e_'^Pt8|)AtyA8(֢Tl!-3Bt5 wI?mI[D
-9*ACnJo6R[BK-'!ҰT[N3gCs3'a!6bj;mwلXO^w%E0.n['9YwtJoP&s,9'8s𩭌R8
-M|z>;jx_Bo<0aߺI=lm	-4n:UD2p6	H0p?DQpk9LaBԛ8|x\Hk	qVdܠqfj>4rY(kkm<"ψ׷J@Uy-\+^>M|~Z-E
-ECbh$gF_Q$6u}%M_n
-oegvN6}JLǙUNT3GUU^"qk3 [YgTqvTZ1*;	7WBLg}"0:@˔ mz]/=NGl4i6uO	{LYy#'R"~ő6GVDVgیW6?ZqB$	*ʃ̨̆1U2( bBg_v,X*\_9,sh#1ڃ3&C.>?PK    V_       pagekite/yamond.pyYn8kQXsd'nsui6m qeFYtIʎo~3eɱsAv8#pp8>{,e 	l+)8GrgHF4RaҰr6FmwA8-m1j-Qyi1Ap~v|rq}C +~M%CsA*)I|jrY8s-XN,`F_.$\p"UrsZxT#Q]
-R%LF4,iYeМD+&E:`+,ay />)j@-r,ǹ`ah ;2#f;EꅕJkXо^+ym= BarjB]2w6rѶ獃	ԜHyyc`Z= 
-lt(8.FFsm4qJRLhQ[Slw68}#<<?ˏWO"kDϸn4	Z!s
-3m!2@	EGI݁!vɾ
-e{`uf_.Ѵ(#Raocg}4S4#Ч0i5EǃIQ\#_K4!*Fd:n5=r )ZzLXzz&w،.[ZY(	rhXL*~3U\U!9pn 	xJyѩc۟F$h抢 <xKkvUa)Vsc繐EQ1pYP{%KNRSfs% \ْI|vƴӡPgdp؍سM__^=4,F:7!|#}X}+O?ӬNxCZyυ͜=A+oLC9 #{o;/y++0)XNzl6OFmCCQ9;@I+%I13%1RyTtjᯆu+C#^EeL6F;qS^Nsq,iS'z~wQ5NȘ9N%MT|zشp壑{rZfWsU#Hk@RCG`i~ן*K5;4qxz	Ɖa5Z2l;oKfL/TUE-	
-ꆱ9M_~mTڇĥ9s8s ~-GUeWtgp>J|K±^Uc	$kQL%\-A!STJgn+usJظX0X5[ӸN䄆d"FD;՞E̸/%Tb2.21\$9a*4gOJ\*k$TU]?;Z([0_U8a{Ҕ{U>ǂ2dcUt,L2!zFVnE޴Y7FflP7jlniz2As; N8-*kX:SXE(B;4nX9!MݓȒ-=Xj1rrcrSΰ>`Uת57Q?bW=`׸$7lmU	
-[60~@i<.8FƉ=t\~ϖ4jo?M9eoHknO7)<?ֆm5<~j{DMCW.Bl=|:<]YD*:½ۭbt'6 V7u"mPی20
-;/!0?xas|v[Ȑ*X-&-hZS=3Nbhe
-E+jdڑtnvV)e>XdWPH5pM(8nV89BA'λ!cۜ Yje4wS1@M+aCYJ'ʐ˵)nrە%[ ݴ؉-e lN}?|'ӝYw
-܂.'Z+Wg{O'ԑ^s#6mWo,׵Rn2myuW{_,RH0}*0D3M㷒_,4 -*ZFZv7Rwki/SbhZb벘MB$Hxe8	YıK)+va÷zב#Wt_ F}vRqPr]^zKPK     uZ               pagekite/ui/PK    V׳h       pagekite/logparse.pyWnFSP>S56$FJS\awijw R$(FD.g㷳o޼z0F`J VZhL Bg;CS|!QSh&0ƋԷ B$YAH{eg:YQmcS%{CxVsfc91*,]b-SKihJ=?ϻؿdos=	R,~U}TәӓX<+p._N%ThKvmGj1cFv)4Je4FX-'.7CS*4Bܰ?|1j?aZ$pMkbj+fLVNp^p;kxF*rdVKX\ZRK]۞@sόåL d, (#w{Afڙ9R"	T+ǟIwqu}5_^náwy;{<!Ckы
-ӐeI33% *cyc7IaG*Tafx\4'995?M^ѴʔOfU=Z9G;8zZMPԄ{}DTe0*P#%ߝֵL	t PJаz? }bcYpƖJcPؖv	<SNN8mdIuDnV!.,5yS_;;gԟ9""ZIUo:kv}D-88"Mż|9TDH9fe(VqXL̟21mU:6wX}$#(8?&HZFVg!?T).qDvrO|+!1LzHX^OmxCk;pu̸X.viMH.|Q( +4(ˆ`a *SIZ\cNI.ԍaiEԢHSPPÖ.ʦ"&ÊUBR$L>ſT$۰l}AGiP#RS0Yr)ϗ)9prѺhBF;Jx>v&Mx.&%㸳ѷԓ2 &nTGH6+6~%.?׃TOgQpYgn	UǓ"ZEyӢ-]KuN+lJbH,aŔϙ&;EʦԖ~1gA,ӨEpNp.W~R*=Ŷz(Wd踭Ame0*Bn#-'@FȖtДZscxDnoYƎu.ʡ3DSWvA|q{⍽&_ۜ&*{:X06MlWX!Qkg˽mx7LI#|%$w7np9tֽ.(^Gzp-KcOv$,01+AQJ6y>5ja~44yZcuzYG;둵ؕv˨;Lcilh켬S;!L(g'x\bpb;6Vŷ[SYp'dӻ_GmB|%mnZSjO~ݽ^%#CZF߼}6 ; W%΄ݖT2?|AΖ=漬m~c<C
-=1ticM(nKL]CǑˁTMs&6'BJ3gCoQ|8},j!&uS\PK    VknI=       pagekite/logging.pyW_oH0=C?DRH(B6n] tfvm$mm읙(wpRa2	z!d<RU"Yh>ky?>kvM8DbapgXs?[Ι2fkG?k5)g,Sp%7>g,iE$4cWJ5II6'I^X y+-[ĚT
-	s4!˹"д5@#pS.YW$B'Tq`(j]}-rX\*\R2M%6UIzu085:g"Cf=\I@Q/Ez477Û(g|ɭ&̝$Fd^fN{xC[a98^pgםFWApn4R`N5>q*D0cK:q1bV|RFMܰ#k
->fZgjG2:L
-uє3WS^z&97x΋wVyEO<cs,˴BՖ"[aZy߮ut@ipB&}pOIK0Nwј^&vA.._,axo.zOH;~^Qԍ~GLܪ+L=hIӸKwHn!]6qiJV3DjYVdJ*R^CG.eQZZbWFG=΍P8pl:+q(N}"*LHV#Er`D6e:\U<eyUCQ|m\6w3`0z 4-%Kwlc!%ܥyǕ>:qUxPT'eRB;qB5`zV(2PTnExI{l"[[X	%`7
-xqa;rV).U_,aSV
-T)yg;~b+]t%#	)Uz&p"}A=ά}eOlEn>¶6\juwK><<UǶA8`z+.s`&;פg7Op2HN%8H0,ZwaQ!LuWᇓr0injjs~t7rۓ7TOnzΏMNsBm]iqC4k+[ir+z^Dٌb&5sOyŉnp='h,ET2kDX}%
-sD°'׍)s^gsUg܇Y`ڢ !/g˼aaJ£BF=J|f9w"<j{r${Ksgš2$Ӑ7}XvR/YŰ'YvrT3-/v{;4?mm	v6zӦkmmqP{´~߲)k$YQ[Чx	l 'Ul5;οPK    ZzZd<&  r     pagekite/manual.py}msFw|n홍]mwϰ%[cm{>
-$@`PtLo|2
-/ZޗQ	TeUe{fUըhƣ W.$M,YgVm*Kj>_y
-i[$*`.kfaxI|p`'~)nL$@-^nz'P'Ɨ3Zuiҟ:`@}%K/$:W:LXD2کP({odz>|xSjx~yӯFޛ_<2-?/V娧gӓ6F@P+O΃Z%
->zo^[d|Rx<΃,R9`n:!Ё^[4,$cXGW^DU7{NN&DjyL"bdw*\ajA8yj<`*4%ftCZP	+8EaLÀ
-b XyKZVMA+'x47	|?LMVy+],~ :2^2ix>m@Z)AVa<v[DyFCގe.3نFM[©V$ߨ 9*:ϲՇoy762>YMχċqί-F!&BH˹besH'fuD?a!+ޏm	]6*AO(YIf6d>>}$MSze` #odL.Ò~\5x?͂7oy՚D3l<=Hxh},8P: 'liU8lDngHxnF{a	Z-00io|=03|ttm{+d4o"$^D]%P:0joL;_RǏi@y:	JRBBd}	29Vu#}<)r
- ?љ]{/i8Ra{XqaUϐHcj3*f)Ղ$aY g98WQ6HCHǪ"E[ I|E,^|BVܔ׋w0vxam^ z=1rsG¾0Ԃ6D3u) nhR9Ntw0H0ed]$J33F!GF<A"d0::DՍ!ԗ^D
-Q`""967,QB(%(-|)ĒQ=ohѯl֋h:<.gn/4:ukg_"|CѼE?c{yjpkeiA{mVa,GZP6DʊX4V'!LmR} )Cl>C?_QD(LIYSVq*[ Dp]@TDkdvYu}RPwЙL&kI`Ň+D"/oLsBD˫b\2$Y&/<	ruVS!iO>|h/="_?qIR(MrVp霻ٳ^=CZ5};|>Zm$8+bmL;|AuF',ZflaiD[gLR00$&ԽhK{ڎOOB)~)^<hȀb
-h5g5XeV<m>i|iw>z`853LMa7	A}@ T7-z{bv$[k6˚;eZk-		4ZXj>䃞h/xϯB/n/"$CWFW?& eYAM/&/7wSgX4|q i
-/z	\䩁H0fLY}u)Q0S,ס&vc@E\\-,ğXjbj>icJp`Dv<f
-3xMӨ7T".R;Rn4&j(		ݴ橱,a4=M>De:ax~{a+Q}eUDp!
-^yfqa,3b6qlosd< j2aG;3$q5A` vǓGT"S@2pKC2΍++H=IXx-;L?A h4	:©:		S@H!Y72 ;D$`ul-WooEQ		FTVPIvW'6?,h@ӻ0U 0[`h@!p Ϋ{<pw@U7ta[5qV&\%(D9)%"קPj}@ӛ]L{X,3OoPqs!&n&J]÷.O7AU62
-#Z^7wS$R^9/V,P&ϰ8csvAtW\;Z	_j_@~-b$Ě| Ar׾p cݭ`[ـ,Ł}
-d'g[NK+@[bOfWF,h%:~U0\e'as^&\oHBlD"a+''v2dI^t#IT4Kvf.e/dX~2O.&?C+!?՘P7Z۱!9Um=E@mzu|3ɇ,|$M[Ed:ZG&4uaPm}hjQվ2GӲkUqUh1s8I`y%0L$(%5jl.Shmr,QQ7$v%>z..^2YJ'gS2=}Uk=rP &ʄ~w쫄-P|c0$Qm<tsﳋBׂL8ⶈo0<2蘣٨,	CU-FbW쓰^b-$-gmGnv#O/]V7xY4})gr#gҷ9rxapo$ Ci_3p㲘'2jp$Ib! I[*/d[}S
-CtmqX(\.laanU5``"cb.8-
-n'8.Lq;JMmby0#G?0*37H[ml4T-
-"թaemwa1,tAPIS	epgrp}.7}rRbȈbsSVd&c1sOK,Wk;p.,@6	u]h!Vl72Y[;Ix꽡{C5܈O M,9PIl_T)q)bm0~3l˂xLY!T!"z~7Yǋqc=Rۣ$Hiӹj
-x,J2 MKc&7(A ,DhâAH$oK":-|
-ǌqa9	-ApB6|۰	$4%;Uda"+jZV0[AOMU-rHN--J`,H&ϗAl`!?yi7<=UOzE.uCkF	Cʃju<urU\YW'
-Mas4 IhOȍ+U&ڴ]i_ekE1|mt8p=
-UYRHrk^gfB9!3L-5q21
-'*,!\VݦJ)`b?v:XX]tCv`Fn_bPS;Xr, mú9p6Rnmd_4Wʼ2Џg@ #HeR0JĲn:hhAN&U4ToGcXEv!¡VL^$ i7Qisu'eA6ٖ Lx@#5 ۆ\SF @-^L:50-U
-xvTU.\ZLReZ?7gU]_]㪡A P)iñAKg,ԼPdJϸk+dMxs\ч}k,_zYcXDIp:QɍrVR=X$^-k;Xߒ~|х2\'buOp?,3o`ALq<lO`*ޗ'rSjC])8.M0;tSVkHQ^Fbd~exUIpxPVJ^Eߚ\KLWĬVE r9%V mt-ub-Վmоy%"d]O0!YdJTᩓ˳,GvjDm4_m-OG{idmC2#%)ȑݪ>+$v%EZuА6}xYԳI MCf0dՓYfQ$H|03(ƔGݓ4HOԐvRoOb5P|pizb0.>jq-.VH='<PEO%'q;,lR۵ֽ#Zzo%OzE)[(>C)BQ`KxC9SZVu!lʧ* 8%^zpbH79Qr3ޡ?Y[,b:>^ȥ=̩o"ry:v>#kքAkf$y_,R>KeH~ZRVB,yQްLCV\dvϣ,𪈠UL؀dCH\~9=Mf={pb8;:Qąnpf<RTZ̈ ^!H1ǁY8NL(WY_X$tYXJ0ɤYïxk!N!56> cZWlZc$b.f&y`&z
-*BVso	18[U2ѵVsR "Y㭷 B#KN|dRVk0\>DGV.!gu$][x)À̖gY^\9]B_pTkn	VW	
-k{뛰I\XkC=QSqB K/~셠
-;_cy@N2)5<83GznC)<Yio7vs՝J%ڜǾ;P#|MDY+r<@|Nl4!؜s)eňv#<G#9	Ҙ/pOikOraKn	+MZ.6ԆE9	TJ-!QShTtϧ?Ogg1$FFKj.8kT`ʖ\_ziNnoPw#cΣoxf8
->K-bE!V7'[!cJ*sVRBj6gVˠm1b@f7#cqjq#Pr&-:Q`ϔj%`,JJ`LDjr~_nN$[;M*\`Ĺ+!0UZcL(qQhİ[~N\>5lϗ9*DJ5L(s#sR^uZ䮲#O;loyʗXC9ߜp~jJqry,8J&K ?	g+%YEyqg8#<8Q	t	"xz|c''&l4s
-	潳U]\@)&^v63FieONe F+wyHOvS'5Kmb{f^^m[_c{Z
-{t`z;|wyib&Ƚ0$]jFa0bnN"**~2B!~D&?btwz}{@8\e@|dZVFj	+A1c5j$Hl
-]p1,*&T _tRc:ܖZhjiH;FqivZ}k0ų΍hx&'L@?2Ԟ}G$",`Y&zDg0|gC66yIy`bvEw<o"X1t^^c<iJKRDAWc 
-GYrA3cb5y=#Sdܝ)kǏU|s+5|Ȕr&v.rwYyQc1(7WYNbֽE
-Ж{*|`eE+{9xd}8Гz[UlSTI:.bpE4uCTc?bZx	fۧ]Y|ߪ)Qѵ0'H(f!0otC4XXl΀5mz"K2 Ny:ͭ8|>C{7'HLR* f6Wl`e}l==U3+@JJeP17A02qs|xv|C15:11&ʕc0rOD>B<yy-oGcF6d&|jehxozEWN: 7#}˳f&)XΑI+vLX\ɀ\J|ђ6 ъ-WDVTĉ)Fi	E&M_.g;i B569fzI9|!ˎт ++o)Ɍjh|T*Gb-ԞHy4Y1X(/R詂2we]`jLl[(wé>X檝".mj*k*oͫ^.\5VרL2M%a-5pdч9aLH#<˽EͩvYPFW͂,^.uoӫjͰ	y<A Dw"\rY:-)
-GϳMQXWӳ8qÇ!6\#sXX&0Tݺa5lxWz\wȊV8߲|; 	xxAXXJkvku'0 i'-MS>$n;#Do2,{zN6Ϝ1T)O"
-[VYwqҭObx,I,P[=5.;3*~IpwG/}w$j-DcEwwpSYyo8TCunhLu"`h&>F^1rLAuWIpy{TM$WzA3b`ɐ@IZ{;9ۮ)bc$VF3R`Vl2q>{A:Y}__/g?U66giapÇ~+ޝ.ϦSZd|=;?_jz6tՄ"AYdn?Nq#z[KJ>Fp$["ۛh7_s4Lҥ?5|00"b$M!Hrz+rHzPZ1j^||1 Rݗ$,Z7G
-ZNNg-ލC.B#KDHLVxWp,Xn$J;u$e-7[e#alkuZ^$I3\OQ^܌/泫t; IMko+僚8Iu{{wi`1IbӬruve^#YtMӚ{5dGi;tIд)ޞuf#sOL{]jx[zKj5*vꪶ9'͆ms~kR-7*g1Z\)ZG.Mj|AZz4Z80h:V:nG bcjL[X}I0rGE[kE,M{cP{g~_ԃw;#_s,ډ:7ޜ̮/^9Ʋ5ZBjD/sOx"Uq3-~:cvmlLhUOEX0B	U7e{w7|L YGU?Oqg[_p	H_{EG2J:\G$.eEgV g#(!TUǙDC4HqCP,KJD|<6Gq%y=?X).ͷsky9頲ٱIxx:{v{C@d]i.Z_AslP1;!wPk`1 NNx 2Zt؝rô	GkgJRSLb(VhjQ]#?^u
-Rq_LCEKW9ů/ȺXt;F?mqV[zXPiܑfros<z/iwOT֛7o Z&RW7w"{IV}PdW Zf)̍ݝ_<o^ٙp-01&+"#\ޙB [ :L8W!J[OV,7}{gˋ8&&rla&\/E\n^X^X_|ȈƶD6Xkפrd=!W7'g1gu:= ٢wzH2df'ZfO?3qZSc0I]V聃콚8!_o4j%z>~<><ƛ!	YqLTDWo %:=Zh~#SHVM$<NV|!s kfFovu@g[zd>/bD*>Xfyp$^nݨr>=3÷u8 <{>A#0Oፒr=zb?T$,Nˎ楞ܶ"V?^}Y;_L36 ׆p4ʾÐ̴̲̱_bY7j.~}^IB/[^ZdjxG^r'1Ua`~V^J+-ܭd.u
-39^;="uZXoݰm+#<l
-&al+|79|,*aP?iHJVH-x`5?Ǎ9};p/@!uvE9"#/u2xod<՚˽yPK    ׺pQ{N       pagekite/__init__.pyO0Opi%(
+<;z2&@aRJw)@!EsڔdSXK_=l0J6.Otj􌹕1T)+<ʺKG` ʏ5lk?Vm%bk]Q* "{՞oip4-;wMdD{opRmɳ2aLn<rN;%T9M ׵-m8֠c$F^K:f}:utU'@=t^&"5ڟ4}TjM37&\i Ybs?Bґɐ9Q!QqYJThCូ-gX/@t!"blVR7BǢy:ck9+wQlTӎH.xeۻ_Bz=1'}䡏5:hZxBM8ѓ[Ujuth3S`Xsw*=(i*I#9  bqU x_l(M*c6 Yk(_+ɛxYtXSmitjWKX\Yz[_h?=qxUGdi|+YR"vO _[dP{W1ْ_uxyj,GnM9`~dR5\|sy9V}Gky;*s8#ԱJu#%gh$Y=`T-wnBb?x4]GW~' ZBiWPKgV|9&*Jׇ$\/JDPͶ`W̶RS+󺉭jshpYL,oKJՒuETT #WhcB!#lpB66Jei!G<M,vC+ ΧR]'ax\bg?vjHҦFzdsVL>P!dZSd~?W3mWi
+Cǚ'Gdk:]֛7x7|Q[ơn{F0|j"#OL<gOwWBWB^j:ER^V6$pj=c~'&9v:C%0?C[џNA/yy}yX"#n\FTׄ;J,%sh7v?EKҊb-_ov@,o@{vbhl]ORhǁpA}	T\Ki{mH߰LbD`T'wbe[U5	CGpY%CCxXUdl'sB6'VvfG=O)rHC6Qֽ4Oj(Fq0Uh1_
+yyKL)XDx儧ּoKnP+H=tuS-ֹ|&T1gYtv;0?2tUM>@;[ͲL2gs38|
+Ycpiatpt~q<>;qfoIsnMzڳ3`^ -f?J]'Px+uJqz6<,Lв~Xvo^u_X5UgޅбEMY<&"Y37\W3,gl1M۲u:AȤogaݦz;t;er6lnfWH52({LydXTq=>1[
+MrF9W҇.!ѤEQ6xSQ2K;/%:5XF鎛x]b){3091)'[wXcfؚF6Xxu~
+bYN? ~>\Tv%Te jI-?%>r
+\x/KpǨ^7G¥#מӯ6H\-hv{p@*z,h#0v'śr!uIпzEt#P]OS'fv~[Ʒ.Tka[JFv>6Gvևu@8)c@)OpnY0EW"Q)\h03(i$:ΔXKf齳%'BaE$	'M_@WAY+tF=
+j`czrטc+)#x4~:SVZgMksM^|MMΖy'F6z&Q M]!L{|K 0?:*~<>+\%S♃xK _;G9+D me䁅Qtʪ\QEt0!J|JiQ竲yjR*SUOEm^6#
+ =K/묁7kVQTƶ8	k0y:ZB3F.Rh
+_ݺv5@*_;M0]30rbmJeo)Vϼ]
+8ЩaW;{o[qv1m7sR%.nɋ˓tNÃL;4jMIy)]ONܡt/T>6Ihnyтs\/(YaLFCz$xSNOSe}!~Dya-`19'jC[ÕV9hi)Vgtm#m=弊5
+fv6>fYIj|V/-pj	xrS5myÓÆ9oר
+wK)R{Qh N8L:+~E:[n}1;7v[:~Ir;`ׯw>\.cTk|RmM!P^?م7&U~!/Я9";d	6
+Jpc_1V>@Є."6kS" F`wEU&uY$c@Ω)gv/(&1y@pNOpOSL
+cL
+u(	Gv	k%#m[RgG%z<lYk$WxTRʐN[X8+$P.y:.rtPJ-W`)+r9#9=Yu9z3Ͻo'pKuhD/F~)NuEJʉZ3	u!*.Mw|޻'_$IU5{Z4ƫn3K-2p4(SvFsp|l^3IwJ.3:M^n`{6Ko{H"4U-sydzA- 1qocըùÛWJzwq:9-~+5qǏGC<PBnh$S'8:\j58*FSq<VZa u/x!~ʵqk_+p'x_A/KįNs
+R&@tl fJb2.fj^pO[͏;kXӦ# ; B޼v]izjO|lbT	阕}ex'py%иґc,^zs\R=7SRUD%2
+w%=GY<Ie7ktx3Ե) 몫l2e	ܖK_|XnƒPaPՆhJt}	{3r(Ɲfssju#tQVMwDD0tU	df]R+TăB7f$^	kw:iNqQq|tC7TZcB4iU*xr:MW@YE<xhH
+ü]&iK2ӥ}F~Ju(aCCK|bC9<SR@= *tNJ#xsYSqvʮ⽛ʅNwߑiD3 
+IBմXXW\<,cuN]o1p2 㝭{QUM}Q$uSD C(*}/::9gj+uR
+i=&w|0]I(|糭C"0fhwJF`HP`+)̎%h0!rUi9Fսd+2F3Al&W6eNҹO6JIK.IgӨQ]Jߊ=Ct/DeP;-\lO3&%Ʃ<La6H6DTzd@}#w>틴0~sZ;+{' +<*_p<1J|V<VPع߼Gj:]AO&)0"՞IM(ƨ>Ū&2\0l^5 Aj@``qB5wfYE%5+>.نٜ⏍no5}.LɐrD<:[GiCH'hgݯ+ڭvt
+G%^|Kd[x"kh)	 :Jue`HkʃO^	{\ܽ|}J:,lUӧp%UV\rUd5.v ً^Aϫ%^}kcSӠ#/FU[JՒIƿ~<2vB@Y2,]6so2|4>`8;PWY%JR:!@d,8lOɤLI23&ܢ<ƜN}8SɌU_Yr r1$42<qk5V-.rqG.z<IΆ}hxUzhKFXdYc|NqE9e~tlT8$%eDYh:p쬍7T|RGZ4̻MRa*%g0؞a%j55ѪM)%l Gq|zfsq2$ح+%ԱYZ
+nŠޅ~7ZrqT?gQJ0}4nuUJlg"1=Ѻt9)\i5Yv?W^@|kIr]VQ/=~m^)pݟOa(A[QG,ۓmt(]	nq'<'qM {FUl'^^DM~YꗥR{aQIlYHQ"gHn1{
+	<-1I,lGhGgR^p$+y&z,m\Iȶc놲 fͪc{|y'MY-l6>:aFؤayς>1q}D⨴ҡ^{75̓UsfYwr&e?ַ6u(6=kByH:s(-ڲ9NUϑv؄hаU4Ӊ@\ceTWMRړ.kx$21੨>[凶\k.HnvN14v]Ó .r]{"|L2݃TIGoDRL8p;n8eK;hZkmTtNViĳԑ! xi	yUK&`%L8e8/)v7"SGc׫Ic}B#6`\Y|\mbxIov΀RѰ|\jÊeCQwwӝerK@%:;=i"/B~tNO>eK@hJaz,l}hv(oSJdTU<55Oȏć|EQ0l#~ֺ>4
+R֒xс/NR.?Zm;~Z[^r~yz?t<>8>yy0Ջ2yΓ'YǛ#Ojϱ(ZZĴG*/lWUuST6lאWư%N21+.,xj\]sC[它}xߑk9T.s_pn k5O
+<DI*z^$V#^!zԘ%I5jЅ8K1w .|Wg="YנnWPM6n 4ejˏy:t:}G1͙݉zU_W)CM<wP;h'n:r'x;`cC7-=^X ӇnV	Ʈ>EEdx7K.0!~w$/'3D-E&7tL%EQjf,2n6Mt)kIJsegdg[LKњTwԶ~J.H佞*sݰ7m#z8b'8ue5/bF,~v
+cYt>|}7@+xA415A*Wa ^QD'Tך`+*m@^Q%%D8tɆ84,*hۋ>|"!$>&X$^kSXQ羉&ho x0qZSL?bEe\/]:MxD1+49"wxCi&~,57{]!kmDo /r,V%)M/S.23 b
+lI+j5qm1uCi4#
+",'<f  5L5-1C/š7=MAqndl5RȆa:P_RPBA.^lo[g9sU]Z1AX:g{lmm`= XBaquf~u:W-r*H<-iM,@fԇeLq;o=צ/bh't9ۦYLͯ۹E̿ltFSk0kaܯ2EqtyE$jfXXڔ.z_Jܝ%$@6yBq@vr}-.weK%ݠux2Dw[[TLgٕoz4\)nJ@+BXS\;QH=xwMvA4/)otVK_ڷ yNĄY7rqn+6Ѽ*1mjt|l@3H*@N-SojndP1j[NO5m8i?;ˊbrjT3ՔrD MI,2C3 :RB0+DXiJ>Jt7I0#z"eS 3}tbg[+EBܛ`kq8&P$,W}U~@> =:Y`&\\okT#Y&P	)H(_"b2+;/{hR*{q3=;wԞ'wpzS\j?r?1"aE ?wf/B|	LhtЮGAk "W"TA@RCUpq=RB\rrrvBW\"e~.tth܈s>kZ󌵺f]I(딹lU@v+%b2$iim@0C*z
+z}cs:&mO>9'b6$`-XQY_"7K{ =9 F[Hi&y1y7 %)PGX^10JBi.nVtG,NT]O%@C.wRT8Tgn` {D|oم0f=سxr(#\8J|!vo
+|soL~ P-9ʵvnpSU,*	(<S#M[)VAvsu!]8T\`Mcj5dC*`r582	7y`C+Q=,sdLN̆ߒ%	:Gbp;E@8+ud>f=-3Ĝe88 ZP8*غ-JJ2{k߾Cǖb)]Oz#uc?u([ A	W(ֳ<gB̺֤asl6]PPMm(S4hŌ'1sjL˕+[cIDDZBxTjbo~4WUGt/Eο3}&.CEDՎ#WhPD)MO)g% 	~SWҸqL}MJ܇EnU7ȹ:r#UjV]'l8uMUF `qe(gEi{H9OTd@ڧ$4u8(6'܇6R"dx+tbc|}.?}D7;aI5:+{b%۷oXI>i='t%2{ksšj߾h JW5t-q_LkQ^Y`5%@^.{Y)d5EfgTiRMRp&H.kvLe6FqH"lѓo;?ͳloJy+0j}!B(k3δoOi\\>ϟ 1yS*)fk\8=*L;}:8\8K^X%oS-5',|?6Ur9֠A8WJ8pc"OGZk{Tu$}IjUSFi{գy'g]2sW{`R*{࿰w?$[m[ PܠeHky1O" M7J֑^z1om"~az0$+UgY9 I-YeXF#Ec.8|ia:#/S{5O**ϫσzDʐ[&
+X!*1'Pt2h>%b{ubxA;->2E>k[[bl@ ԩ5Ր܀n̚@>Њk=WlH:$$TlUt
+O/U~V녙cfS§Bl$7+L8e=6,d7b:$EJVYts~psi<u^͝Lo
+67Qqx:Ͷv=ހ1R-͕ y=
+?EzʨƓږ@_z&җ12 kH]ύO-;UzA4x0pgMx>OUj&vW@pdrxˮc`en/yTŻپ>nʹMu2&vzR?=c? 6t4N nJ` 4j<ȗ6ߟzn2H<+LN:HUͼ6PCE~%́9M-U7ܸ!IG+66&Y6] 	9'SVr-CMK1:a4b2Q̠64~APA{X}DԮֺ+^UÕgnzfیǏmu	P]G@f׈Ghs|M'Se^w4¿Uz*Dd9L'fB9e3|6xNx|5|Smi]gʲ2MMfvyh<a:c}^#)_[ϼ&ҖW.獦.RkaJ}-{ًUsH{#*뎶D{3GS+e͘S5YR6+ -*+ HkM&/&Z{^U'|
+8Ϫ
++E^2-,tILtA
+pvYix[R?RjL1bYp/85'Qrrx2ѕyg' yZDfVkc@ jg-^_~߂BqIwj;^9})d*S8uʂs):'@Oٌp{Q馭oiǐ3/%W~=m!96;<V;|[`w6
+JvqbrS7xL %[ÑSW5!;R(Bpx0s'aNW1QٱHe񈭓z嵈f?>^oYmQЅapcl"J7Yߔ8u#B_5zڱSv^̺"w7~Mnwl,lÿ|tbGf;눥XRJQe8luV5#<<:ǣ=^k+L9w_'p|8=>L|pmr.Gpz]OTUĳ6 !T Tͤ$ܕjN6K	UNXqΛGb\8:@]Pqtv]uõy`uC$w8/1&l«mCMQ
+#]?i"c{;ƫ{,SdqW2G><?QlFVu<9nzJ|$盽}ŲTû|6K#:W" oɍ(ڧx?dXv°&6ʸdkFh)UF<QSO
+`<]`>Sźh iRn!bok**YN}:AC* 4PyQP&͖y;OӢ(od>DMc2~pB<y&A/~9 ([Y=Ky?@O8zJn>Oגzj{(]1h:ͯ`MmZ^D/&TE98R&u<OfKTXh\)hn!+-Tj$VFFd9+3I369f=L˻y6 -
+̷*.G\/L'	cEYSqV؊p/Op6Ptت˒qj/ DwSgZ"铌ڠ4>TԮ4<^T{}Q*Ȼ'sֳ͇46E
+P7eïwr>:$t-$X\hYa٧0}g9Sy%bڮ2$Tt:%/J	K7J/"uzLg!I5EA@9(4VՇvY( p>+H(˕~e
+hV?Fb|AC~kˋNꭾQÔbEw7/l)2o[]g+2EoVdcL' HsmMxo~{ˍ@8dc^7w,QfcI}1XFÀÀx{G]䖀M|50o3D"l*f@Tv.dӅ//~m1k:̼V$_kHW{G&?[x!-⁏R, |_"xX	}g5"*I_Ѡ*2I?at,>9,,\yoYk"T27u`OweujǦ|Va {+&c3kucI^!u}ZO[n\Q^a^;Aq6CkcӍ@Sm	&7P3q2[N˼K;_dQMo2_[4W9Q>67eY?@87ݕ+Cɹ놯~;57Q0 |?kf@Eez׎Ke}&Qm|Й̘K6Ĵׁ	8^ZPg|ϝO+z9e?uƀl[{diJ5A5yY8ډ\Ddc|>`5LfF#ǯr=ծ>/Kr/dx2M>9]~Fx J'G,.G	T5쟕,Kq9Sclc*s(9P#]LCYG bﴣNn(<I|6ξf3{	<eJ6kC}*3<D iJɺ$8U4apLCZJJ+cg<Y
+m~BF"Fe13/hFnTXCXJUuz. tYN=pջ+_t-^gTfǍRL2AYc5.<:?; H|"M<af2q&K2@@L\Q9FrbvZ|Y%s~LEu njQR;X&Ѿ^p
+<CZa=R_Z1V}hőCGeYzVWۻt5hS/w45x9TƯ5Pw-~Ǹ<G<*ͥ$]ܻ/+zLVH^l(4v=kh /<2,]n?¬u\%}ՠC3<AY1	c]۵jaOET<g$"U[`!KjsS_%_
+mPƯC v?mZ{0KҺsOK|utԳ0-`~ICߘ?ޚ?CI9f@vQ:SdX:ɟ\OP&|oXOm۷f	jgLULI%A!Lpw9ֿ}qLG:S:Jd&`ЛkCo֯e|JfГ*2	2^yI>kJ7E&/P5ӄb&R);*"EoEZlwղ)]i^Yue$Db	^cM=x;:?E4ldu~ܡ;=jGaX-m ֜VhiBEdG,roY8,,הv|jOM8W$W2w#* dâfϣ~ stbF<{8JֵV.3fp}Bkmwmۭ!^D0=^ERBHʀ&+˯t3!{Ǜ0ZΉؼuZrq
+)Aڪ`\g7j'fhf=0D${-B+p+;'|w٥|B#_!/|K|+ j7oh9'(#fțbW>PVn]oW>u"m[l3"@ʫ7քVYf_Zs*iqG2;_\R{\Z@KcӿBfUX}(UHQ!G߅βv2Z^K<
+62]Nȭpk`>:OU-oi)3 oskٛɈVY)wv|T;mm1U8}x?lt ?$mAo* wiHhe\ R&N5G0e_pn}j*;iѤ^@usHSi^&Rz 1e'gpae"b7gpdZxyGbiG8Z=&?y&KnV}<^Uy^k&)很d͕7ϞoTCWV+k2wX<4x2=eVq9JS:ʬ$%K}W*RDQߗU7QN[{߄G~bƀӻ[Z3Kc ZC4!^+բ\$>p+z4s,=J
+RR sYgeV2Qtm2~ywa^ϩOM#ﻚZ;J 3Z|F/x&~A~
+1XZgfPK,aᡬc읁jVj7;@rT\Jj]%9)znd[-spv_$ܱ_9E
+TVsu$֐M9	\5Tv)
+h1}4Zx7iQbmzèJ+Zr4Bde<k-(lTPS嘤lF){/HcKӮ]ȒVlxzr"
+ê|?SlNzhvt{y5tbQ%M#]X@c:E"fajSuDVMWsVqh}k݂L{g	k79gl"РC؇]Y^3a5Ɉ*F#V:sI6=	"3,<
+ٱ`KK1(R4 erWLU*#ݓtͺdTʞƋ~Ԧu@,PJ.siuH<7U
+qDvfHv; 8uk5qjvwe7W7v$g,{&+Hf?ZMZ&1hǼ9.ɶ0C"kjP!Knz#-JxEk^a\=^Ի
+6uYFֱ VY=
+{HlFk}ELd$Yaek vw4US*'^r=I[J:"y,]r4kZ<HuMfk^2<?N8bdOo5[(+_C/[g c=rm$F.J	rǵ>Cn
+kd,{ÏGdt[n}v]qcwV=pVk8j  "t3M6{rB' }C8!+z<N[kkW-27&ܐ("ym))M^c
+xwB3B쎭RO<"$+&!'݆Z7ݪМ/Yu3X=hf ̟׹%]tl:*,
+^_imPlz0.\/Ytl(z~qhʐ&Mђͧc25cQi/2ȍݍm%J2}Ǘ՟^?nn<l`tcXmtZr\cE [GNHzUeezl'0':"IT$xjvzR\fW-oy0P-bY8tW2O_;K k`s/)}cUfxB?d7Cﺰ{daO1
+I$ȼjnWL`M_vyǿ(z#ab 2a&	!j/.Od?6Rˇ|:%o]̗twBDd%3ݲr=Őˋ'L,9s65
+ûE4BOٴOEn{+M1|[v_cX7\PtVl@A. yK"Q}6b`ʹB<!韓48<ÓAq0sT5|}._ mȦUgsc!P"%|p𐫂Di5ٵԩ1	#ds%i*\zZa}EQ9 H[&)lp6yeC_R^ˊ&\ڐ?F׌*ԛܚ{ۀQ 6<o}-daP׿=
+p	.XO23[yN&/<'lC(7E=bz'\չr:36|EDzD"!("Yg\vJCc 7G!-P\9k0#i<QQxnx&z[OI	, qavq	7̟7ׁ0|1R80'\QӚc4cY G`=S`ExXS<AYm3ܮ,-2OQGYJ:)O|<]_Y`?hwQ8gOaބRp&]%dNmazI"̳u쫫˳~2"Ddɍtg|d	Q%`)*B٨\~`U1K	D!hGDHtVt'wc%N(((,H	
+IϊaufуFj0%ѭYڵG51/konOblw3֯Cr @DÔ<JHN$`R1[QRBTi}VIVvgQEǎS	DC`P^qvnil:3G";!-zɦ6Uf|F*J=ԩ5|eOSr~})/X
+E>I'_')z6	psH	'!|ܨZ^:rR[p@#Z6V}LMCB5t+g3`Cbtv1u&ϖyzltč/\4_.GdCvʋt0%5q<Bm	l8P^=od1^1}b<PǬkg9ʙ7ޟƎDP}}8=7lpnȸ8^ړ4(yDl<d4,9Q;I\OI1zӒ+eE4@ke tU% "1̔pDe)f-ICx,h3 1'S#)D[qJJf 0 l_-тmr1n3fuP͈{_KCZN-R8Yݟ0ۣ\Jv'	wa OZ|bHW+g=miy*!sFlj+`ފP$'aYdovh2{4
+$y܉PxЖ Rl\e2x}4`ʫco-]}5e`HDhEBtP)=f6*V@Q\\QԶ!D5^jo0Ũ&:,ذz啕 d~JA\vLSJ|jjW!5O0l* Ke`;6c:3SMl~I^$?ck҆]AٌADB[] 4
+_7u_L=>M		wDDȏvQbfЍ'wO(jvI1LOЅYɹ.EWmՠ&Q~Qrdr1-1!	~/WMjT\y(oԴ qQ8x|Jؠr&0{3)+ŜcL,a
+ˑІ=%κ-jfd1uw#2_a\րNEo߼=>>4]^욭\fVa<qC𧾢8m⺀Qͣ\j	x>x{(2]fbGD J3z:@tn1\9?e>'l)nֆF[jfa৻
+7*S*ɜ@=F_ 6&.Rr9K]X-ZI@?^PdSH(wyUqAgIKw"}^m?S^AbHtsbօv°^L)
+'?D{Mplxyyt8"Alv{{;$K,}n&z;o]n1z;noAϷtMw;^-xݷw?ޛկ`2N;-Uy$>O+H܌׏Yv~Dٴ˰|*oGGlWC`.x$#cvњnGj];G6nK`\AϔeZ]݊1ϖAtSSOD_"нKo2<@_Xіr/LӃ/MZzM3(k4٧o{(
+~uNa!)Ǝ:!	VD?L^#$..^Ùgp|31YMquLO7olhZTYۻԼ=y6Yg9_yWJ!$-(	 5FG"ŏy4W Xg'z\
+JU-c#;bjǤ(:(:!iFE+:EpLRHTb:ɏ^(w) Mi7P<$wl͉ۇa}]{@\I_8D,WzNW'>p	U aw!&Sgf7YqSshHbFi@Sx=Xf4E'.1.d+:
+++**9*D6ŏ044ޥ Wtࡩ4@%9|m/>}%0Y:vCg鼖`L}^:<XxRx%Z.Ċp̅U[>LQUq[(F[F}#%\+\[U6/0E@V 6$-d84uK1t[6Ē6B=:7|<.+P%S'~sCiSZ6Lz-UFTUbnX<8Di>T/)\~e>os)>3eD h^[=!hyo~)G+v9,;6̧Y.t"hЗJOk"G`_]<[K9r+O
+MMp 4%Z#,傐录pסbP*	'^noUcwY	6)~KR$'J?r4O$]DIR"|ɲ9tP{"gSi->Qj+DR+1W劓cf`a`%T@e6q#9}b6,@(LxM )1ܥiQ|n1JHTkq<[&*ۚܣ墘`3DĭdͶ|2*WNONNX~%SԪ&b$+C,9ikkʼ短_zr)̨o}R̬:|6.տV:f~5f+oVvaXf)ګ
+5ON.JGQ_{&
+OP)'}d3rNyNN"Y|Tϼh4v=i2dg@ϡqa~{ݐ	!t:"	I
+JGVTP@H!RަcRT	 9%yp亘-+ 1`8AA/ҭO)2erH,%toON\nmg#U$A&[)0J/xZ&)z=ީqzZ?-*hk٣T0ŵ.n0xYiIytE2\EA4p13_<Lċ&_d,
+xq99wEXb	Tnh {lH,Kr%${ɧ_:!@TGQU|8Qd.$\+ Mמ,*Un;Mܺ|V5|LY\tRzw=CJv~4C:4H(rU5rm0匵0_:[l,@$Ry~uRB3G*0(:f̑m踻(z-G2վv6uk"_EoǨƊ=7zS[=j>_Jvm~ucnq1hʦQ٢$!T26=ԜDeuݪo	hxRtie{=-03UŕZʬH1̴'>᐀,P1hPtfMEIJNLiQqAQHnXm ]
+Va]%V4a<$Xn*r5fzޖ̀&A9[p-j^.і[>*j)B[np&-Lk,2V]OFF?	u\hΛ<f/t;f+73|y>۝l(<41[*IǤB_N8#{J[5 DtA(/oT}\KqQ93$'D8uvPCˊ5-=َh,sU.5r[00j=2
+`#8)%AHnq"jt*tTzN<#~'CmWasM'PMo]275|;\Z}eawM^z'=wL#E>(ɣYI(J ݏ&ﶟ7L'fт$gR~Bk%PLtg5N:98L"L_<.-4:F8E2#(@هg_rx=kE+::t}?\l1wHfVRY^ꊃDPW6Y$Kg9IXyJX%T
+x4L HI,kMp=}}<$*ƙ:"7Syt1iL:;tkFw+ِ.Iws]\) V/*3K c/I0csiB;=0v &<|	0iNE2ʲp, AĘ}=|m2|rrA&0zK(b	dS*bEj6bCkSلˈ/7W^:ʍTVʰ*E3N8=,)>qFω?v>%1V%=2[aLji,+GPD;5yw20ݒ~	!ͧ	ӳlsǮa23pUM@]O`ZZ41pVsOhTֳ	R2US':y3:?u*m>tԹGAGMJBgϨe] 8KKZnQeOO~?}_Lte(&3~o"EƮN  ^gQ]|b_lotE7Ԁ*bY[!-l=-=/}"ސw@қl7:iI	){(i||z(+QEِl[2`Yr֛$}9<CL=}ۖ	9%Rb1 WQV6ʏ|Ve#/O6;S͒}\Z~"о[~Y,1<Y*-G)蔂u/:+qa_HI>ytNFF^OCu-3zo-森z;,4юvZ?_m[nE]
+[U5OϽi Tp{93ajhO(Z9ó_N'w.I1<l6Xwd(ƽVu}1rl)`uSay`7Du,j65W$6W~"*#XjTgV=O{0fXb	`Ve	XJcMKx1VEM)e?pVj8Ct47A 'g]XiLrVfs	ȑMݼ䜪N3W3Fyrjb1S'3VW9DV2,S|`<&`0=b7E_Yx5>&\b{h/9un{]q,!/Dg@.)ngOܠpWh0JkQ&ʹFpx2VC@a[[=~BHy9ADt'z"%*ʦn-K.ej1NJGIҀ @/;*:e]Dڭ/Fkan|a>Cb-,~+;X5bpBȗ$㲘d)P'{'K/G@~GeT83qdPanekrԜKީj\Ղ1|Ձ#\
+}I4wOa ^}5ӍFY]
+nkL~-٤U4P%A P
+$@mqHi@rGA--\јeSv*Cٿ|]d[Rvtߍ6$yM|rDI۝믓{CL֫@mcy}Z
+>k9j/A_UKS'pBynBN
+L=M#xh	ڙcF	jP?Ґ+>7j'ys 6LD~':6
+ۤnKt6ѸU+'_48״}v'YHī}{D7DUsIrމJ*P/eٮ.ݏk.V}|
+	SMgζM^1n@N@	RDOrQ4|fߋabj+/(`,bX7cPGF8N_H.Y9VX[-QpA"w&ǩQ^XvEiOdg9&˒&a7z0
+]+tvN',fh<ÉW f"^iCy|nbb
+z4Niab`ϝ [k"r9-!+[2p ʇhn` ܄EA*0ؖzPl
+rF\g5gR4U.n ^LY~/sw*jv 
+U b||H$Q^34
+ O9'VQ#)<Q%.Iuif4o9|۟kT/
+3wB*kf'IqփWK2|=C~Hm5Zч}H[闘T,jX^avV9|rnv<^L\`XVݜ\l)7洙y_U-eQRk+JUE^]GjP|5;N6?*b:!,r޶NCh,ɭe6VJ@)z]S%xꑄ&UHZ֑TE$]^=^`Oq_XKMs'6 .B>f1^xeV`+\6&sB*ޅA$yI yP$\YV8,hmrVnoiB:yZt2`d`T޳I!cĪ7LI1%껌\r9Jhrv_ci[1yWac_XƲq̃{Xs4V
+
+l4f|׍O?Nk>e:P"Q]"hsɑ/wwRB,Lk[*}̒oZ|-=R'N6R}]"fʟ;:G 	)`Z5xz.E]
+ԡC3b)(`cJŲBhxoW4%.nw=sMw\}ﺫ_\a&d,aQɢׄT{/ǝ t8ܸĵ8qx5˺]<M]By嗽>&jY/g5'rNfv&Xa/
+#IJ,%5!=ܻ2(x%ۮ(m<0@H-,,Y~Nyd`ˀڭy1SOGYi-(S7R;=>yxvt}><=;4Zџy^PaSACX z1	r+@z{H'ڤ֌!(6}~N;snpR !TMWg`"@_ }HzLWxAX˄*#fl~7"RYI/LI".ݭl ?Tyyn+Ǯ*8Yt~t?e=u2+#@>
+BHR-i┤^޿HSޘV$TVNZ͗G"򸄓CU=<SuR Ʒ0
+?MmCM<~J]Rkf Kp2]Ve!RCtBRZKTL;qj߶qݷ#(}IYqSoUzN|٬<,&|rGo2:	v@9nSCU&܅C&doU ed	rԤmpKC 97!H%/|C;E@$eI04|QLELs\^s{+E!hN|rfj5׽r<?]mU=XX8oBo3j>5k0y
+N'nÊԴ( rnM1(wPLܜSC,̩,YpNDa<K:]'tj̥E(ݿԲ#O2~BQ,bE?.?tǋ0kV	QKQ)8xQi[*(h^MS>uT&McYU*Uy
+#$Z(#ܖ;I\Kb	w*Qۘ/y>Qt<]R
+;Mkű՜>ÕGr29%N|{ew5CUnOS	㨘?j*~FCZJ~GhtI0NuJ	_~ai"۞E%AR8:jМK5!+ܖjufp)/:[ kbN.Y#%=t%P*R'?@gx LFS+k9J-,1RJ36zmq &k&L(dCo&0pV773,0bg͜`4#Dn{.4J +cEryk<1!K5	VILDQB'FL1K;DjRSD8.&0T4f"\C~5-v,e[b2~^_ |jQ8kW23z=tUYu{,Hu<ߖd+xRK[: 6b>)>$;B25"Ce6)RA6aS<g@(Yx:!I>]DdR$CE8vļ;`yיR#)JD1c[I+m(}l<!&8
+l5߈3ބw~#6?e~q?
+ZןN&b6-m-?Tږ&.9SNcPILJenc'".{5 p-<l=:
+F`DT1@idsjr.0$;.i(Xi<8L[vE90bƭ]m5¯pj,!F>TWW-=h+;aOΚ(zE5J:}K
+x}l
+PJf\>l| ӪK6< iwn1T+hwr#S@>
+)G@$ug˖b6'O_m_=N*ķ5jS.>zg̞R&`%,GvcA9Ǘ`0
+0xd-2m  "JV/跺0}m=)$iH_֫6h %l"x^@EQz1]Ucdw֩"=>{ryYQ(")^Y䞷`\`Ēs7
+ji(+ccJ1\&/I,H*'>*I"dU=!jqz̫[²r(R+Fz7kszGU@vE[Y.*Y.vȱJoV	Xq< \h	?^_O"<RXT%a-P{[y.k+ʝzդi@c|_eAշ2=QڥzY=~o5+dŏ);zíMmqM<BJ.DГz1o!Da F/,[\^itEp}T/p	.S S$^:%-ơT|I5xt28P+j`8z[VȮ: z (/Fp嚉w>W	8i{/@Tߌ^NNrWOyVPsqoTy\ >Ϥ
+QDm/m(5 .Uâek\: t,R ee>☯2K8Ƅӻݎ(>R".361gILh䤳e-'U4TOCZ+q5˯jL>dRG2ʓԞh(A??bE<ue\g3@/:#j9!DA/@l(3G~GMs<$@^禃	Nm&5ޏ莟xt̨>^ekb
+uM!;0Q2 9$`'`[kX|.fb3qEM'==@}V@Zs#
+pmf{TG; ǟ|>h!,I$''!_B9rq:p}M+E9]~Jj7]h	lOPǞPlڎw<a8{ʳ6\]|??9:ywʕh"Ѹ4AYr*MךF~pt4lJ$	bT%X,"VUM{BXOn5PMKu9UUXŜ҄F9T7 yzj")Yww&+Js@.sKiV+*r`@MIJ5&R+Iax/tKp9	!>")e:#	ґ(s8>}e>_iϱoGó)U'3~(.y\ʪ{/p#Bv̓qAhr֨DjjB⫠mRgiەrI>OVqs@FT4}bÅ~MsvI3"]#NѕRʸ:rf]=Bvz^臅ock@<q"2٣TR',qJd+#/(DTial,G$,czTJ҈L圹<~\/b١W3.30֣RP*O`wGbjiaP&v!mỈB(T1fF6$xµ;\=G?<Knaj8A)6?ڧ(j|>n_1k΅b^:!)|`PDxeLiW[>10):%Rגg2PSa傳a)xҊ|8mxy7'lP-<м%vELՔMq!ZᅇZr_u<j]whu)MiynbRu!`F*<K5Ó;ee74,wT-=<.m2gGMl=>w86-Q{i>鑪@FABw9'{4C3^5tH/Yl[=? ȔöV;T|cXsq<~V_v˰RuX;PƩ hKZ4nzNq@S|`=}zQ:<34gi\v)beC@D.)0:s+I&G%6iS]o縓cpL^P6C&&;VTʙgU:{}cWU%AcֺxIzFiukSkßh/ƙacKILHߡs`:<?T<.#p,ݞ+/Z$TXKt2'=C'UߜbΝM}	/=zL\ čo4=,fmd -mg[|] 0!ίQ壊/eĕCp>;zzZh k9 \\ԺeG$Zy5i([׏_<9~7/ta֎H@*!<  ,T
+J<BÅP=#}}HȤу~v>]%O жbMb8b$PT!{ςckke#.l'e0:ZtA9֋SȪDo5ܸ8Z*w32]:[d7	dUݶ<7[`ͫY.>@l44ңzIr>p@[dUdK*[`;ܩ^Hwl`JH4R*t@
+tF?Z~~xnK(p$w縘VEYLm 'ơ_}=r
+V7r2a {rUyHA):nSl	,]>z¥*):lkM7za5mĸ-=dS`=i1ǤJߜ/O{gВ<ibPL'S[%SݽFG\,w Q><з-imm^ч@<,L÷juc~9>1L5nޒDL,n0Ʈl-.[[ᗵxv0CK4_K$f' n#E[^֜"ZTb||9MpRpޏVi[Xz	O[ϯvy"^To8-[vw*kUX3}6G>͜M3p=WiÙ/3D4iW$SYGĉz"q҈dJڳ(ށof˹7H⭬s	w;6
+IUj]ÍR*T4z|emx)qc+C@m478ivm&wKVrɆp?㑶GQD3׎6ju:8/A4S1Kc<U[1jDeR@D\J\n_n,lC,rr!}L?Ѩc1fL#k|?PK    R]̿  .     pagekite/yamond.py:s۶%!ʴ|LV}8NuRǁDPBC
+V3o$Hq^ݜHX.|A0^pIJf\lJ9ӂ%SK%*Fh?j<~EhFrQi%n$SFz9e*ɪ$*` oVUcAÂ2&v%$W\uIU< JAÖ$MZKS\TЩEXj~ӳ32"@#H{Ea{>rŒ&	NjSBphx4h3ZJE "l'ZUe]ҊqRnUyEc^1F1و(*q	+Dy ^ˌURXH4 \#$Y%/d-zZygL t׽2+Ky) =a"k8{<Gn'mQWDpQnv]y`Th!V7(ȔZ. (!_y7N.ޓN./O.X0`Bةh6Hg {$*x撜'wO.wo\%\11`.\Pł)	<@Y]38k^-!	Z9}9)@}~Z(:>8Iej~PI~,ŚIgu 9c9]@; b)$Ӥbj&[>`ْ9P#f SS.ݯ9SA^&/$+Ն旪jon 3l3FU ,u24a(3MqN7AqOgNl|n0&p@`6_lӟzu8|>'OqG?O<_GO?۳_ƗW[t!]ϴ:@50McyaHf<s5UC.YU|VbIIBҐ|QNypYzH. |MQ4V-c-HQmyO~		aeу=  $X~|0uD<E4J"B	@&y=SZ yco1i S*joNLELd,^mu#2픂` 1Qяĝt){Ğ__j6c+erVWdbC*
+nI7l]B[yY,ixEJS^r8|?6Jc>X9D5D+#mJ~z	 %A'`&+-X:{9#zm1qZ 6">$tOvHLkw@:SW+HWʸlr21GAH#CHT
+VСr	@@H82Cg_CWM-op!zL?<{7VI}¯}慠*
+yi;4/Xu#v~v4(LD/feVLXt4ƽC3<%D1?ެ:\Bg+QRp_.7|5@rS,fͬf%	f)EJ7׋8(Ǵ]f"ngGj@bs0K/] i{䏇9jK,Բą?-}oeb # *􉯄PeԿbE!$.KIWT-G56fA2 2Q*l=&lD
+VtZZ]Q#vh`-X}T4lS$BX$*NHPХyAȕ:l	Ø"#NEp@膍WP}[2vί*}412<3S!qMzqT0̝)Wl"i	틨,.35Q0S@la:~l:	}24ӭtq $o&0c5H;.oo2|D^R0vB炨v֜la-hS4xLXԋJׁyHu<$k(6ư| ?榷T7TWSPtx 
+ Bi!6"S؍.])h.KoiI'%6jEu >سvlZ*[`nk$6Ubz b	z%T"JqٙzIor$ɻ3p3fvʹiao~O\1vjof~牓3Z0
+[(TѰ0{Q]tݜT[J@"M45ilm0{)ౕSwn,`8 7P7lCʚRb4%ʛHZ2kwj9@H7rXʥ+&@ۥ1ۖIik*z`MfZ2qSb/a`	8(
+)f0Į',môӴcq~b2z`FCoKOBMRCO@,fUǳĨ׀i{k'asXw:m˴nc)"ff:Pa[N%̝cIqsJK88aaӽāV_0HQ1B_=v> sZ[wh[m*$hs5!~^x'z(ՀLP7nQ4th[nn|.ڣog'G:nx;y(j4laoC]7R;?[	;fhFZЙ?j`+DgTQkpK
+0Kc'?<k-|T;ٞh||^ ӌndJ6Jv})9 ?<}<a()J@vޑUX^FQy'H7^9ipػv@n
+C!̥Ĵ~YR9oH11ope'}w)'T;;WB[5|G`9mP[}YU	W{s[;xӨV^+ȽZZ/;/TpsC42\xv2o^faOjwi]I{1;74
+_0<QZ&itɋGVPP¨[l=oh7fQu[l86&$LPT1,E6[}LɐJSww-T5t{LuM"B 4P7A5(("[L(^h6y__ZFB鎢︍R
+=,Ў7mu5udVFmK2gЁ'wݙDocqٯ%(^W=IH~}醽 ؆gM	|fyYc72]?mnP207qgNVCVyeϔxE\9Tˢu|m{l:v]a㞭vPuGQosk@wM?*	#<$`9X䶦Е)qB&y3_
+~@tFGt.Pr7n66.k߀hp\F55;a<
+2J静`\02З6)kwZ~:=[y~-yB]A
+w_ !yޓc mo$-|uf/lɰ娻.Cw_ˏf]B	[1ZE,d#^ 19tIy:o{u!rb=g8,NZ?̅#7e;1spJЍ^ԯ:x PK     uZ               pagekite/ui/PK    R]dZ_  >     pagekite/logparse.py[}o8ߟOQtWdM$^3٢l5dr!)Q<F3}gϞuN4PLY(*fR8 *{*"XY(	3n!Yd+bAlqUb)ezʠwNgK1DbDUTeɺ{ߴUFYgiꜟ]܌PtxQHOYO;6BGA,PE+qg_rw_<:r1m`I+FBeQ	ry,ẐT2US&eіi(QQ|h!~$I<TA"rqd@ tp sc1⛄dxmW2dyAA"[PE`(q. 6p'JV2Z'}!0Ug^~\|OO.n"cMjL$bl'nFwgg_ӳۋMZ۳Oէ˛/č0_#>\vBYq/8NʒP,o:7Qܝ ɠ~M T|}gH/]իfӵWF^_֦Qگ$rLoJ&АW_rZ/eS㎰aVlWR$3h8?.R)<Om=/|!دӂ0lbؙZ>grUyD9)@q+m:g_04}08#}^7{=:@_>zOCр_Fw_nG7x/ppd?:.>^\~|<cl^]6$u{,D18XKw0Z
+DBAS$8'@$ܛv52v!$PO4ß@?rcLcP&xVg~πM
+2׻3T-0v/$TF^$k-(4sae+.}D0}0p8|ƻ,,	\03L c``o@m3,mŹ9(&BnpZ!ѡ)-49ȡB甶2)NM0| U5r@H:ϵ]t2K9$oDrAz{xJ4r|v}B3B oŠGM/š`r1FXXM6UנcĄ0$'vC^$L.)lmېc
+|GZZenS`6@XqSKehWA{%i}βPzu[sg {%)%'Y3x7BP!h7S<Ih"PwI6Ẅ>Y8/d͞X"\кȶYшi<9!ZzFԳ	1di^"sJ
+dS+E"y|Wx~6F߱lÔG2J2w\ɶ䢟S"tf7qB7r_cdO\aJ&yE8eYBAPO$
+6RX6f0Y9UG^c״i(Rk*`K4)LD(KqARz[Dz270y\S	JvK
+y0CI!^C4k!V`A؀͕]?Q+SB?>͢4Xʺishdd?]Y`"eZ:̼\2~r@`U #fJzI|늌,,ʧ7/
+}y`2`FI'cpւ1U|94ebڍa2k8;Ej&hXm ' o:`i3.CexN)7]%v%2
+Yqc[91pt%Û;*TpTCp\>q$DCS.<U1՟˂lXiw@>Y+U=nOOHNya>J41l~rcڧa^dr3-r}Tpڡ^I6@>,KN
+݀{wE>eS`5!|OX:emtq8U+]:a>zgc7bhwQ+wfxL܁?ji5*@8Tx<Y<,jq<DW&5pM8{MaX	<*Z }<J*uAUFoث!]c9]e1MJLh0ԕ$vm6L<^+8!Ŝet6CGȊܧ
+CEGP1"V5TN\HiYar؞$uW~D*=$oz^E$J4RRoo"zFK|\Cz9A	7spcĆB)p*k/|^ο2OuCjTa{z /Jk'(ӽ3bBbl>&Æ1Bi=>=/5m ',6( A:@4
+8C7`O
+ޠ$6tS"۠ݡǮY/);,rmli$g88pxaJRW00[IɖXJD&Rrj>5~w%DyϾ!lL֖褔/]/3L{6E/fK~ID3Ŷ8ejEʏVWf=[2j5V	D;?$i0m!\5C_3kXN-.sRa.aqgς<UuU#g5DU>.uW,om!n\'x94a[\Q1e6y:m6ۆ='TVaUikWnm`αzl6S=XJdzcvG"f)d$0B@|O#vzJf9	vm}ˠ&|k#qY5[z]z[bw-نի/^᝾`s&EfR|3&VHn|цaѹv8Tsx5.IIwH8hI1מ:ږu+אt/d=bJ鹧I6mDpΕ龜3n)p\ WfR)%L{#Ǵ,ߚb±-H|OW|2t(ރFYdOiYagc<2	HR:9NUAy ]<&Gc$px2L"DA0@~\ۨ|lJBދiۑ^L.D2PP%ӽ!l#KClWrvsi@¢\TK*DaP^٪yJ\ydw-wg!\3-4 g&|R7HZ)m2%K̜7SN+!ů6Ӷwc5BG-uqhE!D15z׵
+"Yl!lO//?O!tČ\\ޞ>`Ӧ:X2Sdid.U]l
+U6:g_dȷe<gc:uG۳.&C11he65XFnlǢ]adl? a1a5+}أ'G\ïNꕸOY<ZR2Oϑ̈CЈWŴgM.؂$Ϻ.Xf[pW aQN)1+E_J@8	+N-[hiph٥ķ.,)<n/&3tu|< Ѣ$¥Pl)@nACߦ)c f+tU2x|jzn7@(O(TguXe/	{lrmJYDߎq2.!h5	n͔!ܒCnwVen<ۘaTk/=7TE=[ w4!7DVӨj˝Ӷzg(iNY*(מcvKVK˸y%idRZ2u	RS2z3Ɨ+e_fِkBOdv"qe9^o*B>NVJ+52f^?,3]Gn*Q>D]vyQe|Pۊ`p<+?Nݍ'mq\]t0Ld썝6b_Do= lE`͏Zf8"IN>Ǽ/ޙgU![:E=hc5򰼤AV\OZ&ŵͻ}zδkᲵg*<4ˮs7(<E&,ڏ{,^xt!77*:6회2wM2|ǦM^^̋(3	)rϕtN/g}Ҽ-^lqQk^*|ʏ̪4l0nfy!YȘ{5S{Q\hag/MHkp&p"e{h}2( [o׊Bhva: n
+}==}'v){b⹊Ŀ'Q;|-
+1O q/!ht}==[ lӇq` e/"]Wc~FW]^]rb|œ!~>?Y(%MZ { 8DƜUPDU+Q1BJGIy݋YݘuwDFWhװk٧;kkʵN>/_L/B{)ĉ!-^"g΂F	ML	ɄG0u7p3B4wdn9~iD4jP߻rj谤Nt7A#vzV$۬l\CDq^PK    S]t  %     pagekite/logging.pyZms_NU6@BgO;ŸadX@AhV3+iq)ڳ{Ϟ=|d{ogbX$in
+96Ϟ?NW}7oH%^ @=ˤzy'j˓wv(e"NZ|'9)\"gSSgl8Vg[j+qK)8S13i< DR*+5Mf;ZdS{DE!&A7\2y4d"3-EhE/T),T}\$*L Ž5M[(@Dy.Ԛ wqQs^38I8j~I;)6Z6i(
+qs6|wy=zMo0]?b `	<ΊQ?8yggÏDu^DO|g'罁p=pyՏ1`?/+(TqjԠ,E|/։LAW,&R_ũ&r}g3"Z|^-by|Fl|<5(ao*IQ>}"SE.)ZHVD)K7-oISQyV{,[W^.Us?26ŔlKWF__]b4N-nGc|~vAmo},W.`ŏq><s5Yg?_\2#g?*gpA7:KgD	Ybưccw}>j[
+?<!Zd#Ԇy r] ޚ5 UtahTB2dOI${W '@SvJ:D:FubcՄ+&XQ4!L_dϦ\]}d #Lb7$[E+-j&yT|,+5rsrt'sXB&∃lMښK]	%!. (qe 
+Hqͧr]yKQ_;z·:A=Vs;*?K7go.o$v]%'H{: 5_t#_DAB^͠YHCQ7w5+S[\d_bJ H	k-5	\qƉV>m	?*ԿQ)FA%DE+p|)d?k-1.\G),/сٷr9k'S'Qgӆvǯ??j#/#3anEyU\E(pcEFsW&Ieąw5&&EC<P  ຈXZ|$s!YGTt!.Z }%ͰB$^^յ#+,>JNj-˔mFd6xNVLr{w4!0RNLArv|";6V:5'R#ҥT;iV@|+h)hliM>L(B(Ϳ{*IĴ谖ڦZl֤XV)A,MXֱFMR|=,WwM>+`ieܒ}I6wd9ϩ)("J?09yA6J@[A3@bAjc|CRHd!K aQ#*zvGUƠ(P9,:#˚{)]t!f{.uoxV|mH
+ZKP VEP챏ē+HT3	NUI 9ZxaFQ_S)xܦ"D4@_~$KLg:gQ?F	3f0g r^Nڳj$xl_:&<@NnbK1`#7vͦJ=Bl5W}*Ѭ$aBp33s3e¬dXfh&12Rxws"q[iV(`FXR|#/OsNc'I2Qel7k
+<{HOYZV#TrLDnikߧƊ)ئg6ݱ~Ikᾓhd"}IǷ2MFbG}֤.B%vMеf[lU)3d'9m셭4xqf?+W>N21-|'1(H?R0
+鳝bTeiI?<w+V,>C^q4x#.tK㹇'ʜV$`mMlMRZ3MLKlbRW=8THh#xJU)EQۜ`d7.ʈc*&
+crir4N0d8hDգ%`rۤM}W oBb8u˥^T1a,khBt38rlxf~}zc
+}bcmwTC\K>Zؐ%t7ߥ
+y+lbVMa%AB,GR0m5ζTzhE*icw5}rȬAsE&&PӠmR*Geދ sK٪qk+"Gw35HzsaR8u}kFX9lM[@viRUfOƷ;|٩IcIyԬ2u/ťUhdu)+ͷ4XjSķs
+ޟO7;WܒLcd57>.R^5]d].~ʸ/J{PqY.,Ӯu{{4KRdU}q\8Jӵ/ S9#"exӟ*)S~S	ǔ#53.7:u&9#'9˿K]eޣwz0n SxAG`nǸ_	YrLMƃ'<V&2L%G> ݎ NG<Rْ:WLT)J8J/04YIJa_qC2밚t[LNTS^N8|1MIu}sSGg-$Gmݽ4LAb	<[]V2Rs#s
+^j2e[aHҺdUl0Uzc^}A,߶o盹)5?2O_lpy_\<ZUpg7=ecePK    S]$OR*   }     pagekite/manual.py}[wG;E^ Ñ6ErpeOP	BUu]/"3낢H̾iv"2#3#Y:HG*8`*IUmƋ
+/,xfeTI4W<"3X$F<8_Fᆋx#iixdrLV]E?AN^0^x:rAJy,z`j&?_^]O'5o*`_o^yo8W#/-3"oOŋe譤G9zz~uYF@ SvY7jJN,VUq{5Onyzy4P07@`QdGC깃k2y(՚`^Sӓp"<^ġZx
+ZruL-BS"tzΟwÃ:bPCk *&pE^D>d9ЌP2/ [}ZZdR?&Q@ssfP:	2בʊcz/M/*aӦ
+
+dzKMAy;ޖO^k24qL7L|tssU0tVν4^z_[xCM(a#ƅ?9^fuD?a!+ޏm	]6* ',85~W$MSK+ԑ<N\%4p}q$oW+ړIdh(G#Gc?j	rk@Ų`D/%XơOӪ'Bp2<Ƭm7"^?HAa0&{`ʟg~VhDLIp+Kta"ִW{/OeZ7F:~<6HIPRL` j&Z$sE5,Gy\(|b7<3k^i8Ra{XqaUϐHcj3*f)՜$i0g98Wa66 cU"- G$CuqgtO
+Rza= 瀶 G`Uk"(D$Ѓ$쉑];Em0TsVC?X^ϨV^$h2I,hHoڽ(<D*a
+`05`ɻI2(M̈M:*ӉGD4wT7P_xI):DD4slPoX*(QR:{7Pl6KF}Ffd#k*xЫ\XȀ;c|#)'?<~ On )BY`O -;zDA e3H,@`uԚ K^>>(؇Q 96^3d]|n%BaB^HSjŶƮSH_Yve&YfEvIbCBgf2%!&h1W,DR^Lߘ漅6WBaeH88dM^*y@9묦H3CRӞ\}^	(zDw`?B(Mr5b}s9{gT{eĔҺNocÀ݈gQ]CqAhǘ^{B/ȶNiҟCUv=L<&̓hi^
+ DzBF04f!a.؟%.ʃ6(ɪ%~|WL]\XeV<m>i|aw>4v mb:>	  T7}{{~1=o5GeM2-Kw-},|tz׏AOUfWe-no."$CWW?&% eYAM/&/֘wWd3,aPx i
+/z&1\䩁H0LY}uua2U`bmX1P?'Xaj`N~8W0"rQFpkIT"Y.;Rn4&j(	k}}iScYP
+^F>De:axν *Q}eYp۶:}cWYTlt3y̶MCD&3Z#Y`aI\cpX+x >"Ґ sJ$mplR55aqԕ!-&A[G85Q7!aj42~x d1y`F
+aHhq^pV]%ϐ-Pj2_j1NզEJ4`
+|b(w^ucJF5؉Pli"u_B$R"|}
+֙[y!#ŋ֩(4t#xqۀ=6Fx#4ǳ&fkM!wGVWIA ru{΋9K0T,#aqFLhF*3g4䣍_j_@~-b$| Ar׾@
+D%
+s[Ovs[Y폥ȚO϶V!Wn6NՁ0=XbJӷ1\uDU0\e'as^:XIBlbD<΂|WN6%.d*BKGfӓ>M9iǏ]^ɰ~2w],XO4Gƴ"ގ9f&3\I&W'?N8|gABش
+XUNea:I:Mx;s9M>9}BqM<L9={cb#hU\{N=X^1,4> JI!$h,ˁfgC}6|X{x
+eAe;
+3fGqc[ūS"խtr9!;ӷ_+~tV&̔0sݸ`_%hݝ惵w>'jqg(>(t-Z1ԄØ.)˃+C9Њΐ8(Q5b
+*v>	Ldȭnde%^#/Ihʙ\Hôm$8{C0IzE/$P!+ܸ4"A	I"XHwҖ
+8V~Tf6d\#
+Kz7vXdUHXKF5A˺4ǥ*
+~cUebGvSpX^D7{L5Y]66~CD^*Ӗqoxn06̒;[ӰKy p2dv`398:bMf'XkRJ,)Q]Dsn,p`0}>sX&Nm82odxP-?"f9M2D%Vl/zohcD#P@*a7G1B1K$bW;?*;0ŢYLm/uzbYp/3	+ĺ
+U;Z{u;Y?Uj{t8)m:WMAj̢$bDKj$?Vjr$s KAV8ԁM
+.2Yw@O1.sa2 aC%NȆo6|ǴJt>,zxl5IA/Qb))hKQB{dA0x4dK1}/|6Rw,0ԾVna.l <d<f[@_+ie%j(\Vm
+koD%MB{Bn\^2ѦJ+^Xt^:e9Oyj	
+P]ƅ!]5~ZȎ`v.#!ag{e&NI<-J"	UR1ȏ0?+bRc|".7?ASÝPqW.>.42Ա(vӰk{xr6d2,URo+*Cl`D1l_
+XMG-0uU[DV)upӸ7	HڍTc&_yG	i" aYMht%1*C,^%Ј@Tk %y)pQGhTc"W2̅o$H<PssfZXt?dV#`*%;pC}86H~r錅WjzL: "`m4Yc2ٹomW/bls5	nC'*QҪ[YoCwAf?`RJBzj1Kֈ'8gX7 s&z8RGcsȡl nT+l5Z	(/d1Xh2?$8<(?mw"[so|n$ɿX&Wls-r9%V mt-ub-Վmm_ucYyfxI%&'N@GC%kM#\S;5Lk"6-6\ry^A,CE@
+rdj!
+ɴEIXiSA8ZT,lE\3@@`"lydY{;՘{r}ғ5ҝTᓘ8p`"MOvDg[mR=pك,ny]4Dy;ϢF)3ֺwDK$"bIR1=(4ee2uJbk1ޟjFPքU]'PAT:'4Jn&3;7ֹ/6`B.!lgN}iSMςĉld|͚0hm܌7:EgK-ۜo%oʒo{KDOmȇJ&}#?4"V1a)"ep4(uDoZ7$DR>45HRIk1#tDcpP-phID"؅+`I;-8J+3-9_-CCC uk,i5\AkDxnGE1g(gPP+whUo'[6wrHsџ<Q,l)c`vlX~`cԧAZ(b$1aee}t,䶈M	_(MKzIMNԠsHhMlw2m}b<WPiGd]QF[˷/ rQl)J1'L|Cba<AL$'Rv/,Է]ZQT_mj^:H	00N1qμEnO<fFj!z;Mj(n';Q1 y1Ws+l;ӂƆH?Vw䕘9Y'cnxCDB]'7L7GM>EEawZv1M I/,%e] l-k݄|e/x-ʹl]zC3{B\*oe_&@Nu~@TɀvSϺƹ12S/џrP}ȷ4KxeXGWG8Li?k-^lfelXBp \J=N.Uw"ŁhspTHN*ODc<:$2n9F)ň?pw#j#e3R@e럆>? q4+r M(S4iMpiD&-&Ë3Í#ϓهFF#N%o N(caS-7{TL|t,ޠ3G0G"P8"Af<j*2&ԡ2'm"AJ`<~VةU*dжiIj 	dzzu;%ۼ!\ۻ5ZCT5B=āTs6][d`q0v}ʫu()? [ X}&lo4	dpmQ	6(}fωޒw0eL(E<_gSPxUK+1δY3X]90:_yp/MwX鎯-[2./y.^΋coPDFE xI$?:|&2G]ԥj~X3O$[)hw:ZqxV}OD]nzk0!6#@c.3ZE!lsP#pU6DfsgyΊJn#IJ{wBr*b˿9^8G}^Fm	UHXFԃ^J	yVirb\:]c{$&ٓ\/Yuǣ~%@&l"磙;YҘ	x t#ĝi Ԣ;qƷ91B04!h$D7Qbz/^7;g,"vB)8m5KfkoAˬU]HB6,1^ăG2')*P֟_,ȇ- 9y-\/!=5ft8y57-kÁ?+2WwkJpK,	
+16YJ0H.
+	\r\TiiXwF
+mٓOP.G<=5sRd9ٍӊm.qJ*BsRnk.MT-XDꞣ*'fuƖ XYry"TeR8Fv׎6rE{MuZ
+]xwҫef\<ӶVܹ5'W;o^s.HA̦<|׷Cw@4Ko]۳FC̹9aXB`=A(l8b(o-D[*0 >rTzFj9ׯ	b3mTyC]WYd/1,: tt߆j蹉].V2Yl\)L,B6Jf#Z+'*Z!sM-LX-r{/Lݚ;͌x)N4-8$,`KY-!'b`!8Dě9)";{
+Ћ&2ʨ#{b`y;ô$Ety5=;fp5+eU@}fV3|&%nD<G/%"j%"!czyiR={ը1ZP-'D	 ֽ9R\"N[2T=m<hj.9G}-DAZxBnJ%I\I<R!P1 XS(㪈m+XY&m ve>1+ϿUkW/"-8oiybu}m|UD!Vq3#ܕVwfgh\fk
+X[:5LD_!bWv\"z8#~1Uf=n9zKdy-*ώFeH6SkQg/SgmQmb	)tpg !JK"L͎\\XJ(GЬ]ehԃe|gD3ppN.jrr0=L16<okїthYű>m`d@Yh!,IH"*r7eR䥹#q9芔pGxͩO;$wvH*CL/)3$92g4ʻ6F ڴ>lő;jϙ	rbn'Q^SAe"]i~-fuֆz1NŢ3WiU&P>o>]y륫Uq3BX9q[q)5pcdч9aLH/Y&<˽*1w%ɂkYp+q, :ƸK{-vP~709f<\VNKt]Юa8`Q!6>M]#smPa^9qDp^Ks)	wf՝pFc_nhY*zi5)ضڕFE DAl_xH>hOQhp]Z|5;/%u$CtFT)G"nnPf5/*dHw>4#@=Ը\nbg2س'gw.V\}whwGvB4^xF.W5Y./GMc|˷B[AG-ƛG٣Ep)!}.(VKu-x = ٚMzd&f2d  &o
+@J9Iy<u'8ZXjXl{f|9\yWCcqS- pvsڏߞ_c%ûd]ݨLOn/7jr6tgTE4v1kw vڈ69䞽ջK:$}H]Ӎ,v;\E0NWPdUm/9&ZG|}/5Q#i\%SV.Ƒes"1gk^l|1 ݗ$,Z7G
+ZNnNϧ-_A0hcx7л<V,!3Zv57Yϙ:xSH	kwrMO0^>xʶ0ӮE\85?.=.B
+kpdId~ZSm.ǋ#Ӭ,/0-A.o7KjM4 eҴ:OmZoOKtFZ[{E?)T;}CKsomN\6ٰmoM
+R]o=+\0[KNme'Kӡn8Mxf*VNZ^sc/	fA!⨱hkHeiojOz67wU'ӛ'xC&sm8dV8Pݝ깗kSy"(W	;ϴّ1y..8rqаgmZĉ *TPUΈpw	M]59.䆏	 ʳ)7'b ;KϢ(p(&V){RC##+eEgz$Jjciq9P460=:F|wk6`XRR%B	ylx/=VM365QK{S^*.;L_<CW΋Vjvl<^ߎ~½H!
+Ү4۝Z_AslP1;!Pk`1 NNxLrqk-:vwqYô1GM"	IOR7G×G&%.1Ͼܫ.W2թ,?J%:TD?ʻQaa]ٍl>?.n/<G{k!jK*;TۡQc=Sps|lݿlz]p~y;Y'*͛7TsW쫃o[n
+[NkRYNW Zf)85}S)E1iS[^c۾8i,2<Ž WbVܫPM%-r+@뾽Rgˋ8|&rlf&|q)v(B0GF4%e7_pU)xM*=&G6Ά:zȀ͐wu{sr6;.:yLNpP xu]6$@2ķYlӡک	EjscI貒F32:&_C[FDÃa>%]aF(gт~-`}DBD52m'iqY˿_43z׶m8i~ZOvz.FReFPL%Vލ*/Ӄ13|[<	³M <D?|$(,ף'JR~8.;VzrۊNZxzqOdm+~1)GZ_ÅWdee˺Wy7$U>ūyFohK|	c ?[EzDH+pVQ(ZzQiaɻ6~{Fw2wt+'  fL̳Y@5_MJVșj^=1~sP%w`_B.슞sDGz/u2xod<՚˽y PK    ׺pQ{N       pagekite/__init__.pyO0Opi%(
 (R/Lw(߾Jes?#?L*O(jQ)M౑.V<U.stNt2jAW/ MًtF!ktHF\5<+Gop{iT>8k^rlTU/$'z@{~rRccd<A2@k*.qeP֌@N<=ӛI6}g턖f26f5vxVZcGh=U|xNǧM!qūb{gCmyNtURF+f;NԿlYLmHUb!:ΊtY֛l']Tڳ-_g2]'kݓ:1Ğ꽖R[s[/`l:n<>uJO/>1PK    nZV!        pagekite/__main__.pyYٮȑ}W=vIQL}M
 wRܗԽ]vt)F&DDfhȆkݩ^VOx!k/`[?wM5~eի醝M9{RDLvX?6Yy&_ y]?㇋TEuM.J/;wTuu3vl}SC{uMyqE뢿f^0.lx<4ݮj,^߂z[1D]տ~x8fGuy6e,>yOpqٌ {~EvS~|{~o˻]z?'`
 s_~/Й6/O
@@ -444,24 +508,25 @@ _
 yX{:}nPpV5Qe#yҤB{:PVIH(!Մ+񐠷L\Mi0Nɴǀ r"gy
 s%"nfnyup<+@RJ=^Aƥ658GW!ˍ5VPT1U)1Ux
 x҃Tkڄ9GgvI|2rGK蛱+{^>?;t/wD^j<5<}wdu5ub7^-75D=g}H>pLo  40
-A~:rK#R nxc O.ItM, .æ* 'vv12[9~8	jhG3G>U (DT/=DDLfC?2ElY(ɀo7M'\zBOR:6F4zeۼN/&f#<<T} j`V4<e=U[s1+jy8|@zk>th{f-0%qOZIұv|c>;?V0%N"G7EVC4hxYT1Se:Q{7z[>Αr*/A[Fk@ݵ!9 FOU)JTct1ǲqyr(`k',KAL".RiD挚sRWjfhj~io[PC=Q	r~)oo[зV1%shx&:'p4rVx!r|'drV,yZnW[61@TXmoO S*`{>~PVМ!'?~p0ɭ8KunGc^%ғ	bRYc]r5 u`;8{\|6bbb蝔4` OHEu!ɹ_5cdτwډ#pڡg.(ܗ^\Ilr.LHw^<DRjڢT0(˞#kȓi]yMMJ.oəv>SEeChI/V<O~g8PK     tuZ               pagekite/proto/PK    V  
-     pagekite/compat.pyWmW_1@\w9sCy)/Gv&ʕ>vٲ{nbIGyf͛\-Dfnh.CVZZ&r:eyʆkn7vrZ6R& /Z-(-41RiK"1*+,8z?#A44~;3~&ˍaEn[>sjӐpY\ҠȅH1*ZʹXڵ|JUP*r<j@sA(Mn\:pZXvꏉ:.8g-2-Lԓ)I@7c<d]B`XA.[뺎OZ:5Ԅ v/ǜ%eQaxZd-"uGnƣӿ`Y\0,K$; 9Z丫:|Q?˛u3uǽ΀nǃۛa=sHs0a+dk#e$ˊ֔
-z	Jqj_L3o&6Sʕma\.Ou8ˋPAVB_iWe٘2|j&,t$DJLUކDI9YwAX^Pf3	`yi@S?J;4 RЋ9	Oq}9D3<%-$t?WT^_Q˝C\U|щoTt6z6OgnոT11O`Z5.pN X_,?j%%lkbb7p=n?\|sҨ5*禋fy@ag&,vJbXSE?S}#3D Dl.M/2U$AXjv
-k+sqΗ~~.gݾt׎O]8C|M^U7	w^R(Xx>!ܼcmȦ*(mf(G ܺ֠X.5vy) /Yl,.!CoN܎+{{	^;\p?|㏝Pp[0|r\O39?*Э7*g7CHNyhZvR$'_'X|2nC;GEĚ}eZ[U}Wrۍ5U6{Ss٨b2k'?ByKخDVsS{Zp-~3o_K8zCw@)FOA[Ƣ9DRByhɚuf|䏔#)eÝOjv/0k-K<QP#")O%pClHвD}ͮ圄ۧuˤsT?UM!Em̸eh/qԢ?n&_ĝ]~//t[^wݏ"h;j7iN]O퓇3gX)9AOw("v.pL9Q/ޜ~wg]}-ޏh<ŋ
-W~|ǟU3瓻*('0ؖtփn`vU#=V:b4Ajul"aU"^C9|U0hϝQ\/m7g-l%znyߍvߞ
-tEL[_*2{h乺CtS;'0EK=K/,-YՏ:\wxܽ:m@Ueݭ4 PK    tZ
-       pagekite/common.pyXmw8_l
-̀!4d1`N	fIv9pc,d'af}ɼNtwsޫ+H'''FG2Q"	&d1I,LHLrØ
- 4MRF#,b.BǒiFY0oH2BFSS|C K	fkJVI2gr5|/g'ͧ( nQA RԭWCiɧ,yJ|&LD0$Hd`Ti4aPV$L,2Z5Ȼސk:ew,bOanH2Bas6!㥞׆`eis$Q <2!&/ךVhe4Qc5sFHo晇o Ҙsß9SdH*4˄@w=ݓ;uw3d90{d ;{q5F׳"}:arIm2`L#u 	fLXBP{S²pB!>a%>vz-mАG3&&lu$IHyWӓ9RY5 d/c:eX	_[I`wϹ]B|]0~<7/ͺYy:G1OMf>!0#TݵsrAIHlNn&:죡]K}my,yqc4G}nw>y/W} -Z3Y gW&(P6ޤ/7t_tZ3Ҋ+7ӕ-()"'՞OLT
->%d_2bY`sieY{h97VM.lv
-enR0lzfL:C䇛oE(bsD.fi26Sm2
-Gh"m_h,6vylEZ-'8%LSuQIi&I0|dRdh2>7ErRe_jʪ)LErR>6pA݀Hnry攴8QueIZEJ8'@2w!7lq̚<h0؇Qe7!2k7Bc Ր49jv}I%GTS T[x{P*Ժ蛖@|Je{mOZSԦ*Ҹ%cEIoYS|JMU!-m؞&
-z1lmwtc|^_PluA5L_
->z{]O`wkuW:t<K=B}Ãێiyp]4zSB8|9UˋH
-W91V v0m;]_*h69"HKAszҕJ	aVkԸl_tJB.*zJ_=4p>NE4gPw#.`[0R1fyw,DU|&	I(b<}ELFA/gL9<Q5
-@SEdXςy&&Jr7R<F7jQ..0eJJ? mJbbI..+jdDJFŹ{-nY/.ʯj%,aV+J.L^h}E.**,Ob*BM'S8p B:huMakfe%lR3S9B	G*IM\UJ{Wu?:wX
-R^]C0!	4|Q}wέibg7*$uwvhA=%wAc)kFZBG;}Ns}k1ӸiP<s0ϘJոvjn.Tc`7]]B.u˳2䕱m"8Zk~r"DLNDՍVo#dDwE '徼H|OD]qwPs"뺶Z~i8AL؊tzVܪ!hGɂsz׊#z@iZA+A{W#dve{sVDAT/ F;%2Eh,)79Gfw[~t¼I$쨲MKnoh/M'#JSٿ,b̄4s]a [eoN&>7=yQql?WX^ؙanghݱ?Я9Y\kE\Ƀ%\df9޼[6DX,Sg̃w-W|PS>6&
-/jUF+*?*~h~QHX+4يngeWqr"d)SDx΢B?@؊|wWQ=,?}(/K&K^@@(8%r0NO%YU;>i,.,^dTlH\!z0il R~NVpWIʌ_6e'PK    V[&f       pagekite/dropper.pyTQo8~ 	B{Rh[hUUI&\8R]Hof<t:lUI*4బ$w	 &pB[+T.qXզas,OCT)$Z)L6/DR L)ʛ3׆;U:$0]Bg1X-kalΗ!TuC&$D+N;tF_P51"/\_^]//
+A~:rK#R nxc O.ItM, .æ* 'vv12[9~8	jhG3G>U (DT/=DDLfC?2ElY(ɀo7M'\zBOR:6F4zeۼN/&f#<<T} j`V4<e=U[s1+jy8|@zk>th{f-0%qOZIұv|c>;?V0%N"G7EVC4hxYT1Se:Q{7z[>Αr*/A[Fk@ݵ!9 FOU)JTct1ǲqyr(`k',KAL".RiD挚sRWjfhj~io[PC=Q	r~)oo[зV1%shx&:'p4rVx!r|'drV,yZnW[61@TXmoO S*`{>~PVМ!'?~p0ɭ8KunGc^%ғ	bRYc]r5 u`;8{\|6bbb蝔4` OHEu!ɹ_5cdτwډ#pڡg.(ܗ^\Ilr.LHw^<DRjڢT0(˞#kȓi]yMMJ.oəv>SEeChI/V<O~g8PK     tuZ               pagekite/proto/PK    R]<Wi       pagekite/compat.pyXmW_1e?l!,nw9n΅@RJ_(ʕ>#I`ٲ{nh4/3boo/8p*QrkӴ恄E>Ly*-%ҭvf:4VFt9pqLjƑH
+'rWNoС+gDew!COw*bҋQәQLҙu"n"SGr6Hg_\(VAys>qb$'n%@k]P*r2r3*<Ԇ]\-MV8i斍}ꍈMd.H2ҕJen%	3v&ǔK*3#8IRaԱwI&P8ܐ^]p}7^pL*:gz̠7\,CQaȚD%?ߌAwOw~H0,˥,5!ؙb\ǈ
+;ϐou{6;uOmmUO͠ٱݯ #tBeHᴰ,XaMZ.A)嫺|ꯉ[?¾rd%s*E0+U_eWU]۲ zz)mT,SI.F?MªTuQ'd9Ak2=*ˣ\=ά?D[s T.udmX&̈́T0b<G41fju>QS=i*w>sT.5GͧݹSѧ'3~;s۽ƥl6 ܨew :gFx	F/,?j%%ҩyz6|p|9_r:tcOq1hpՈW|$
+bO4LỦg&!F WV1B^*v-IAYJXppO psqsӣ|z̬}oa *?h7'%ʊ'^3C69`2GJX3sǽEIyѶٺ~o}yvic$u.gV\ыߛpksIHAk3NsaS牰̈́_v&Z35RW	EVqkD)j8lD^Iå[INORSazk[m?>lyQc6Lu|A@fc	Y|topnUU i ZBhR[ۏ~
+ JGS"+$;|>-d!l?5o_K3IWN! tDC8MnC{<|c*shAN>:	w6.n`٪zYG5ڌl(|-CۭX,X9Cϓ KгU%ZRg+_?2	y 6HnQfCm:j
+%E&ՠ_>Rxܤ?5yӻWwA|6@z~ᅰuJout|Ҡ:=a`{Zg|%j7a$Aw8:W0>Y
+&]o:1xo;=E%Z=D9=v8)O9N+0||rl]k.M\;,*`ǲ_w4pZ{>[j([ǎ/E~d0#\d٫rw`־3x*<]Z^3Jqhe6aE	z\A-*oXPΚ?xax/8ɐ!*o(xF_
+pfJb*'$ދ|qvVGͧ2VnSU
+pʬ1V0JAxUƯB_Np[hsA/@¡N&|K~C=rYnh9pE4HSenT;!&dɳ5"Kvv}y<u/vAV+?PK    R]@  !     pagekite/common.pyYw8^rY`InzL+Θm' 7Yvw32_{"i4zrrb4d&pfE|080\h&i,F#/"'Dat;k+>Wl;!F+E؟vQ;U.j2K'W$~?8<fOdhd6Ac!dcqV2eY,&Jb˙dUl!'tEi8AV$"^(2MwȘ5X7"1c Qs1a㕞ׂ`mkIėa	1{BhZ*,hR	殌 3=98a~12?sål,X4ʌA{սgwX]'&sa(2$;wbY}k;[vޓ᭶۵sÎ@H:1	N˂	Gz]yU*δ[GמP&eϟI]WҜ)Y5 T/c>eX\lZwznj櫂aye^8O"SSfkƱ0HwKG@
+"ۓIht6R_Z>s,aZoڍQ߱[4 z<SvƊyeYRN~	]m|gY5󢰙8ZS~3]ْI94~JeF]>%d_2ò޻v3;ZVٻ]mraQ/jDg7/`h6c$v~#`>-8; ףLr5l%~-"3&Nb=ؓ;^}4S'K$N0N#k8񧾇LNa熵uSN"у_MU0ɛ^e%&2UlA
+v Nz5aueIZEJd@2!Db5y^$p`{ɢBdvnu9RWwKTBڜ fg2l(
+w]U`ˀg~˒5@}gs+gص&JTHiS	{4n`pKRqa4p[r{4F>OOª\`ݲw.MLif>llgtkQ>]\َs90
+_a+66Gmw%1lwYF\K}N%}ÃwmZQ_#?qr\˅KFC(!.^_oј{cyX<'PNb'-pr6/J;w.ir"sΖ Ľ(+łOX&<`HGm5G{9%^*!Sv^8H\v;vΈ<?خ/@#lNfWKdLƷX!k2FMAU"#m.Y`
+ADLiE|K <ѧYP)о |r[9 ?K[X?ƚCD+'ǇĿ`@n1
+d˹;PY2*LĂ?*D5tdbuV$ݶn)sqK\XtqHLHC]"N:^WbnNeeT2HٖKTie%-xvPae Rv1O<*t&*ݠCty
+ҏUhe]aSX]Bov#2ͣ4J큿Q&2/.'K1\;9ŻSTrDEQtS9%)m-G'^˫|S\9ѱ/1UV+ J?]<Zc(99^'R":t 1`WL4zDwYJ+N\?GANʄ#b[M]WJ;$y֨juq,kH=x7qA]Ɲ]{(=s&b \47M";M{=tA&QcH1=V7Kwn~?5G (z{^_;\{YE4nZuFqR7Ѝ%5vќJ\!/]5֞j(Vc!$er"D4j́H"zCA)HnԪwvLñbҰNݵnAy,^Fו#/Gݦ.N7Av"s]Cy&;.7	B>+"Uz*+?Bۏ
+2URx ֬|^7k\G"k
+
+ϞUWti_u2m*.ΊsⒺ>+_R,b,be&<v5=N:;x<y5n|Gb5fkp(+~?vfvGZk SZS|WdD`=t%b&38xAEvV,|`TZ`~~X<x!>Q()3ֿ ^ժW~U~U>,}CH23F~D|Mɉ*dĎ2d2J ӈCuVLz\<h=g/%`(9L?}~	V\y1WLqz+,)}fLNذ{S>B?\NąW~}^5f:7 RچY9BQVY">PK    V[&f       pagekite/dropper.pyTQo8~ 	B{Rh[hUUI&\8R]Hof<t:lUI*4బ$w	 &pB[+T.qXզas,OCT)$Z)L6/DR L)ʛ3׆;U:$0]Bg1X-kalΗ!TuC&$D+N;tF_P51"/\_^]//
 ;:.F, NƍՊ[;/} ՙs7`*3bCʩrD-u*J0¡)0_SThE"'q[`
 wO2(5ѷ 
 ءNl Y=r$a$|`
@@ -510,86 +575,111 @@ xo
 6N
 i_@߁4R7Vm@U6mθM%3dݖզ:v+ V)s1-;^/sbkB\oʂ6bM(('Uoioﲂ=$jS.T	6Mh_4a~`亮8
 /GE@iSrBH"	D;bƹf6#seIR.(JHB%uXb˻ZWٵɛ:x+Pkʒ"(ԡLaƿ$*WJ)@uΊkoɭm^ mhtk!|цSr+,'$h!2s:7OYljl1#jZ ;/x:<|D7zɚ<VLw)%_;g>:܁'Ƴ$X4ʱTQRˍte)rYA+䍟YCoA_gOj6
-.Jwl/ 5:6muT	bOo̎D@ +A*km`!)jUږgsdSAHXx{x`}I-e#++ok=g4"[ZAn[P)n˽UdfsNrV6PK    Vĵ  2     pagekite/proto/proto.py[ys⸶Oaaٙ$qKәela;-Bߺ#yNfz5TWl:;j++di&ѨxV锿֘\xr2 dB,gμSa@'n|ut
-9%oidfٔuBW6Aakʳ3 kZccD&UqO{Z@9pc4Tϵ tU(}ŁOuP̣l,U6ȊDS]0ngMad
-eya5[aCˡ	g31Ҧ.TémiҨ냯@lMt.@0R\0``Ȃzh>KUP#lDEPwH*ߏ<N,4c7Ҳm2$,K@WB:xNW^a8
-QK/7;ם=*~u0w_R!dH)爆nwGs:Tˆ4݃;}։.(UR![ؖ?Sm|@̈˂)ωF\.+VgTm¯)io&Sէ{;Μ"B-ˡQ'ɧ1g z[2y$mf=rƐj EO͈ajB#QBm7`B~&<U{|d޳_TTr| a
-^,7( ^/O)8
-VY\4.}\R?jh8D.f\]bjDnAtQE_D$o*3eb)T&}-
-H{E[Mw+8(H:$o0*WaIRFAdfpo_XAM7^qg Zv;vMG~X%l#|=$9 {WJwrtۣSzĞ!{Ɇ1$\]LO%
-ԙwmSӬfDd!Nj:tdiZ	 \{%?2c}AF.,pP	<{c9|a.M9kY`9BU<@.ĪS" ֚YP9*dK&uTӺ=`DN&d%^#B!K$SR\($.*e-4$@Vm#!҈0vhD^IQb:yq^tI|!2A$C(p͐aBX=Պ7X5r5DZ&#LgJX޵EꔏPj\~,yk&՞q0lxJGigҶtkY_-
-Vrg_%Z0S5ľ,EYzV2G.K-HNbgE(\00:{ 0&7@ÈKj~YrAch8C#i*ZHot.fY) B$^LKC5CH?FAxxtnO}/X@Xl477SM?+GG/u1dxDd8N"ȍn 
- ^+{+葴=MeҼG7z@A<9:"ʭQ#aA4nU#eyژڴYk|W1pVM]GYXy{p-qmkJ
-Y1uq2H,ak-4J4uQ8;~Z;%)ۃ%m(WuTPا)É2G`rJ]lҚfT0*KO*/X'LG	.`&}"N8w;Mr5ɅIHYsE9E8pi?}}O9m)ي5[8,gE0DO/2o0t0) l<ɕuqFUȼ 2rTzliMrM]i<7<@FXbKgDF/H9]eֻ6Ȣ^I3~('A.9Vi]5J*M[_P1_hYױkII6fCFyo-T)zRboXcoN{qaML\+u#$)f.!)|h
-̚qH/r\+\nyhYgU)Hq:JN8l_2z'f)K2$!cc	g\ppq`T
- Lf0GYLLkP^c!*RIlHJ#+6~";`_p{>!Qϕy|=.P:a>:(TQ )q}C0nNaF/V5S1f<C<<SCg9'%"TVTu0#L_ֈnѐzWb`$k5(|^?
- w5Ut[©dUelQz[Xdp[n)-z;qU꡶d%ݚ~J\w't0J<VCe6J`?wa`dx).#^MŹ.Xk*{{	'2[I.h}ka5qQ|O]4t=v'`0Vy+E벂K[ML dA]*	g>Ⲉ|a%g4/^V,-5JOh_Q*jvwn-Con[rw̪;EZQ<:"ԍi//}_]*/{z4pggL+-<?-孿woZMY|-Zde2۞ ^ȷtgw|nn476XYux wvAn|ѵE~pke,6[{|"mc?-8Tj[UfV5 \T}Q^oa77.gO'wgrAx3ߌ0Qsrkܱiwsi&:J\WHfYV4n{gn;yӸ-=;+[]]<_4a,%G6c__U㖬\0rcU=>\Lzu	u^/F7nVWetx6s^k]լ`>ç\;chOu'adtgajuR<}?Cvn;my|n(k*rWn^^{YZ_Ǭ9zK5;Sے۵PٱY1|OZ\5F0UM0>5c(*.,M@gjlWҙIv/RDT˧v&[yIt-;]bZnRO`~f<aJR:QiFwwwwٻQZ8x>Zg'ULz\DN
-fZ5e>{_T	]afY#IJX,a~?Vs*`Բ# aHj^N[);]Р^2g|k']*TNH'IE%<<$]h|l(ǖ0	0*'Vu6j9re"%9zQ?M>J0.6^ASnA06dӍEaGG ܭ'"֠A|&/7q/G
-1	v	n!8	Ӏi' 48O68 %#$XLHG䊲Gm}+}5V?m!P-4% S$uhCwm=nԍf_2|@&D)zuʠ q&܃[~&/7Ji8lk8eg$фxɨbB jCLPjNtʑ_Tc<\49?FSC\.p 2bBFg`:\| T<lZJƧ}Db<>9T'+spUA:k%#w\,c(DbbF0sPK    VPfs  *     pagekite/proto/ws_abnf.pyZywH_p8!od;`` 'zz5Fk!tfU-u=ك3ukjH硿yK?/\zqy`[2F+SSUD:i5	{V9NXW	S)(%~ [?&#0
-yQDw~$}Ynq0lhEIDuH%q1"@,,􁳠^H+j<GeBrVBhidE!S#ՊЊZշĵ@d^`87`
-$9%qH1MgGW3bWc21*}\@mmAw&79s?Fao:%	1ؘWcBWh	R{ߩ1[>Ԧ帡5;-]
-A_Ptr;f6L<8KFr)ˑfrhk-t4]4	 Y<'~KFlm\MEv$0x}	B/,*Բ0HP%
-lU	xufcӋכ-nH32']2=ЧDϦ8c)[/ch-T ܥ#kq\\ 9x4D?K-=b
-Io~p	?i0J:ɦKb"j5bL~ŁWu}H%t+TT95WC{BjzdWtNmݣ 78U]2Lƹ%킐@:U6m=ۈj=SȍuǻvE1MuMR6N5z{؏CsXkc%^z:3fWSs8\Ũ?0u0fM&Ix5^ǣɬwf3Ü]{tՙi|1dPdCN JY~13sl\FF:h`a|	Ҹ虳<_6W޷q;g1=7LMgƯcyY?q(h!`QVm
-0Ih( sBS0'}<meO9ˁR`N=T̩#:sQt`Fo6=, sJG`q2xe)+W+dd^_{WS))0,-r,|Psʐ8
-.D#G,ĢRhR8(h
-VÅkaڗ cΠ[FMD܌?bf/wiceAUZot	2BFόP*6E̡RwhVX?z98xҠ/*ـ5IVJȃT1zc! l)䚍r20<<f?FGbJ̠M$ddZNE-׎j~LUf$fj-uiA(1a#iE"Ĉ>U@;@23eCߠe2YAq"wJEH 1HP8*6ϗAox1lg{O!G#idd t<'2M5R#K64Mm.Fts1ǊmjLng`{n^9s
- "FT:q.X]3+%I:Xv0ZU"8U"9'
-g䉬=uO.1RT[W	5lɼxq܆C1Ih\% ܁V#	;tf5:`SH?r /4I2YҨVWJp2vg(utǬOikwtcA^e6)X_Ѐ׷܊P[T3,.OÊ/6
-+#6kD~/-GK<=/ʌi7o.ru[ b:3b&?P,	s3yR;AbMtnguE*C1s$X6x.gHg](PEC)a#@Mr^RK:KU
-nkd^{< Q~W[k.|ir|8Tpm]OePv?yu~+
-8KŌ7hueb.6x=YNY =Ѐ߿BbPE#Vk[q0IF-T4!K׺y	8Wŭs]zɴ{TW!!Ep*3n[Qj:PZۣZ_:#F.F`'0^Ck$vP^K"\ϏB,Iif	@w:SUзYg(	${YZx۷JV`sZ%Xi,M&gD k	O"RHܚ̵foWp tDDh;SJ襁Hm@ZKv̙>ouΎ7!lo% T=[*i~6xfn]VoŽZg{}/Ux?W7Ya9R S>mjp-.JS*7<#dP#/Ix@U3~'OJŊ`UǤ(r)D8_jgENl^ݓ\dJS)Z2P%-˓"+dafP"/32?~܁$'T<޴oq:Uӱ-ǚlHj' Ҭ/ ck9 qz7`⟈!oҩ5R÷VpZ2-sQ1Z*LCK@d܉#Ty붮[!Q")C|$"۪%s0j,ysvo9ewm L+T=t72Z	M׼vf%kB)?y^VZvf~}GRkJz+T)SWw#4e
-Mqy}҄d9ǏGgE1<u|[$4CJ	=٫]o'=	|7"b~JuKN6hנAI=cQΠ[UغQeό,is$E<!J9ϸǪKںeI޿-l"U1$
- fX^L7yIQ~a(H.\(F)xtVj{Qs(]en+3=6Kbٕ۟pqoPK    [uZҎ<  #"     pagekite/proto/filters.pyYS=ʕ&NNa/e!n[I8O\Icw37.-=}'{kk6SI'(PQ!Iz>SB)Jd?gьlVNֶwV
- 4Q	aEDщN>@q2Q O-SԍnKfsEv[Vc۪kI具F}E|#$3G5],Lxq*(%O=(C<!A&`70,:q *RXH7tJ'G40	ONO#& 9;,5!0!b<`^;=ܓN):Zo Zӹ%_is<s޳0$7$NN,%`||v1NϽѨw:X5! "DԟcX_`|??H{7"ËrN戊}^Sm AkU%)YwG>ew>t"r(z|)I}͕;;Y34,dsw	4${ȯAb:fK/bCSГu9ԉS#(<e+OȌ,j/Jɸ?:`[>Ҫi',/r`?>VB
-bS-i89u%`I$,CH*tke$Sє~xclGOȸĸ2.hUҥa !l#KkuMi3Y7#Da6h"B!R$D=(@=۳[Eٰ`*jOgizGßS)wT(SRCRw18**\wKVCpXلJߋPb٩4y@mD}i	IE##wj&^.2쩴B>	 4\HL9/٣S?i3YY7{NBa:J8@rb))Q^pQ&v~OS#9ҍ<ۺWYܸ*s9 mHwq%40^SIIbPqWoŗ5y&]/Ɍ#uO펋3J=Z<qҮ?ep)Uԕ=r4ͬFz }¬v	loﺻنZ؁>>.mmDzw#k9]m3Mvyʸ7!'<Z1*gbv$R:Gk7Dfkc=;G%g=d)RQN0z!vx(>aCvkPrf*I?UiG+}<NR̀hڽ=
-Εv/ !M	m'MpN}|>f?:Y= $wZmkt^$ME(uEU]2s]:TQ^_`.Bݽ'-rx{ph~XW62l6v<.H>HM/_QP?O0	>|4ܼwi//LO=f0urAV,,}2etYFg[u2IRgm1TV>b9Br^_3ɯ]vD
-AXCMsfیXW*5XUѤW	W,>NR>>}	˧~\D .hO*wRE(#lؼbQ*>CF?@/C.= t+0|!rcx<N
-P.L.mؗ?^Ex4ͫՕk~g<Cϵx,/D~?B˄gwXw7xFr)qDre!ߑԥԿLG3572L1Aev: y 21p%?7M:djbkԞ9_o\+{;P xF5wna]4l^i'_!!84&kAliUvkY'S$	QD8kă
-%e3"LNuurRъ'|/~%.,י1,$K~,Y&cE3r,'ǔ؝	vq v|ós݉/V0{߽$ÁɭG %^yMHi>񚚳NW믑5o"tV*'AȞ2:,WWm3yХ3x@gC#}\rΩїiѩVM&$)hF\g@Dbӣx*Zqc׻
-hHu*;-+5u|E[R<XvX|_]s%SE5W/d?S⎊T"W:`YJѝ泫P\CAn\@7l:+5e3(<~ñ/Cxa\ow+3W}c=קeO'[/"|%
-%AX-T(^Fp}g]F;0L$v_pǐnlg`[Q#E'fhRm~i6_[Lt?[W?u?9;1
-]VAZRv:)u^w?O;;;yƯ"wѺ\wmiDUSB-ZsA2	X${ImU=7%8W<ߢPK    VM       pagekite/proto/__init__.pyn0Ew즻(uC膖FHʆ>C;AM>ܙh4EK !l
+.Jwl/ 5:6muT	bOo̎D@ +A*km`!)jUږgsdSAHXx{x`}I-e#++ok=g4"[ZAn[P)n˽UdfsNrV6PK    S]s]  A7     pagekite/proto/proto.py[ysHOQ~1gfXƌmq{
+IZﾙU*ئ{̾x1tJUYy2TADuur9jHuy:e5Bjah~
+9d:GaXCώB:uӭX[(\wJo3R06-.Tjgub[F^&II8c9 {ZH92eTߵ0rU(؁_uܧ<\>mMuA5+D5'[56DNJR	Ph!ބy>G:ԥjA4-\[u-	֛ٸ0 WCPWPdI}Tbjeb%A%w]@HU_<N,4j0ÕedFIyd	uǗɸ ɝ<ʽ74=xLSkF/^w(EwSFEHd2n{r-`2GJ"*v^@>-4T- p@2['`VZKKhY.IڞkiT _wN\/,ahjժjQIOJXX/}qXBdDGZ(Bˡq'y}S2yI۞aX4pkP0FTi\Ԝ7Sm^,5$n!q_hEv!GZW: +*{2>W_>"uPŋE@(2jwtʫTѣ/}p+G!EuZ8Um诛('İ[j:]"W*ɟI%4\o&rth*0ՆI_s
+\~
+M!jɳk8(J:[`  0A
+W|uĹ.B!dfroBD3JRoʝu^Qu{&"28R؆$2 {Ip ZuƗg{,{GoTL@H6u<aahFx\a0|ƢƜONMKV ˞k96P@al@}^b՘ޥ*c{V4ZchA 	bK3F*LG(ʊ!:,l_xU>E++N6eRgFu=ͫC̈hBuX.$)C$!&w)PBaL*Omӑx[bb4+Lӎ*i8JY͏6^~/xvX<@P`=4I	&kz	 &*z7l<\E"cٲ%Cr"P; wPMIHL=mXHǱ_Hτm墒9j[rK42S5ľ,Q>f2O!\mWApC15S	cT0;%l b%UN|}IS,AșS) NZB_ȹFRtNBa$_Puwr<I`6RȁVkHgt3d!88aTfP~= Lr&*<(B>mv\aDʈ
+ӘBW*!L՞Q@*:;Ve7ECȆuX'YEHgvNbiRx$+L?N<lY"*L^m&\&MۦK]fyD-f\1 bAƷN!޾AQ8*<14SN]18QkeR&V9G:m|cJv,/ (g;C5LzVIqAeS.lU@7(4>
+}~*A|E#uL]䲯UuK1dhJ
+K <&׿c۲˶ 6
+gB D?>i??bJc7dȪ$Z==~Vq<G"ө3"t7FH1o\\$`=yl9!ݡo`0
++q/g=e+{z7)"u!&&˨a]18D^s뱢}9ЖG~R܋lL\~j8J3Z92ŪG=)p5xO1-%ey8ߋfqv⨐C2
+TfB&+
+7-r43r3z[*EM|˃C7OgSցE>e<AXLWh>uqWBTH;VkTB7r۞en.da T&6"ߩA<k!x WlĨT: ރB,doIEc\p'!.(_Q4l5y%A[C%Kg4Y&tzP`o6{ˁm??~R
+uhri(:瞀$U<-BReD@_xn HC-=M 0"a,}<8V4+Gr-Wr~>>h5RꊒVҨ7`^c
+nމlF0͎YOH22Z*R菻R7B.cI!8a[*䮗JTa9ȇJ|RYˣBܑ3X3@ϕyÑ2~ \5P.LX#u૆6}E絶LTjQAkMi,snS/TYKE8Hu!Z.ɧ)쒏:IMVHj-Ug:8;	 .8&T-Tmf!qMr
+on^3[07gQҊ:E8ڎfMq?#9ӋtZr|SxQRxzI6L&s"f:b	1¦}EN6xs?FﯥXn$Doo<o/JYy4ukRd7ULƪOJzJ(S"Y-@kG@qNʭοYK$-Fk.״UV0F164۝mJm˽};֖ZmWfWEvnM~yJ3yջh簖ZEgXki%o$^=i_dtkr%\&ז"ן֦rhOry?)-ֹ?ѭtL;s@l%%6'a/]1+iъMEn, i"U9!Mlwq@abYZVk~F˚Tsïǿ*/7X7mY{Y͟O!:5~w~&7	!$Qk3r{ҵ[iCoҺMwιup2RZmϲZq˭𶫜6ggrekg֙%ZҒ壿>e<OZ󟕯z\(rcM=9Z}/˞Tˢ6;:YOnd)4Wjs%;qZ}q?zZ`y{7q_wBFo50]ί__kt5ЫKۑ'ƍ""NJe(w/˃vwޖocɝzZ|Ӫߘ|ᄿ(h-{yrJA=ȫa?ǆQfU\\CW9c4>oo޾>K2Quh
+2;Xn@laqx^wia~)6 vax2btJR:Uw>ZсӚ鴦~ IlӎyeMf}FQ8	Qf[b#uʱX*3;vFoMPjEn0^$iS'ޭc|iм'5`4d.Nk@z{ŧIE5|< FM7ٻtD4>ۜ(	V=-3)$<uJTCx;R!R(W;#		bIg0P5a7|rh7acS &{4)֯z'ACQG+&ܭd'r_ϗ]K}bfEA;.!G-)ECt8xi] 4<ۙb )!ԾE8wD8fڷ	luۖ!j^&<dD55pnS4Aף\ߞYN]03.'QmNYǍ$H.(M2VY[auKI؋`$&.t96DNjVħ= ̱G<&<ghj=;_u<;@lȎAF˽*y0K0̀c xؽ<<Ł"EJu*JZ#AP}dOJ%`fcQPK    rR]c  2     pagekite/proto/ws_abnf.pyiw6;T0|$uҶhkK$z|YP $CW/0\@4
+f_x^t,<1iB6״`	e&-/.,cwuݨi>eT"E"~tBm|FqN37f?DaC/9yXG>rǆsg4ҝq?̉G%f^ 3c`'v.<`uvi0Њ(EȂ5Nm9a:ӬD.>]km	AGؔ$3`{O	7wk4w(Z	D? D;:seor"\&x.#f5ή/^qdlyk:}gFoY9׋npy`wGў^ߓ0);.{]8Z6Xϟ;l& w\xA
+QS,ZvҴl'{lN4sw,~O"Veȝ2I%lDM1-b9iL`jAE<8;auz4A(Hr/Xo#g6z tg`x!Ur/)`
+D+IOAH(
+~p˵lҜ/2=oJnğV<p*~9Hl8nbF$˼Ms3pMXYpbk
+/ iu#`wDNls08c.:2 8@!F?$>u91UnYqq>^꾌jq
+H2@
+l;[\Aqʹ8Cp9ZaghdAg?2]X_&{&H~\6{k2x+.gb9Y^Щ%EVe/QiM-G/"	b'Auf?NO#)YCkIW^V)L c&Pm/6nԞuڿ5SBJ$!xmbOł{"t'zl+4q߭`8LgK;F%u|=F}nM,{r3pU'ջN/( d]B=/A{߬޹=n.V:\nzKkK+HǮ=-':<잡xgyfShMUM.6TO/ݢ:KAI28^i(L$'9*``v*Vk`h,p(ZH7ѶXjПʤ3vXdQ, vC4%	 (0fi5ꍿaRT-F*}u(nahֲYKF) K&%TAq9Qm}WPyC=&3T+;+S#A[XjƿۚPErp_8py02^y찳@T:D=:8<|ܫC/1_!Q؃%\1λh	c멥N4VGO{}ktCm~i@:)y)^.,s
+}iȫQ`(9
+_31LV;sb\
++k\K+FYy(] PU} cQn$҆`	k8@h8'[[o.8d!۽X${"uh??vfm=`?i,oG݇T`s'm?i4OTA\8(d9sU?5c̠uK>FgɊqdRDL(!
+# 
+`_  'RElO@=6QlJlB^B؁=	d~{j:we1Sl2Q"3	!w "'X5š"S8 ʏ"_HPá*Ks/Po]i>,}u]1 OSQfYykāo)!^tDged${||kďܬ#hVYjF;mfݶwؽn;w
+ ۍlb&lWd?#uw8,dL*)LzDgf2TI704Pq,%k*M5*pAsm5El?7o	:8\Aa0Q._^ǎX 9(kDե1<j4ͲSrQ(K$]a>7qe 9IPm1ǥLs6ؒϟ?+0?l9A1j*UyBMf)D9݌ͺmr$^z7х͈}֢t-.:@iIq@e{-H;ޕrhȻȈ'eΚ;`ߪ\Oi^ԁv'}e#ONuY~CPo-4FY%FM~F%Q>HJ꯭I `x&)YM)[)nW:8pA=ި
+ ϛ8s	yd)T3ƴPXRWGߴm+bTӜ߯6̆j`V2jX{w;QJaMV(֣ˀt`KI_H?c;ؓ3[2fVDyͭYgKm|.oVTZAcVҍ)G5QLJ+IjUTr5io!)`y%xΆArA2zٲx]pwNμEByKJZiPy˗n=Pm/^ȔѼm[P3<%CQ@yO0'iuR
+^_d{\AiF;FQ $Fr]ʟO	ԇ4,ܩ?B:a06S]t")Cr$&Xՙ#lv]ʫFiGhȖyH?EOYqIs\g\{RO<:5L\UQ('k0H?AZ;;0~ܻ[:Q'R	(uS2:Cs|W$2Cq,3ʓ5ZuzLb)6}ɆgeT#ɞ+ŝ*b4oi~ͤy[ijB!twȽܟv7=kڑ虚>0JSpWEm)x5|4FbCM]RF~T̃hLJ#`2̱#}!eH9\ՐyĒSe
+ټ(5;C9v̍ź*9Ǥ_oװ,o.pM^Cɞzg9Cwك59MK	xNio<BeP#5phucu#iLuH7g%+YwT]X7LoÒֆj'|Cr||󿔀P/:=kga*|G\D6!Mɋxr6T)q	%p/C6G`kj.NSk_YO]KJ\6)XOWSHr&_Z6#RZQ N$Z!U{, 5sԠ)fGJTLLʻ،}l=AHTbOP!,?753"#=kr)<V&R[R-_SC%80k`jBy6=VU.Lp_PK    lR]̸  6     pagekite/proto/filters.py;sȒ)沗d g6u&a/%` FOݯgF	0]ի {wȯ^<̋9AE7S,]p)3t<`3G/,pz)l7lO+@O2ŒFUhe$yD}r;ò;O9; 9SFkr*u);j4QJ̟p/LR/xHu,~㓔e7/}v
+u}LVrQ,汷g1,bkb/d1Ic)gāU8*	7}#cٌǂ!]Ɓ?aM  Gq&s r`{/*><W=ܳ7z%Z w]	4s792?$?>AƜ>[U`*czJ}t/?t!1%&Pvb`'tTޜ^I7muuf;xٹaon.cFrb^xL`Wjp+UiY]l@.G7cH,`>oiGw\DԏONY?e u:@եlD,#	wPT&$l@1Q	Y뀅`\h) yN $TbIDjJ#&w9BX 0l,\{%n9 ;]0gj{Lhd'<Uw]M)L?+_COK#MP<"
+~xPM.~=D2&RbGab̟e~hĺgo	M>4ՀHoPLHA"Q3Q`L=ăW ^ZIz]E*nR5$qY(qsJ,eơS1ltE$V+Q6p*$X8dEHup"ܶ
+0ӄG)auXĻW5N| )kMa'UIv'AB` ŰI]Ҏ:DoQuW5GA$݌]q^J`iZl/0Q?x'\)0`oUl.BYڰ?C&PvQeMGMqE $_&k{v
+ `+<t(jP)ΟR:N֫k\%$Zlsڮ Yd*U$N3%ug95_S
+Q>j1Zuo<%aɗUX!%=zkS{욭zSm[NR4QoY1fV$05-fGk?EQά8/!ibh	`: t%\P}Npu]cD@֤qE#lG^< Si2JOTl)ǩ7n$c E,c?$rI9js
+n?gau'@Y8SD"nk.zn=|?(3Z5H:Kf<QuéK .cmKϵfDn_
+%E5_Th}SC'ߦ$U:컟ױH,$lx䝢'w\#4w3V<I;~;'ؿBd}&ogկ;ۛf>7y	9$1UvAT4T,^*DC~|UexeB|)]]ee#Vȱrʞz$vcULCeq6-k,P/;Yw+Y?ZԨZɪnZ;ֽw""tOz(S_ C>Kbd_1bkCG^v;OF77y cljAA 93+C(yl*CZ<{K
+6jcj<k,b/b`KO9n|sg,>h*jREQSb%tx&U^x\ a̚Іb5l}'PDD>uHShdN4&s I c܋c+@l"pW"&4"dqQ )e"MN|O*L* D="	Jf?q"@)8酀jcgW~tPbUK?B^;JkbsdpQV$=+R:*ш@y9h[e'Wg_cm]}}tN]wno7W_`9B<F'_]?Xq#
+_eߥDN?6aW!.ww.~]zpÍ>6/G^ӛs9Hn>:fQ+TID	2U<
+[Ʀ"QV^㕶<MF.zD(g(b	ѩ+5P{iC*UW/X!*≑.Y1bw.xSN,<ʹD\3Ty<bGg0T4:RDI_CCx@T-B3.Nc(bdi8wC4V3$ȷq9.GM02MطagF}3j!OxO"}@F;BGm*0 gx˺BW)a3|[~R:?
+RDb̄fëҶ`gL)i<9١NyvF-݀|eL(v>eϒ*VjD([]B&ѕ lE6I!VK@ ۅ)f@ܥ\j[Ffj{1n t	yiK%-٬!?΋!1B!%]V~vDifrWlxBU(uAmO+NyR+QYut6.
+(?.QL\/|`W2s$P88NॖVD0lќB'QiÙJֈxAl\sS+bs'x}⣈ǅF*4\pؼaBDTM)[r"Ҫ TZŬ%$?%]=Vn½֑R"9R#
+kƨ4/:)-X-_v?_9҃\x..{Rqp ZEި#g[mZ|Čh+a}2`CDy`6zLQ*!S-gظ{52uw1)XtEs題y~<l -/hcYSFlE:sf~qЏYSE&|	Th]o S%Mav.s>+2s{М
+Ežemc7aWlE8WBv#P=j.@v>w709CFcP6SYVwcQ.Pt{:`O\QWVҶ>.=*rU;'4ܻuwߒt2H
+ X>o"YNQ>+ MlK J j&ԭ殿bhk<[zϪԿ^G(W7:xEKdIm(JTP/Pk2ZL,
+,W)ajR 3RyM(S`2/!RldlntF@14"1iJ^m;?Q^xXOqUcs+<vA"^zL5ķ_0]C0$GF=֐I0H,Dmp.`6s,YaUuYErBW,e$tG3yuƛ@
+пw'sP6'(PT ,ϵ`Za6:lOD+o˒[]޷|AU.'m9|@LYZ-1MQ4X%Ŕ]LTiJWgNZ~z>V^<sJ/~~`O2,P5	uo<x	eZC tD		y<|V3EgXy\*-uԼecl=F5_]Լ߼IԝgxE̟C-4\@߲}0=?'kQ,)M0=5LMK DXλWHtBa[Hʛ|u)Bv}qTzRdQ;R{ő {fTfuy7Ш\'w|@9n:Y斐9%Y%#
+oo{{vsppw)tت׳yZOVz١ Jsp;VlPK    VM       pagekite/proto/__init__.pyn0Ew즻(uC膖FHʆ>C;AM>ܙh4EK !l
 `KJSieZzO>#zO?ffo`_̤<j	<vؚǆ-Dl78մWOӏWӫlA'TP['`y(佑sp!X;"x[QJG}Q!JNVBo*r"Rr-59[2ƺkUbJ21W|K9nb󂁅ey5c}#9s|~Emz/C$w]2%;3XAfkOJk	cYqw-D!tUZަ#]ԡӊَ&<&[f./b5l>GulLs~3O]5&yr$*
-Ri^rz&%#sIU69-̗06kBw=N1}b]3	??^xPK    tZ   ew     pagekite/proto/selectables.py=ks8+0Hev2=]Y?D5f/ Ԑe_wA$;;ͮ,@hٳg[Q# ,J,w<b lY薍d l,Y,I̘O"<Is$Zϫû0xy9ƣkm=^s66|޺36	#<	/aνupz݃&o9;AA%ci;ۉǂx̎~8dEw`yL`=NRYL%LM=$6
-bqi8r0G/͒q8yE<bt!ޝ]1v84axS0
-Gx X1>PS@ck `	MƁxxs^$& GS̱Q}؊t;:bcx~ 42C9[d|AU>v/ߟ_]n}bóOIkj	X)
-0'G^"~ڽ<[}v.a]\/	oyQcәfјwu;+6P{+x*dnNXMX>on|zb\zx%E$@d/ΫiK.ZqLj_0ًQ۔0p~¡2z!Bv̹-+Oķ¿;(-jsxtvP5d:a࢒?+U$PC؋
-3B'c,qBu3m3(R>wd4>w'4I9֘9-Z@{ī#׻;:ǰBzw~gsPbCY3?` =d k;ycw	rF>!eYGDR)#04^9O6;m_SC/AS )EO+op4YVT]4!H_h;is$l2q1cATc &Cv4; S2`6y[lA*! !	L? *#7$DNdaL?|OGWOMM#ktOzϯz'Gģz(>@U}?]9n%1BjʳL>%\>͂{\3⩾E(i /<Xu0r3` zXcU6'\{ ݺϞoNSnû$Y5t(,$I<?=qKK)K D=-Id	 Հz>\~j y,ߨ@A.~U_ŔؕsP}筧b_Tp\eWJ.9x%FlC3U6(.рF  lLS*C(9"0t"E(F"ɃݔGZ/&R-'^S>2K<g}@BҐJJvF>=egPj>O2"B9,4fF@cFc
-Ժ.Ui:\" SO8N]xW{%npäiG3W+.+SUxZeМeT,XD#7}C3͸TWaY})ܓƱ-P8KA2F~;'+~ޔ8e&
-HJ)HB{v!"0vYKۮ¨,y*U
-7RZ+"(I+S T[лC!kjTuE[s|<Oh%\ =uDuX BJ4*~TۻQ3iiiSq %#ȷkصA[răx1($1(aMQtrwf YЁa$1f{BWeeVӓVeuuPԭ 'J)VQGaŅ
-JM%aY(vI8r'aDy)Mj&~L+䎻ZB?a*\X |u)yKHv.b`3dFv.5
-A=!hk1(.YrP^s`Ppk+S~	V!$1YI1ͮ_ZW2Hff<gF^@rys;zA+DcZHFgAΣ	`( XUéaʷĸKK@k$Wql&,w,+׃:oo4AA"y1|KS<L:	f
-ٹn9irkңO7i=b]ϟcY3u{Ma6ݒdíebp+M0d a/0
-B6@N}}9 &:۟vgc=xbP"d/c:΍cK>:r+M&c^ǅwMlD)?k]+gj3)jݬIT\M @_R9(kCkOs"b"GNBծ\oNƪY3k^ÞĲs{kQgOG(/E1?w-N(0p1C+2UƳ~t.{_; 	D^	g="~iGBI+W~N`0,ޭtx2E# E53c|QO@vqLί9=]X_֒=Ǯci֐aY-uh	x/B7DCWo!=wk0lmThIPk/
-Ȃ)[ Qb5bR<}ܟ
-	}n<I	Lxt騔
-9u*e1dC'p2!ID'˚a֮,WC]dˬU!Puz&v4gUmTTGwcu3@xVyVi+!rFQi*IJM:pO#}(͹*7,n(mIZF_uRb'Get&J7݇	<Q/̥$iv-6RCΒ;,xc o`tI&&Zj­hHM|CG -o"
-Ъ0
-0 n(_Aܬz>uBʤ	r2s_ne1%{P5,Bp-mөuσQgJ$*ڵJǆ2Fur93su]-OdRda(95`+d⚦^N37y&`PHkog~y>$MLiMU:v^v]t:tNTx9F4oQQ+n{KmE $LZ!Zu2-|(|is1bS|c".hġv?83R{[ZP_ԿiiYz;v?5tzywS,T6F_
-YR$A9_G8k85Z5A8/nؼ{ީ9`aorSI-IԃL0J	=<l	-SX)1E'ƌU{KVk7&}jc07Iv8hY^٬)
-in2k
-Z3jL5-%tF841P
-fDX!JuOm)({x RzW*uhS/,󲿱S'7;]T)	̬j~gwҪoH1򛢇5ږ{YŎU8cl}t|3)ҳ/CCl(
-wAŷe/^PjJ7{ǆ\-[auCCyVL=Q-Q\*oY:RNY|6
-w
-4Vᅟa-!!E'qΧ<-xf*A!4p&q	b~0@i'h9w]^	S.;=xv<Īz< s5A]{?N NlD"O5Pʹ]x,]U
-YQJb%F2N.ʐeEc!$FcR31om6T-[>Q[4(c;N2l35Dc>-R
-޲K%ѝYA57E橉u%0FiܦV!/FI٘-,n$>E!xrq4hS3!LOcQYqUlVT:ds۟ye
-fUMFt::N+Dm\LPB,,Qמ6.kY]G
-u&:wͷ4fW֡;Gptw.-Z6	r2N̟iծ6	Fi@j]4)Ɣ|O-arWLaT
-|91|C#_!a_8Y2k6J8/Ro8Yk87.ruSi6m+Q8!=W ,_
-/JU=LtmNc_$}.o&mJ6}k0yOR24锽w~q|~gOMvķ&,ƍ飖Wý%?lodo[~
- RAhwC9ȓZ9d.ȩa8wTjDzSo;?mie{X2mMmF:WwRuF_Z|c_:kJ K1+Ύ})pRmUUjv۾>b-:hPMO7pv.KD:O%Kf}ύdxϩ[L`ﰂ+(*m)g')wdO8~zzt_D!lO~vVJ(˘O{=nڱlώ3L@S1i7zP~,W)EN=ɕY[*DO,
-ţ5_G%t3Mu>fMb-P٤ZY9/ُRDy͎nk"h5M('RaD%
-"]v}do3T2*'O,V&]pd?eW<\;d4rnD1 "-s@Q Gv0=k^V}1_hTzҩywIgڪbta̮=Dd̂0Y0$;9ߍ!L[M7dĤFAei.)Fy.e<Żl#H
-uc6eD|\wl>s9RLP/?0	a~68pJ-6}ϒ"dQ ΐob-@PBH!m(cGlT@<Ĵځ3*ݳϻor.}IP/ElEXqQPQ&c]q!AtMV0čv^_ԫڛv+P*t/MHyOxK`~Fb˪P8[^ѕξq,Sz`|m.5MMˊVinA,hGk:nYtAHJmmt&=%_s7{NwS=B|/9x5o?uWrM/.~]P`gofg?<6ǷJ|(d)FF`mO+0*ʲ&qa4)7EI9b$;rFGY%7dqvكUYщY9~Mf7G	eAܓ#(p%OhE|)40ŷ=9<l#0lxtJ]8KJ^g 4'2LK3c)D(e9]`f%OEi	6GHֆ[&)]wt"?<m?iMB^Qfn)	ؘaUa)q>q؁IN~6$ljAP%vPD9&dy+j	V5La8w5Ȫp'S$yic&+kZ$9ūRұe廊L^Q iu9^o7[dE:o]^Jꠒ1{vMN_^`LO(9Dga#}݅ZdMo^ݞbb6v|#/cRh-oBWstqȽIȣqF:8PQ݂	-]+D44_"ڣ:fURmvF`'dƗvwEXT}C">AmݘӪ<X9m8<WIS''=_tưEZչ`^`E38=#LrY'TϺEMY	c	nFnt=1UALb`TC˛FIpթ7evpEBрqQSNs^&rnN'AߕbŖ+?)m*Ia"c+vAg* LvCP8Tv@ݽbWRòAACQW2Z`]e<HGPp T"i~辑(uA	Qc`B9,cGTuot戜ۮ(R9뢹VXem4TgpZ.29lz	ŉz. -\o3Ѧ4+2v^,XCLX^'7w!'8PAe`o@Zh࿔J,uҹAaXvU!wA'	tLF9P)ن9ց2TME7P[c.D)}={Ub~?NT	+m
-X>8ք#ŸJ}]Q@i.*FPȜ%Z\z5Nsޘ6\gOv%vK
-aBTNG}ax~=rPN~$ ПP\_'wELs3P@tx}`wPM"C۠6l<5M`3g5j\-LR,F]*:(̏ԯqMqWsVc_S`s9UG;Ԭfvʒ[k=MjI-0_[)&5MG[[x6f̄J]f"LؔDF25@V6*Io6HQ_B4btEMjs;rҌ(uI!,'v[2b}(o"*8X0a).2,ѠԵ0к_}sՙRH#<%PLSITNK
-TN
-+'K<V^!QmIj0l`|*;ZL29	%)7PKa!ĭxYQHó`teE67u~N2YA͂ "y5J{HL_04j?MJ
-	=!^	q iWhPJKDWY/sGNݕH@跺Ek*6នut}m׺ muziGzeUP.k`(Qra\jn,CD{XкR2BU(wm*_U4FLNꘖnܐ<<I6RGm`|L*˸Ht1υavC"Rr5Mz07ֶ*x}a0GwPK    V &  "     pagekite/proto/parsers.pyXms_ѷW[B)!6en|hZII{g􎱽͇Pg7{N V##p+ϊ"ٻ\lg.
+Ri^rz&%#sIU69-̗06kBw=N1}b]3	??^xPK    TS]\*T=7  M     pagekite/proto/selectables.py}m[ǲw~E^FA@: <E89I#0(3#dfoHg]4]]]]]]U]]ٳaD2'Q!<IIt%b$aQM<,GyXFb7"[䢠	n<<lQ.h4<K,Yш7qgiy%<M'%xlNЗ7.nB$wB^GquA6_M)vvwvv:(L2Lnqg Dt30yEbPs<;lqG(YU0y42@NElV`N|(@Yg(LbqO<IqMxECxA(1ߨ$ DsͱR]m$D^sSy p'XltBxt'ŧf!+%1 aZP~'D`8xwz.sqt8
+1"]OPmL2	 ̒	#I^!LJAa<%KLYفY
+,/e:]tE ohɳiCNI.ԣ(L}c ĂE+VQ8k $X\ğDҳv͑շwoeƿUgixbƲt=yס߇$?Fa6IDerHAH?],T7u$4+Ed+$w(ig"G {BɠYĦ<'$
+ZVGvVT7׀_8.+Nt{׻jC `t|z={~
+B<g$,:3_W_؎dߋ.auTh,APϯlsЪ`+hrz /Ғpo.[}[xJہz	k3,Pn  
+G|<ި	0yC,Agyк2qRi1N D"ZDA6Fo(0Aܟ/wGNQwwSXJl.Jˢ#t
+̀eP )F]?G锦,ڒprӯCe$@B߅ EV
+<'7QjŇN oz	ON\Oı/wx;i\FY?vU%W]۔WH k`]|gn+r
+0vhghcP.hRZ]0k$0\إfLGE@ۻWۆ,y/ dKVb`oM A}4)ںj+_DIBݐ]Vt|.kC 3 5tPG,?,qDYпQsMA#ht]>\Xey4"<}>'Ay#?w'x,n%ϲ[0L%hf4;gQ.3]\ЪLB!RP`)PZXXR#wye7o!=D9ޗPj4j_r鞬EdOp7[bmEm!y I|#cXo*BR QPTSrʔF==g+R6hL8nd`CQjz-PtH#6m@Hm4wA /"ɛN/9yϯ,a_aFɊr!sن_-lD2h7:w3A#HI,=A3R~`nE>2JI=<^q* fdьxby=y%KA=e#
+Q @S@$CZc˒sV&ȨZ!{V@nRh.<NQ]HEC6#D	Nʆ`6+ i:- %A] 1xD	h`O2<i@:Z졪rvzzܨp(
+Φ8EBrI	G4~jVW;gi_7InKđpPPp ɴ箻TIilE!γFД$Eb)eg@	Vqںz8R+Pm5X捔?
+A`Lmx0k*Ӯ8N*cQS V{Ꮀ7m;=|{?=+fR(\UǪ0FE(:hĚd(=ETLce"Ai	LTHJ!VuKjz*#}8&,²DK얷Z]6`E&\ee^-6%|gH4UvJk|+l[Gj]zm_\N5kwB+󰨓f<+yНXh-	 GQ	-khRSV;m2b[MjfF}U33fkKAuH]Ub
+w~ƈcdy@~
+;_XZ4?42uwGPO$gnOdT|x0'	+\wщvraA{qS?uO?EwP'@R)S6p"RHieueXNpHNuoAN(,Z~Y_V"eA/|rwwvlM--^^yԽîy?O~:GJ[FyKʮ+⚣`er$)P!DKftߍBG2`wC=^}h׆v{j"|@ \CƉ8u]U}Ty?JZJ'rOqSLd^M`F&eNwvNLU",X}\\srͦ.bx7,2ΣP+JP M_eE:-pU8r9940)jTB	M)9PZ.i;%-[P*fUAm@?E틨b܄_m2ʨ';-,hcM[{4mT(bT`_ƭXy=x4bU #c,_A1jAu~yh~)qo
+]Kէ"y=%%࿀)P $`ûȶ_;@_ƋbK C|RR(Oh.h48HȠO4k/E۵&eU/QoXXP^ԤU9UQU5k )_$As1n_l=FPS`rdw "(I+%Czؽ}WTSҦjK#l@Bjpz\hſG"ճ06m
+|k[b$+"֌!JV#*Z-]-~Q0I2AKC:"]Z`(~3VC0wxq .'{9쯊A"}V'YV7az3E%ݡ\{c#ChvlRPt"gxq&M-u@١6@{iUV}r<s0:~.(r'LKm
+\",AMQ	ZLIKc)CtK`|!Eɻ,)ø%0Ht}
+Ϣ f,$da9&C\32E@4zYYog-G9F㪇HvVzt}q ׎6{c\C@J \\kN>؂,>i+׃UEy逢^!oZ}$y}s :,AK*Tv'^`(*ߚ*esV[:,WAUͩVWXneY5XCiXH
++PPE[|Ajb5"ьͻͩ|>j23Mm%Va$=A(:,K)M4xV*ෑ	ʞ6ƃȦrݠ9cJ=LZ#W<+lD,)A΁lM9,#-pLlΎ"R|_zr6}HB! b9ة(q>/^5HY%Ic1=Fg oQ`x20r\Ou}?0l\i@W; 	 G \p%J0Iv%*N=s4uG6M"~EP"2q^'QcY3xs'd)Ȱ4"e8X/BnSRc* T:9=ZG#IgXx1kFܦْȁʜr}AYFGQ&rjG\;8Mo}WWʺ=~;LS{	>9cWͼu|T<1\&)2L
+eC~7:08<֓U0NЊ]B,hЬנL{%b"i VI"Р\:T# [rlUDMuvG#+:ixj/U/۟<OFdяY_K7J M]-)ʊj`?Ֆ"֗+ bh)F6RmUIgu?4OմY?;tZZۖQh!Pkr@T[J9}e#l*<`LC\nBn;:ruY.LjK{ʇQdNb-gyr!ՐJy|!Y
+Rx*1gHUPVϬ((YĐߎAUy<F:&?N<f z{꠫qiG~
+9Ydq뺂Ǉ&Ѯp{i#43QZUXKy4va0{KYFՐ[<t%Qo1[7*l4 q-aie*ObVuI/
+\Z3KrEn#yEL-y!F/7ݸ:MM}Bµm؛ ;]ܴFY)V߿9gC5)Ѱ3G.hɝ~Kb~C<G	^̡gJOm A4djQ|c"Y!XF[ߍp\IwtPO帿iEr~N}e+fOcQ45;Dfcnzt`Gw_Y%T\KôDVAgmOحj*烖dE2Z"K,J;$ZA-fwEȶn9lZAT g/DPDдTI#uZ*n|S%Hv4b	J|V	i5?EyglUq GJ/ؚlJVA =<0fWkIڼv֮U{7McHM樷M黖N5. Q:Fux'kgW[uKF/n2MA#lC`Wy(d'&Iٗ;fߔqh7&LZ=y@O0 ݎ-vLpt(_8~@xη6n@ݦ='VY(n rM/2ZLk|9Rd5ÜNHR{ƳxMxEI)LGi]GI	'G3@ANq ;qHˌ>ϓx°% *Q,_ve39W`wSCg9,BPi8zݻبq6T\ ƭ%QG?gQtMxc8KB\xsme!cŔAOALԆRBXUYXZDZDTnf6u#Oe:R²_M=ݵ~SnxF~hu#6Fձ9%9緩am#do0#Bmӏ;°Ouߨ1j㫼rt5^/tL+*5sqq<T9OۈDuŅ$L*\K`̮(츠wʴ^ʑ%Bi8QB ENQ
+ڿ.s`<9#~<? SO1Y90Xw25՜45]Xt6L`Vc.Pc
+Vǳ'Ο|\oğ6v <KoW^0i68sn1kHܷR_|EއpEe$J(ſyp/bk=6nLGwGt0mauFMj:hp(2vP?<-R%z*m,_d&ʰ)*;V1e50ҿɶab;=֚|_ƦXf7Y,5[hSn*V◇ F]5e(2+J%WIn^+NCcl,It9<bΜd{zvpz8=:?ǸBaE	ЁWy,ٲ뎃@7Ir;\`[p^>~C:}dp,p쵝՟[sNuAlG huXQ]k['^ǅ`ZP&1E7ػq޲tZ~:	4ˬ6X
+Kk)ܜa *2A1	:t20]Mlw+Xj1cﬤ
+ѝB?l
+)-w*v
+HMՔPB&\Gޔ>&&Q~-jg,1fhǧJ<PÏPy PJr[x]WcE{ՆW&:/p~OX*MMG`瑾Y;E(ו4ƴ<S*jiJnVڎX(Jec/t_A(;7a. o4E9.v~&c7C38^zYOJ\տ,`e-=b@g~?wkͪ=/eCkgP6%y#~wh鋓MekO7sGTф_Xq؎z=navLkLi춼y\=>˘TJ؎No:WINr>1'u^7
+md$'jfj[(@K$Ue4/T!:fIYS1Ҥ]'q+vN?W@&ё=W0/a3vkWv˗:%zWZuŁahDMnma.a -c]Y˘ADHsl}H2<*JhNq3I+)h
+^9 &2Ţhw@
+AO;wt,JnGag1GOmoK5P9{ZssWC&caӿyy9lgLnۜ*1W1@WVK8j#_ـtAVyNX<_aNyO]s5}$._>WAD|A:$S?R艏f%e_8~QGŹ<%fK7"(qkS2?H_CM,D%A&lWʰolg)BobBɔ$K@쉝8u<4(]EaQIԡ1'h(`{d{cE0/osߺ8]ߨɆyY|O%ZJ_}-r"7ZIw VV3#p0xeΎŠyJ%
+JmZ0vx28A{f~ǴF=pNJ( 5h;	Q"fQ(r6Yw"%,i=T&~.Kq%8Ja-"<ܕ!Sц/9ys].@1ñg y"SM<WwZ˝+F16pE٢
+@95,"YM\6[T
+S<<:ln8Q};nB`$ɉ4:RP1	3NSq?|h*M[xf啓Πحҭt"6_8h\.yCu_Ec6vGfוpw (=*5}+^/ng=@	7!a`tMFx0ס-{镺Vu&qQ;!V+ֱ503PNGO9qq<N.O@];ޫpx\- |8axK?%-x|v6:|7<H?|mï<k+!'g(}&Y"EG: ǢPP@30_1#3J11.!JRPQ'.c/y<cQ5=@5)6+cqa7~8\9G9eFuoKB9V}=nI趄ݣLɬll{ [2(=,ܼXf[1Mr,8L4)	g6"ࢂŗSyHOec5OiE%!=?oê%!wSZsUs:7{7#~iِ5Ѫ&B0 \>YI!%5ȪA$X$1N]1Yٚ9ѯG5_y1m.|JP2I^\WOt]]]țA۷>x\yf:bVQЩ-qӷޕAآ4N`p7S%o.u"]܍c XL&,O+6m(OvL &gqL!AW]Bɹ ])hмeoH*ICƷ[X_]iLL]5aYp8fȠ߼ڣ5V}M/Ohl0ORC鱔#&ta|њR#枨zL>SfMGYay@HO/}ȴݡJTFioy
+X3 UK)w&mN]It)o4}wl	ˀꅩA{fP*wuBw/d
+/m5VQA.[F>٧h+;k)
+=NQwfK"}e44Vn{n(veQZ64QOnܳL\JԽ3iwfQJP\`a'G3ggj*޵aծRno/Mu>r^ōKTg;,'y-}}ے8Q"ya~z2AGˋ;^AU~aS\`E_cy]yc[_P`ˬ-^R7ReT(=	-'v>LbP,	ۂIw89mڳ۶;۳X)(`j f,);n}Ls<vk=IlVX3p\1$%q/8UCT=.P8RFZTow3l-Ӡ:͂#|=KDJG{Myv!̽$~mO-$5
+hП/ڭg1mBvEx7ߝP)f=~׊DG]м~c>7)̋VR	5֭vKxN9\0t2_7m:v̹q㠲6V9	iuh'Taؿ[W_gxG)kG++#};\2WI3u) MItGU^SJ^h-_jk	T=C)N@j6*7`8VcGs_!9]\餾
+r6v񴐎-L@ulr%IMϙ@6x98Q#:xאLb{/>LBjoWZTp:fa|{ֺXՎ]a;g$ϐ)z):VC-%Ǯv+)PaҌc @]Sq!?|4.ivj}2M1V#8xbs/xW^dp[&j%@HʪD*ߎ+GX%ڸQ',ڮ0xy'$?nx eig鄍dy_gřQ.[:85%!T'vA{	>/ ծ㨅H3j_
+ץhVR7`,&5),ikG׋Ï>g]}ǀpP?a9qCYrhJ`dW*A5zé|S~a8gYמuk.S4n'#Κ٧=sqN^ 8G\$HN׈_WB]π^9XsBhV.ub^[ŭ"pm_y]USU*użP5izT͆Q62Sp謭ʹR%b,ð;-bWcug5uWb\M]Y34
+4(s>{
+߶^K-y:;h`8chxiW	Ua$?㟆ţWz85\r'ZyvBĄW{d"hK<Ip%0嵞Q)0̢8tDqƏtIE#:f?wJZ_F̥H\"u.`JM%EI:N%=[Drb_=Kc
+TSҨԠǚzǣns5yjF< ;s`{i)"b<
+fH#3t=]) FMnQ dL(6FYƾ{1iG *D_C_!m;riߤf!XBG=GdC. ;hçhCfSa
+}wZ%I!}ʈ>k1ɑ fq4J<jr^GeN ]6^;!IslXFMĽ()by20<Ӗߩhhۂgq	Rnl
+tXtf3 ) й.,78}7Gϵ,j3bHnRRa,dP̳Ma8z>RN^
+3օ2[:4#=-<I[lVr4KJ	u&Nh(vmj #Z30v>Pb&ⷧJf^Q6xbSFwN/fS(eV,-i{vB8IV5*cU}N++SÄ> "2C.V}G년.TܚCժyji5SDsanJ/x.<T]Ek,lח3.n\4Jts(A&(P.A¸ܻZ0H?t(?s><NaA;iXF8اjq.v7]kS_mM*u e za2B#X-֦YE bJN`7jM;F է\%W#OJŜ[3{<ַ'$zcFkQ\y«ztbe#=D t,ӈY)3k?M;"|vݞ2376tݨQAh`1xxU(>:uBtzC=k]z-I Tx]f:#'V $ikX} #$zKchp;K{4ր'm-R_U?8S:j ϸ<!+m^QY>c2/ah" ^rV5'kA4,}WTW*C}xܹ:YfԢmkqRTΌn	۽Faݢ80r.%.Wt>_h*fQ`>^+l[\dliQk /tHAH9*POST,m#Yi+oCש5NyeIaj.0nZz&V"uzҬ?RB]q5zMu֘U,XT=v
+-$
+3+Ezo;H	/)>'N.5YiY͙a8nnÜA	dD3bպDDfDHne`?&
+^ǖ8l^I=)we[K2vzj瑚8^٥'X;֨Ww,BAU*ɓٵjJ
+nVj|Dx~!@RF>s,ƚZc=cl"#ґ@:hM
+G/pL86sjS3;qהhb;27vW:ZDTbE&y(xsA4>:cvQu)WQB̛:rAClNE;!3so!:j'#F	X+gdaV;YƞE_2n[\UiB]lID[;x537L%M6ѥ)h+	̴?nAJuJ1`AGu9$Cݲ`x۩xK4҂gh0/wpǰ)4IbSGxlo>=2`8ۃmt<ljaKAj10iZ-4Z&U>7!@JL,:5mSI+hhΆ(X>9/9|Zm0.EIKL$no½GF0,u,ٟ-w$@݀x]CQHPMPwg-yo0rc P!}zR]4fA#F袐[!zH>|Sᙍk~ߑYQJ_TkX;l>Q~mTa:Q/+pw{hluF?;؋mIv,]K cOv&v.H9:sX+N@VkkcmuQoUH\WHev4[jFRPK    V &  "     pagekite/proto/parsers.pyXms_ѷW[B)!6en|hZII{g􎱽͇Pg7{N V##p+ϊ"ٻ\lg.
 |b7#Cy,~?EqxIℳmexIr(~NM8WeqQzcO&=13½p&V<mt7ΙG=F8X_,0I|(
 |E`ͭ-p 
 xgqց}3ۍb.Qrpcby6ڗo31ۈ\ x Wg`,=ww%0{Pp {J<'dÇ줔(VÊIrAH4wxV\35/-&QrCwA1't \
@@ -602,80 +692,135 @@ C
 +\3'zY@Teլ"|(zMFi]侊	$/ZE/aW.Z%7ϦR6;@oRw,WF86 kx>;sճ!zf5Ec84Ώ=/v8wmubeY`Ka:=vi_֥ſK}8rZJ	Q5I(W1^f*ƛy^	R~5%ncD>@$|Q9ca+,PL'Vzдg³lv% ݧ
 ŇC{nw2ueiь֜Wy^W42yӟJM+eW(T|g9Aoom1(-tF}K؆
 90Pb8O=EQ0v0QPҪ#U.MC)-_B­\|9ƅ)YE+R.*f*Qp.fQ"dB>j[(AK]2d|U+oUGV I
-ǩ84$RR7Ѧ+)"_oU\V%r.,LWqH˞W<,Z.z@hR1q縼F7s%HN9Zx1EM+dʲ|U8̓)TVc% :7XUË4?PK    	V0I  #    pagekite/proto/conns.py}kwFw
-$>^1E=d2ge%]Q'IP" 4;}яjAQ瞽Eկz|7IqMdY2*lqQ$E;ȓi\Cp^P+.x6&lݥ ˃lQ^g},FtZޘ]0L"O gy".diКtV~6z'^`,iL`N ch?6-qr2nӜIYQ"8˳ͤo48_<oQ`y]8ɓ$(IE0gt(t%܂,f$^I~W`GcO&IYl18%3D >)nq0|zo}Սmcv>>'9YnIAk#DIs9VjAw6 lN}v ̛l0^t`Q$ŴP4>]?x{i|m ΐ ) |^o.~ǎ=8oOσlypA?z^'@y1N8fMǰ>'68aW\>
-{#f#qP#h̲	ϫmm-l)(^ƻiCm"߳mR_ZI<bw"'f%#po [M3*[4F%WՁB~SOF<-+UH4)* (8>8_
-E????vO"h4:Ynxko#@ʵx544+6(z6dm;C?'H?]Kzr|8̈́ 'G'gzk	0N&@YZLMKA
-1N"RIX$,UI'|#V0 @(3( pt"jml*+hvA/o>lW	s+Q}T@>^6u>˓آV^CF:W z9zLKƃ,SDõցYs.-9Β}s#%pGS;:8XCP}~w<у)iV$݋|԰ tґG ,Hz߁&EdZB;3nU
-7Taj3O!QjO8^x5_s	a+xDU4q%69ή/x2IG2.8iV:(xB%E9<LGTGBWv]EQ
-r>fyW|w-#5+y̡wI<cfEzD-Ó+
-i8D+t9lIlX@wîH|{'{wqv3<v^^bdMM*$	}CE ~½ejvH(8@Öi~;|m<Zuz:}17@\jxH:7YQz0Gć Bb4~@Kĭm$+(0ø T͘d$S3ll,$un?hQDV)A[>:ș S9ΑUK D4 <SΝKos*>Mf[tЕ7HirqUfLñ*!7h
-(m!-nU9`#-MZymLikJl7}5UJyY _ܕ
-q/ϳ<
-y%]D%:
- H,љ
-f90Jơwh! M}y G#aZ)+!G!T6&qdE#Â"d: @d6M,zB輕vj07`IBD,3 b[ȓzYza5jE\~u]ȢBrSTPφA	읛>
-߳t]C=`~:$2ryzB(zj=D;:=rSxAuPi=7VK#1.	'jمSΈH!]+ęY%*tu&Ԅt^nNܢLrkve[6QK{;WAB_s`d1q4*~\7Ҫ.^?%}O X`$_Y<lQsoe2Wk$!0E7rBmtE8KAJ̀#cj?\[VoЈ.p80&h"pPk!d-Fa>(B!\ӱ>ϦP,גkd}Tcc:;@BU%-64͌(|V9`bجeS
-^*PWUw㈄Ip3[PЪ49L8\X`Dy6+{p.>j'aD6"+miKρSTC#UDzO
-J/bxh`!N_-9ݚj֐v_hS2S7ƭElsbE@-ldtY*,i#'Oʚ$-=7=܃S#TsvVUtadۼrhhbk]KP tl&x1-Ί$Si|98&+ZrEBsE!Ta`çвŬ/P:AD?)ۨ5ryDVgtn#]rw
--4 xY +>:  hUL1U g=Y)W
-򟋬MKH#5jOW}ΡK L]@AG@? R;Wr^j9`JtDew&524rzO&uwz&OZymg
-.[+z4K/`sa#춫n\PHUwvk!)/eD*E6a'S:āks%38wȥ"?t?( |:xrƷE6Y^v\dv.d,ykhFTh9cU5rF=%=Nr_ ;u+ki4Hѷa 3[UzN[j&iV9 Uyj/<\]yh>`,1Gam=dv΅dIA4K- |-`Uq.lh?@P$zN]Zf5sB;úAT_4i.Ua:7=C a/
-qh?e6~[xa4,):"?4/+D^$q;8I5m5tP-Vm)0,%ޛ޷8ip)
-[UY.u
-AzV'M{
-^K03UQgIȖ(k
-3!ako~ukьY.ܨhfŹdK& (
-(K/]:58&&7	5-6Xf8Tc0X5dXCkIthaAw-x#t0GxmB6	gM+z'БQ4.;BᆍrW_'dNZϸ_AUR`}-06b#~ e~[{zϷs6fKye
-E@YS"qO8_Ѽ$@@W, 2]{ǎ!9"hřM^F(#TRg$ q-5c^''c"r*̳Y4XP"ƕv4xqd O*5s@IofMDOa#ܪg۬wtD hۻaOĵbhO:uڵ$ub^[KX!RU2/@Wݮgs $InΘ0%s0v4RO۞drӖ}k"p[lʞ]G7!ҩ٫xlE\	Nu Yq8KRcQ<nu\օ&e+NqP)WݤZRWmcu,T05I<==vpxU&-'-73F%\<aic+#ܹ&krC}53o)^V˵Zȓܡ)$>'LR2/{wGAmV/o	w>PGvjw_%kG>MƝze![ڶKbm<XQ%c
-X(aF`f4G:C
-*GafƌKT(=Ny[ИΒAnEېX
-|Z(6awSs}sQ
-:{tDjt/WnTAwp2W
-33Y;$Z $Y12P1OFAx#jN`+xe&*^Ѫ$݀4+,\a<,%3z1bIL]]1oA ۛ3~~ޠ?6676X}h\Q8f庽$̀%f	I%wv~QعEt_;t-<mj[EgFq;}'g2ZbeXs:ۊ&#ޒ 1>
-o#,Ҫ]p1#MYwu:
-fa+!EFYN	90eVx#\@N .!)𔻠AENeA9%qV>cP졼vv;JltYN3F.T؛Bip.X	[(j7CȼgPS:ꃙd׍2;}e+>ۏ]>52%6>qz=`jvY^uMyhmQtQhU4I~B-[-\Uew	[B W2. 'V_	K>]:(tyJlTIʘwM[v+puMC~V8{ӓ~92soWd%tf"	7[\3$Ry
-TP} )T!hj5xT/ŋ ~3co=?0.oH{%y٬ V[#_Vizځ_]ym׼n8u|mx*J}߾~[Vhō_ f]\׺5R2ѽ%=[[چe!-Qr6k!G+TEuu\5ٹ"¯?翮􂽧4+W#.}	5vײVJd:y`Om#(yӠȘܥh}d7o_8"zGxc\Iw4TmA}l8&tbk+xۦ"t|s{VwY9uY~~%pz]$KR=^p G@JMr4cf hFC`uSwDr)LN	^>=neg1--+mZ%hztEq@GyT:q?0OVX,O#sl""@])w'#\md3QV/lƭe O"2t`*9$&Ji5hl)6* SoWFp =Lڹj'v֧jQhSg40rhe/e(LyT~_ǌUejZk[v~??Ξbށ{_5΀ԛ+AH?)߰G	ޠ?蝟5f]X|K*fg^~b/z8}7/wQLg $4?F-{Ip
-BExb5M_ZR N鯖sfH1$t26֥G"&	DWᶞwNޞ~<63jmM3\JY5S-yÌKg``)	Gbk
-kilSΫVƹe ȅ`̂ց`U_:GOq6WoRm4O ^5:>;\~:Q8 ojZQZH<}P"(j_a)"~"MӦ&Ɇ`I@ywM6ho} @ 5+]!G9w⸭)chk]j˓]Of4x6Lqo WK͍Q3[[=t`z/=n4ߪFZOE`cRyJ1ˉKC8_77"rVBtWWqU;}u嫵iWj4496c\Oh%hW߅ǭdb#T;j^ZZ*Y'8$j%
-4(+Xm!bPG7L(V֍ƙhUfMw@5[@P	(i[*N8k\e:]Q+SHlҖ@{W>GM{bK \ݐ+*6-[> =;M~޸*YRuԘoOf"T.?}w9ܟJ1hͶCI.2S_IVaǧnSf߲M(ci ^^)sy]Nz{O]rl_3inK.olq}.e8MdIĴވ `ҤwotEVg55;IS?y}עz8DmV1ƁB8O)h٘u_CizS#
-:еS[왆QS[]YE;Xr<{YȉLU6.gQ`԰_uoǄD/i1aRuݴ6|`{kw(wx
-Se{L2W`g{)6$ˠÒVUځ]gy%8Nr%xM[DLmȀr9u`!dwKM&@"a2=)(lޱ)AB~v0Q~@X1>\|Ėv~ .
-n;qԡNAl&2ۤPdI ٴ'(bspޥg)SJ&BEâ7(E
- TRO:Tvr{{,4'uk0!^n3M	w6~\eeu"Pۦ=Ѷ(q;C+fSΨ`=^}Rb^62G_M4K%淛u$;}Jo1tC[n?E)acYFPX\yDvEkæ$v|'y(,ę:[OnH;w]%?-KxʞCm[ñ^¬i\xbmE@mAO4UΰTK?;bu"BLdn;'VkuEJ\*h}EkK٢BQ+kV^5Ug.cɻщ~ptoh׊@( qx`#s
-EIQ0i~y9A:M7"[{IqCvUo:jf%N8jz	3ĤokU 'Ы`r[S96ؗΟ<o_۝xmص;p"N(1+89y~[c	l`Z~Շ:u^IW%Nj65lS3|`Iʎ8gL01lRDmkޡ#
-1Tӑ8@QG~$$n#`5Ɂŀd|IxM int;b=Y7K&$THy#ePm`5AN1^#<xsTć6ȗ!nUzoNCq-U=]/
-R> j0^].}hכĒ<q(u+,!%,?an#jP`UJte``;]~~iZ*qrJI&cڇ=R`U!!ʾevm*aҚ^ƣ.&Ȥ #gwfcIeYe3׍BBf
-\sp@ptcBI~SϾ`e2G/iz_Oء,`)HSE@3+lG+XahMopxaL\]r7O+/Jxj=sGtXJy%R1R'Zx%^	%/2;ekGRUj_ߨtI;W*.t;l_ٽ=;`ep:1*껊仕-}eVoԖ_5&hmɾ8|MD~Q_PQ;DrgG9L	ivj }iy']4ٕ6j'UJPGtn;s0`__2U x#U&خ{#؜5i-G4P+םӣө:%Yi~~aaxȮ?2JR:#	z J(5ʞj<xa@z覸6-gpƐŨ̈́GP%G*hY]j:fSY7HquMMك]<t-dXQWXPn1(̗z2TjͷcV&b! ߾@@`.a.0)J7G71'pY`$1g=|Isx|A='׻87eE&YsEAۭ=l@;MqzP!KOɁ"aᄁkP@|4x_eVkT&fU)Ϝ=zD{.$B}%wW\KqV˅T;?g$$p6\?L:eBa|ݥt! ffW~HO2S	KuOv]:CZ!?+[:ܬ܊T=g5V?<ns{i{D~xP{Zط4(C,@Eb"fɭjCS,갲B ❚nD:U0-9!R;պ-5D 'J}Wc|BԴ]Gb=2ZEW67FIgOB0S@HH|,ޞ*>%q<N,6
-Mr#/F|9J;i{ۻUIBkCiG<^nNaAȚ6fdԠ*[|%j6 k&9Tx.*Ƀ54KQ?8]Ѳ&V1r#Kx$Lڲ[	tE`:}% JݚΣ|T߼b^|ghUѳ#LgqJ_l1#28:~%	XS'#͉1ibo=Kb=`<j]OAgׇRì/z)Wl@x3y,wں{o񻳮۫brQ"iƑnQd.5]ZMxuU0*76ςhIj9X<P,_Bq`nL0GmFr}o=v3ѓ	.VR('Gȧ^X+/7Gi>Z6gRW˘{"BUq"(= OW/<&[Ԡ82sƲrɡ16}<1kw BYRb?+5/2-;}>ǌe/Pī5S L);CccbcR"損x"N@ͅT{ds5]AS d3OiRhY-Sd,,gKϺr\BMoXݨRu<9HA@J}cVN-D(hB>^W]-[Mf;g7s[_;WɁ92麄V֟av0	JKVKk.CYL6eN!c)<s2nda, nTď2٦'t	ت2Җı91jC5?G-M894eh}D;nxAB@w9 A5_;<Z"nRUVsr>Mo3Ÿ䁡1o~]:DIͮAν#fqV{\Oj9x+~3B.]2d }6y("nHes2Or'2}̷<85NNUo6h ;Pa{>/
-ߠ(+E8gȒ2)8R/
-J=e\ }rcݺӮ?շcT;Y
-<nw;8e`[%" 	Di(&V 6FFpR;L/U{rbtHIkF,Y[lrt08GgGEŦ"5hLӤ03Utgrt)Rtf3mNY3`4<B:Lɡ%}ޒGՒxnX|c+JVLTN-(#:o םo;m4hs@^cTF!%06-s
-&*73Xa2@=0E%DuN]dnJer⿀o6:x"s:\Ɛ-wR	9:-;z'ZIgA7Q?
-Th#/erL(61j".,*o*teE*R)ER֬r'ڸ}MX)IrʩUPu|ۺcnȱL?>sU-	\Ћc3t6bKD+2Dy렄O'q!r93`nnʻn}5|<tBlz^|yj+~jv5)0efBᔑ?TD3:)F<FY}X;4)tz\\@NљL9Kf
-4F3taG8+,o{uVyCpwvF1j`ugNWsYm̯Q8TjRq-\Pt\ـ5'la8a$SRW(8V,<NӢfCӒ䎝~BFq$iW*NȺuvpڧ/D*^G͈}SMM,SwaE?H}OJ $HX9/zzMwL2K=EBf\AQFNHXfӆE;t6Edt=F
-zRcH&9bp)6cL$*5yӉ2G(8G[#WCzjK=%:/NI'H&v37 Y]\(wMGHSµ`iIsS&d	^1ST'ERҞv֩xyOoB`vt~qxpvaз.z5vqW& 71k7 ŭ-NCJTMs.H,lG6SP8_wcumϫMِFh#`xE]U]r)(>yrv{.pNH)2ɯpi:){;lzRx$y<*Yq*".\	$~Үȋ
-5Fkv`U0nżdfVߕЍZ\.'<柞dЪ.paB[h]TT=C5N6x8oWU]kb#Oxۯ2t5L#٫(#?҅Uǒ0^.-k7/u7󉵳_zתae@FK*C;qAeԭ嵐մ3<;WI3y~b2Cx[>G1RHqv!5̓xK
-]3iZd<`,9Eӣ%/| ̞uvn57Y_ák&_kq*%Ȑ@*@dqRF$/^([11tBxWYK?aP
-h
-ZoV2wݐjRh n& x:\?[m"8C7^:nű'yb&!ECM&Hnhtxtg=o^j^<p{oo=同WΤ_iO(Cb.EZ#s:r=Զ.UKnG(E
- zt!p[MFz`BmN	5q/!jY՝w||.s6CDG!?m7S%C'8W}Kp#2|2cԈ,]d㱀kTz=U	ȧQ/Qj!mvmŭV:η~Xvg왕v@G%;Z	[{V 2naWw+fea#B~SJOm*8m҆+$"qչz
-j2f#9Q5bqW[renr{q\FZ-*ڢ<.oZ~ONmYskf!nM\/^ȇ?y-263  FL!ǨfrHilt4 ⫖'ɖm~~X<ݮpOQN!c%w#/;u}vQ~4_vc\}3]dj6ݫԼu(:^W^TX4pGqt~/etUJz;N1PL2`h(՘8FnL媕HʬG읟{.4FVci
-aK$vptһhRfп8/ؔ`4Sdnaɴ 1PYtVHwlU-T;S";;{\^/δA#JC9^SM7x77Ƶ)L)-vJGo;qN|z%0g H*sE:PxErpNKay1""VcV)lC`TV+geClUyO}zkE8>/6ݴfj;:7C $REᙰ?¦VxQLQ!轢;JȢC6$DajYMq9NIS2şD\3qtxh#L*'fULLS^ۊ!gP#Up-8aہ!Q,;c3j91mUr0e %W7Oħo>sjtz,mk}}r2Q `x6$iƵ6~q2ƯøF
-F׾T<	/78V!^N-tDjFo-DDۀ}Ltuj :QfOQcun[A5*.(z 0DwL]t~J{5[ט&,0OxPp pX!)WLŰfӥH(_&-xB]}tuq: aΌ>üJoΰ|F5sLZ*ANcR*EsrDӋF[NNײUVJ(6Ufe6cc{]DZ{UG>o5/$@o-c]]6<=,h24goY^8nDtybm+=99"Pct=AOD\P @AF
-=wlZ`$6G`[҇,3pz3	ai1q=E#7hGm@ݵDcMZ6V7tt2^%fg)3nnI@'(NUL<Fq`h'' )G`Yq`[9iJ3r{wW}RU)Ve])B8GEbz4Ul9б(!V`ju\Դ	jbtA)S$;뙂:XijKϕWWИ :R<w ZgR6mvF1*)}XH"Ŧ"^~ZBPUwĵd"6HsjUFtG_Un<'oӦ<onМQLG'Fq}cEMǥ;sCY@T]ouEWrĚ X<N/%JxY9rmO=q\c2>Q^ɦu)Eb3j,=tkc\l^Z $ejh^JVŷFVe}=P1e3joi? 7Lf!CTP	qw.J`$wOJ#-jDl_ٮ*bKpdڜk}"'68∴[]y׈%h%~j:B|R.nB1Y)nKފn;{W-/iMU<q}ן	7[9-0HR6U_[(vHbt]ЍEkz*S;Q8=j)j%|"~2@njK	k-821+~lXA\$d43W\u]cP,wG}NGs,*H&k24^)ZZ&9|o(4*AӉu,Z3n(Z*]e4Nz"]k`g~.^0WkzY>})[̂XΫ[utR&&Lmqj^Fc']ۣ6V[um{%{	*@kdԤo?ˉR4n-aܹYewۚF7L!rGXnlp^qaRbEFvZt&:m ꩚E>]Ԩ8S_xҀ݄	Z9nb)WD4^;lv&Y`P&VMCBbۏ 뫴WhDEwyͧ<=agsQފ+X/ؒ#K"o-\2A߶ Z JBv:bZRTS
-yZ`̮_d_aS%eFRQ5!^L+Qtb`{ήu&H[{m?:?pʂBUBL~bqPx1/y{`?K ' nDjTX+}Uԯ_?hN0Pal6T +J[z[JΒXq͂+;@Gz(iϠ[Hl'Wk\z^\%	\E+WvW I~HI~	D8,VCvjT71 S΃>zT Zh[X7R<BrBibmt\=jUz֫-ry2[nnjI(Op')%#_I<֠@҂oTiޔz& __gCe~QdBk]aTջU0]'Riv+HYj1Wޠmd\&bMsܣ_:i?)Ar8۲Avl-}[/vZr?K_u=e}\zA}g!Q0`bNE4:G1*$,Q@錱`Õj3DכqyNKW*z?Fe,FR*ߙghٙ\we)O@}-`9ɒ`U@;{n]Ѽew~^oeTPgtzȇi}fyeC"K=ƓT%IrhM?ӡmxW3{HUvhnh(alEǤ0y353k~s_IZ㻕\]2o,94pB~Gdc}ZTgy:%ZM/P8ʱߘWW W\\*30x<C8(=Ԧ^#{Rl+w.j>|C;}2'ydF5Ӟݕ:uлadAeJKn3X*$#dܪ68Gj6ElhL8Лi vb"\?.E"b1!yZ=Sse0f+lOUl-;Jjl_xVnЬ+?xOEZخF e?xUbIBUC{כӄxԚ"BtRY!.r1dE6UaJ̾?2<r_grFjNd9[npj梪tU Zցr}k[L(*jê#w86˗DBA6,t	Zf5s-/Я^bsY_jѷ~6
-ZIJ/C.W;_E4-3Ak#ǉUUYe~!ÙRTGq\kס#P`L|}S-r8M22]L6	lW+EN8A/X9{HD\
-睟ZxcIC 2yJGaA;rlV !]j51}Nr7/=4Nj2ji@429Jd$Fh.sIHVupqE]=;MsȬ5_Im<X.Y)q&˔2=_sҝGAVH6ӔIR!0D5p{X!09]6t\t6F-2
-y8ZZV^Dt~*
-T(ֱI<5|Aa<s4uؑ[ofNRݾV~_g̯ɲ6dV铮}$,>ԙ\s`̫8m
-Sy3C3;	VȓΙAR
-@Pv}G4]n[
-0
-lVE1	VCtdR	tĤsˍ\5X˳vS& ҡʞ00,h6 _ҍ\^UI\jK]UARm^_mh:jiVY6B#1+U'qWZhu݈{gfk!8ueM+ ?8ּ+l#Ѕ(C ꘶8s~9$j$Qp%BbEU=	RMꆤК67\R9	22TIh,Ɛ^(>ݣKI&˘4!#y[B1t_tҹTf&Rni|z< 0 ڐSs>&lWk3V"1-p)"H2qF-^IPnOP6qJGsV%L
-v?xՎPQIneX
-RW$X@?$aUV_kgW7w%&$1qIR5ʚmsFT	c,[ j
-%,k;=$Z{{C(GUpځҦ ˺o7舘4u 8tC>_սv׵MŋvcG"?PK    (gzZXM/  ٶ     sockschain/__init__.py}w8r`		idvt8@o6c$66kٽl@2؝XRT*UJw(<r?~ZȽ^}qMŰP,s_0rQUu?ڇމۡASt](y*F"t"'|tfM/lwQR2pfnd#?/`Nz2>b!A!V1ݩ ;t	n;3Gw_; yߋi\l	lpv&F
+ǩ84$RR7Ѧ+)"_oU\V%r.,LWqH˞W<,Z.z@hR1q縼F7s%HN9Zx1EM+dʲ|U8̓)TVc% :7XUË4?PK    S][ Q  A    pagekite/proto/conns.pyսkwF0]$Ǚcz^YXodI+jtx@0 Mkv?uKuAQY"[uuUu]˻ʢ̢.,y1Ӵ4O!oik]:L|6.mTQo>eQ~tZ޸)h8Yԋ2~^ub!n+6?@k{?/YOgƳo89?<FƼniy
+76Yo/%_|bKs&KgUN?VyY(nzii9ˣ,-*57/2o,^JF"3XI^e>An,f^Yy_aG(ڻ"%ee:i>Nq6C.DwnDGOqQ2fO%( &AwX} ܳz͑N|F0yx	#\i4ʢE,(Qˍߢ{{([F	Pi`NËP~o`"ڋ..ߟ]D/(dpbW-PmL:ͧY6~嬠g	O,89RU=HH&T;fEݍ]]wev֔AT[i~ݴ6mߋǬ6*+t<3EN̖J4G?4fx[E%Wt<#^{福znVٽ,>f7wPU?X5= Bc۷l(^rU6RYRW%@eQr T0ys7z'ϝ:&i>'ݍ)y	ѬaЀ4<{w~Я~qvy?{_/Kzr<;͌ ';?og^?c&8,&K[E"1ΞWl$`&-Uo"21yp!9LLt66[h%4{S@=]])^紘44M6>|,Q-acGoa	O7zԜ3*N ?[{_ PUSſ̯0JeGu65jsGJ)BރiχѫܧsU&5w{^hC?|zzx2{Ǚ۬3'b甘
+h۪$&|C{0D"[hu`6;-2lxI]ˠX\cӴeJA-Z+ )?fUbw:>B԰\PgqZf)<X~Ogcx	Wnj_=T.3gQ2f<% p4E1D?*}- k^K$Si质iV6-=΀e-Z@H ^!/d8`(&1(`c@bI3|k8hts}cd+6pbS'&
+1
+rah"WNYj]ȬL~ukczУ,=	mm]?$I4oWKž5tK=#m㫽Xjmg՜!l7fۀl漼ͰCRmY2vd[go\L|"ʌ
+x3K%!&)Y15KdQFc(xcDL]s"
+$ $H2v*ƘlĖ2=zT'iW'wV͙U$%)6Km,`O@<_ލ	3 UĄaitV z^QG9̥C,$_Gû~qƯF;G>{5z=^ױCU܉!+z	0خ 69)n/&^Tt'2%*f9 ーR6X'p$1ye]$]=թxR,g1Ӣ뗿\Ս_%6</YEHUi 9Ԭ5p7gD$ѤA_᧖dF'н2a(X~ڻɽIq3wkd[wvԤ݈K6*aw#*8Tx7ztNT9!P=8tv04yt$)GEmq	
+讨jqQYOɊQUd8+"!`fVX!ÏP{Ћ`9ЂO!#>	[X
+yq/y⌼DujfTĴ83h@0;VWJEMNG;sZHt\dS`:@?
+f3)+
+FWjnjU
+HsZxX$?g_pMioJT+Tt67wT
+aYeJJt4Z̀G+ng V0cXϡV6@柧WQnlh4ȫ7F`qSW#?*QF_̔츛lUjEwD-g}Ȁ `c)>晅UQPzCV 80x;܌%)()BGoB O08hiqk]a*a:{/ffq%PT?<#bU>~tq >ics^D?;O7gzODgg]1qG'Q<nw 0m]ٰ47G TDIWH:R#YB	6G[@΁۩
+؃S7v	;WIfܹ>'VgԈ;ݝmw"||B|[)-MY	:f 5JD\i8,@48nZ/n2Vڏ=+qU\̱(]@_]`(	]wsߛLp`nmLFh+F o^1gXV՗|:4XBtbƵY@hw,Ө_x)yg?̌yQ06ĘԕF.#5խJT" y p|VG|rC󩫾kрdT&B$8֙'x,A<-'V9,f!F|v½/IQք7Xi0Ui?Ј)sqG*՝ nJܱqzgo{Ҏoa"<c}z4ƛр+pib̜[ j#SM_wX|m==ܣX#TE.HR0/w/~nU]~ZXs=,&]L<+TլGM	#7iUe.Ma`яBbVUI\A Ţ Ԍ\iW80tB\7]j
+=4M^E]LaBS'j=Y|fXۿ/:]"}I4n5ʱwrK*sp^\G縫z7%Tۊhq<ހ<v$szz'ͶPB;"15*ϒe>][}e̏Ewʿ#2'uDOۡ(C"}@Χt#]	$/J7pG>}P)^-< YA3}PԳ(k]*jqXyklFVx)U+rF=%=^F)vb6 2io4rR\&؎L2G-V/zpuE4DLb=4}!}  Hϊ*j4=K= 3ŝc -#glRgeׇ%0D%Gk4\{Q+u;ɧB/-.>K5/<4N!NӍ`]IOVhFޠ,+/Óÿuf%#H䘁B+*
+4	yZ>KҔV~-8TKpqW4\
+>w8Tp)ފ;E*@Y:n4="U)>
+K0#0দUiiXPT/rHwG`W,/a*ptś$$4Cc=PU'#p?k]C,ithdABdƾ0Vi[6RfM٢+'Б\4D;ᑍf[E_dd/ۥX L/Ϙpp%T	ݏ!Y#&,I"-<|щ|kF˞luT!<%9[1 Nq񚡊f<F,Y-Q5  :EvzDprLV<ǄAx$_<@y1Vc$ kGWۀKh~uq1D"U&q#j`۬w=9tD -kMbObh-~jN:MڵV^Ŭ똷+"u׼)VDG[uݼgl]++{;,mV's8;+3&"~e6nۦ"])	v;b<ՃVt2}mtd(1U9hW<$V5{+tĎ2|eixqQ=\164&e`*NyQGPݤZKRWE%T35I<;;ߍvpxUAԝ'LH36ųWnry1ٯ<`Κ1\{(Ɏ1ֶ-gRku'aO.%FjV"BPVf"/#7Gܰqc4dlG}u◘C83
+ͤWBO,K]}[MKnݒgo2+*U}D2R+U5YO3ehkmltO=$
+LZPGWd%?I5mH,A9%@Glo2<>37|(!_AgODuOt}qR-1>1XHLFfɕwP!4+F٘tAW-1Xj]_]F/_d{9O"d'+tP3z(
+Œ<ڟ]1oA 6~vo,T[v`>?SGj>O	,d|n`Y0AP4]q{gmx9uN_[D'C'ӶvUhiǀ	{^}oL[a٨]USkNcWЕ [da6z f'?@! "}>	.1T]the2Rh\%Fh/#T"rq[6$r7,^8\{l]^;;hE$]0%°o/NsqnH؊D&Iu%8-n3q:"VR곋
+:ik{WK,걯.s<*MRະߋۀs:p*sSSLr) 5EZHepԶ2K5LWۇ|moY
+$h!KY骏IN̊Vɮ]'jB*ܨ"c=`
+OBSѬSk5l#Ymƕ H?7Euh<ԄF8CA
+wVLzUUWhG$s2C _*Iղke;q|ʒ#ocGKlnxOc,I@}@s{B&Sd$GW:A+OwO+`"lenL`jMkV mKO+{:&y*_"Hּ5tIƝB>-P$TQ/c͋$~:OG9t!BE1lZ%WYOB7&kkpmB>Ng#DiS!POЉBh\w_AA<#D1{{!8eɬLFV`w}=6!W.r( |gpoQ{e2;X&WgC[(C%]3t꽥7b.M5lfHZ
+EEk[XR	8ҀёylkMEvl|8JU-I:u<GwJL2!ůgg@
+ڰtEƸyN7^]RX^)$ۈy5^ c>-o*TlW9
+ڑa!8 moT
+&ۄTo3o
+$֭PZ\u4ABd ?Pztwg:} _des;l'=s h
+'E;=h́=+E8%|dhA F&W-;LV_ҦUkŏFK
+yJgPAmeH=}T:q>40OVXsHӋ@#׬lŻ`܀O~ ʜm*sF]DL3ģяlٚ}XfiUHd]IDo~{siQ8z&GḾ6lbtH'Ke
+̫U<*VmS~?F~Fp =A"\j8+b*q)^3a>nx!sBb2oge<?LcI2ɵ?]zǼS~q}IL7JT ]Q9..*VaYi6mm뿊_\_Ol宪0	?F'hh<	JA/F9*\ɏ0p]V?ղbt	pq,%]{gx}6.Am'ӣ/@~vF=aSr;SdEMŮ3j0xO,q2q5lYSXKcY(m[u2帘Uq.cTJԁy<\o
+m(/03wT2x@J׊v``}):Hem~Ywv7#Dؗ	SGGp 8K}Z@"L
+DD""WϹM_L1};BtBҀԑtӕEBe&]):S:ձ%Ww-Q8\pf/3hUtR~|?Fcpp0%lwVBtWWFɳc䥳jIULi>ӝ+A^{`ߐvM)%$GQ>ʯյ;|ܡ?t3y6kI)6(a8Agq٠s|US<n*K?#H]űꏷ"~|oq׋v'Z$Qh -pme>JyԣWю>GFqTK놳qXP&M>-ƹ]!rб.*Hƴ%6w>BS(#k2TvnEG[Gm[ݳ[!@ U*ߜ :Rz3iKNb,bj̷'9;S*YߟԾOGfAR}`1'Iq.>w4?g&`3v~຀3uhmJ4
+
+@9ѣbXY7f1!U\EK wP:HPa 	Ȃ8CZbׯu?{Oy +WYB6u?G+;1*:bNN**(4+;}| C }\'co*wAO*-?lČL:*($]&[_%vcv pd_Xi	p5{ks&C'4aq{~ڸYq?ToY`}MbD1PWr'
+gb4=i$>%+ji;`=ƊSr5!_¹֋9tiuΏmPZJo驭C}MC_.LA#[s.,y:a,`rvE7MjvL6op| z:'fH>zT=j{dR)*9`Vq
+f\;zՏ0eƝ~} S4OMgO0Piz Yn.*}^ Q2ߴDhՇ.R0qRPZLÍ(|m	gn;C)5bt|-\TX Lyxh(6~0Q}VP0m|.6)1Hh=aIBRtd	Vx쐼҂Ax(QI G|FQ%6Rb~wۛ02ww	6CW'/~Iռ$k>,rkZnfAS0`DlPG5oZ;}~tÁJolh}ʹm ̀0aq#Aݗ7Zb$GOcԘo9óhyeRo1GtCkt7)㋸-rki(s<r\Ya0X6'04|~l`@3-?Kx^.f־|MXaV~4-ZZ"ۦȀi綢'C`nF3l(юXomnPȊl׍Aa~SDUE$lۆr6n@.G6PR}eS6
+2dѥfh3:?>e~p|
+<M(J r~0aSK(i	Zʽh+'Y$1t,$؄oggh0`WFkjfQ#t8$p-:^|ȯmK0Ͳؗ޿E?mv|a6w=b48H,_5Pi#)Xsߍ^~>$>-Ш;YRϢcN{]\^ sϺzO| 6)eHySd B*nP=.J U 1M$giҋ6 DB4wE>Όoާ"5I3
+7*qt>x,)f"%̨{F4hc=y3mڢ:DIlұL)W(Ks8U		abIɆwpe-,}]GaR@^e7޷WH,R饉6^7sk:ǂV9Ex,J٭ỄAkwN]MA^<,2;Ze3׍BҲRrRr_!n8q:_;dو3Ф)i~dUDcSRuVmz_~|-/r1FĀH4+  uEPaO$k~XQXXB?ʮRBIn4+K.F"8S
+gG9!ui%1	
+'R':^޼^!  fr8RQy7weUpS #E]a,ch!P=Ue߭bY%.RFqCvؾwiGɆqc-QE"N#Vo(!T6kq{NMTAhm9VM,SU;-W;>ZUnz?JX;	aᆂM3lbq\Y{|ԝN5)Jue~򒄥` #[䭬C|6K`x DHG{,h58?`Bٴ#(C16ŐgKxD*QPR_53qA>ݲ-?"Ƽe`׻mge;:]V)+fѻW]i81C(ƬL/@o`*[XCSX24)k1yU5fϋYh3&qLw_8.zh%.0zTG\dώUϧd͕!`Ӄ\k60&,R<7Ԏǥr<(7Q"LDrmQ70Q0^D޵AZ+'*#sH@g[<KKΒ+ooV˅T;?$p6\?֎z#Ka|4#c>sT'x$ƳAMty}Rvh,E,1rlx-`f 7Vt\jd;dXi);]9]oc./}j^4(`iKQ6Tm0Yr먆,-%S@DVmP|baSSZ?g}('$]*F74fµ@$JRE+\6d6<~.do{QwGlyի0/%pfqwq_vKf33/1@*P/FV!Nm`8hY݉qUBP"y{;Ua]cy'<^n'<dMYa*jPUoVmB+hcW%	ōS%->hYMiA5%~bmy6:QV S~Q>f^1/Y_q8DyȀ!1YtRee%'x@\:b{,S8ov=6Qmf@nP8;umoЇW4Xqgܻ~m%nͮ3+?^̷;v\l[S0Jx~쓉ӻ/JlXHm<W6oEGh=Jj9TP<R,Bw{QaR2^ngAnk5dc]g:C	8/ǋfGע{mOaMIk(5np"R=	0t
+S2A#3:3=G9IoDƠ쵄G,K+13Y󮋍W2gGoXv#uoxZY
+y?_;0VbHmhB^2POmGg2>y% ag缪hv1<^xEq-Rf#wOnExҹ5EHCt
+NUTnVVh8^Obcĉ/(E*AYDV}/mA2o"L$liV	ٱ!}lCSp^(vY*8R7jCwtOINHz GI	c\!qL]	pC-l;g%ÀZMeXGvpbJ뉦(I=d2Z'087%ڷ-}:1!T TxY&[ftĜJڂ%BqZT.Ĭ"2KQNA/5AP+ǅ+$Z{c<;IG'TP0XO85'+͊ҍc pf&0VPKmBU|N&Z۷Oef\V
+xP87{^m,I>O>s2U9{c"ѡ^~sL?X~Ĭk	ʈv$O0i*|MPT<K5ڤ 
++y/]I#(|ƍ,O['Ta^#XK7[N/'?֭;t[{|HeB{8nw;8e`[%T*:큹TFjOK՞GU[:=5i-pH8|O%aFwS،/iU2U"~1 PO*=`/B钢h3L|L;sPbXGPSrJ+##\e8ҥ$ݐգSKe,Λ#AuY6m+c;9Jl;=BT0NMaEP=1F4X$u1SLמ:%x":\~g0a\;(&m`%8d@<5<}excG:ogaɄcЗyGqtG5l`Jc)l.
+])Jojqa$v(+8tKew:2޳i28N6~0FSl	ES|GO7>=;=ڽvpr[ꞻ=rԢ-9Cw0w5ڰ`ħ*&(ajpSIM#~įFyz_m^Fno!6l=z~5*_
+P8edXEej1UtQ1KSHǫxႝ TdY2w\9]27bqq-HYeVƸbCvB=<*ٸ9y4,@޿(+ N\9[\@du'"܈@j%vWx){:ٌ~p>AFV2Ql5yU*͹ۍa dsِQ1ypt3s ES:\Q]<ZF6cƕQ-Z%&g?KۓQs8SWQbP:Sj7:l&"ؗ1(t3-,|{ڝJAV He%  Ax1R{W`,e`X>?19>Orx!#ًE~q"4EUi#+Ii4&_^9FSKV[	q	xEIEafF.Uzu<G8ĬFc=%: NƇl4 c3E4S1(CbL^78QSSJؿU[O^b|nQރ]]:EuPyZ,#e0Wiې$c)tv|q~dx~7XW
+=Ľ56B䀢a(nm>GJ:=]u(Ʈ_WȞ[2RG@#S}n#m4G:dj$GeիO+s#qu(pcrZ0m)%q_`1*IE¹{	V2ETEfJhmS.d<Or#Lhfy{ePSJjN[DI\H9z>RstY7@❲,uJȀ5[0h81bP C/t{;D)i${YŪzai0OǬ}}1=N5	`,n{ذw-p2ޒ!ӱN))/o'CWȮfbL @_e!^u`JS,twi=,uP7h5ϊRkNOz<5@NЛ{C٫ J x݊xsd Ce-D&RwGKom찫t'%4,,3rtLyq
+rIFic.IXÞ]y[zE+5PޑYՂp 9̀摿1;-TYWZzZ9
+ټܢvg@l맭7Rja>bB0Y%SW+4TsPS&Xx?6pnIGV-&/6 '+!qp.ߞ
+MЖ9X1*&_|b|n!Cm`D)^3yu^j<p{w>*<*ap^1r.~]Wᆬ/cזXVU_ ،ﴰ&*Fh}sR"JOv9`s>vX!ê6W5F(}h
+܀lD41ބzm7[%#'רWsKpj4"fM;K<0Ĵ&j54eJߤ'm5~[ۭ@]qg왕^`r,5sALI|Pv1|aV!)RJn%b[aFd6i,;9ǼcY?=[QXXxSk|g];C;Ҏ;ĎKM.J,tEyZu®NO,B՛ǞOaȊ?y('N3 F|j$~W>1퓁wE5%wŲ? ,/*<"^LJOt2ppbdqYezٛdxog	5!#و>E7{_j%t6mԼu(6ZH/w(^`v(>sq7:gÀr%|?8_N4\ǐMŔb`l(!՘V,+RETNH NV%7B#<:Htɤ>Qy#ǧ]G{LjA8[M/ztW$i^: 3^^hdE
+FA柌lAL]./δA#JIԋ9.PM7r01^0&%,ֵ)r:<i󏜣(~;n{憃ҷְn?߅jI!L +8!}^6Zfll:uZ/*X}`TV+gW-eCԵzӐ̀z.:֯TmG%6հR`Ȩ$#6<F3ؔ:7]gJSCEIwEǷ/9mH4rrTǓlǫ20q5i[O5OL]C33[\T%&xdɪ@TjivUuutKn$aF"3dQAq5m׌!+61 bBa )IDvGh">\|Qvr$LP:ȝk|[䇦"l;J	.ivemSסO;|"%JCH	 gNMX}z(}
+Z`taʉ\/mE83>yKD:q1K>DuR4bkdc;^t8-'佡m'Q,A=ja&pLFj(bSjT[}lA3dEoo":ѸgGlcKȾZ^"]p=pCiJZtnY9qCħɈĠ-xPdxX!WLQamKKNH90^gGGEpQEvVi>XMy7bl?1<fi5DuS~b64	 ~L
+PWk˱s~qvyjܥJZvun@/hYK`&;stHj?ηu5șs(:\Mզa:^JzyX,@]S>cTF #|da)T)z[~w-EsIaȖR/`[ŔWe{nxj
+	̶CBsl'<W@c,e`*կ&
+g9(Зmq`qYwh14pT|q)`ȗNG6:)vaPZ)[\ l../^l?DX0aTskY|-kYӬvKr{G(
+l{N;gX]]EOГ*Aj(CT
+EFT+x]a]oh݄ɜC 0sy
+mqмe%GyBҙVU{4%Wv㹨6^Ugc`q5aZc 2לtv}OtY3P]߿{fCog|>K8Pg_FY=C2J6IkUڝ35ӁB~VV-˺Ra5{㩒ϋE*2.FM ^Mt,1E2JLo=xpzyb:myAX~ Cc>d$Q  :-gӾCiRmvOHNbu=i(OXB"4c"ZfZBP*sõK7~h{6C]iŒ]w4bHn)MퟺtIn;.Cy0AvF]kw݉@S:ʺZR][\Jm1WEXP4nӆq+50XWqEX?ͳY6Ŧol4ލW{=8RgVVeC/aZπLc]!Q
+d6^a&SvrIƘQ%PzBee/Q4j6Q#|K5_]x" |G^Bg, 㮢iY|:)[t/Rњ._?Z^wH˗?aW^&(a u[b.֙.+ќ|#Lu_771'W-8__O\įYưMc)arrMGf+'gֆEBF88s}d9,%|| \)y(oc
+	A7ܦVu`֢m	b'~޷8ж/B@'"։hMδ{#c?botCiPS9u	6&P[z
+~ujFޫ-xƯ每ginD+{5_QݢNιE]
+Ai?	{93/N1BՅ3ѮX&p悶zq-{	*CReU.'JzdYt5pmk!^߼[0kN "ʺ=rbõx톆aKm(WO[_iq7e/t@j5vAP(6Wc+>,'7-MeZo.rED3fkş{@I"VFPn#*.Qphc+K6l<QY~~~>Ǿ\u-R`
+DT\}iV%1fmgk$Wʎ_G]5B
+?/qYiǠAfjEKa3ly/Y=I#}
+TTh-EHZ1]? '8[7^x`;'|,Nb w(_MBB2/QVc邂,\G%'[Lhʑ̳jn"򷌧_^ܠ5vֈ"4cd@ /w^lCEXIkKd0x=;ʊd֬;@/fMiBwׄM=xB^r7@8<y%J]7]iXfâ4e=h/m'8*l0+@sv=*x_nJD_TwU IРz	FF5km.l@	kwWTsbdmA`->qu@քv7XfΞf&SV|CժTaҼ90)	]eHOSՋ."ύ]>MP(11$QPqk_Da`dEbCe~c l2ǠPb̓dE&4-8WzK6YY&y^as0_yheRYq.T'$<+Zk9$~kA{w!l)rpx7|88P>	o#d6kC5E_R
+b+܎ X<;4B37Iv)&\.ݥ;wg_>8 d)aKC}fm}:?H'V팒'qu1 ]ӟ0OPRÜ9qJitBXc2z3Mgj[[$ͨכLCW<e2uFR*ߛdٙ\we)woXs-pya<!)gMO@{4ȵ떫n]тewÏJoeTPgtzpثh!E~)!ƓL%IrhM?ӡBW3<a-CФQH|؊
+eJfjC+'IZ㻕\]l-84pBg~Gdc}AQTe;:/%ӃF4-Ԁ(_`9h̓+vW<Ix~@Em>1Ugٓ_]spDTDNt&.5ԖgWV"V`fnIadNA,lJSn3Xogi\2nMY*;0
+
+mdܐ	!p7bGo;E\,C3{8O39R"<C	&Woaۚ537oJu!R׭6{}9[|*v2W>,:9{{7	%5 BbG藿Z:#.r1:a2[]5B+qT+UP/FTDi?%zi"ǽ2<?<̅ ~I=eL1baFeStR	",t	Ej"Zގb|*zώN6Ԣol[VN&.F	AN2lQilL{Ch0+gWLݦP#M)E*6{c.K݁-sC8t#CoBG|$Lg4QX,J$n2{La6	l(F&NNNY81 vPJs/5-sbV:+Dq,h'6݉^ "FKV6öoC4WYCƱ`ݫ!F7GHe.qVw٤J8.@h^=1sgm=<+͓g?Н+"13+=NY)o{1vL+@GRI:nRW"Dfͳ9S{&c{z0gj<cED'^>_Qy@NLK]XƉlo<=Nw)3d?L}:BZXMy*=mYY'yX륓f=ښH٦q>g65p13dC`M9&e4N.{th\Sq 2MLމR1al[G8vsˈu]2Ԃx=Ds5}}:[x\"vت^Ķ	wYnAK.CddH?(.,|)G\Tn~5{ۣk;z5c&Miu7<-<Mj(}a]$O:s9<ʋN0b6YRw#ȯhfTÊ+K&| Vq$m%8
+ώɖUY1ФCX6:Vj@b-6zNν=UBfH*(3Xy42~H0a(a,`a{B+Ӫ0OCMȳ YcӦ<sX̨Nо	.S->Qt$?se.- =j}:=-y=6Jp`{`n˫p}uY[	@92#}khzq8z_P:^T7\4-PK    S]pX  /     pagekite/timers.pyWQo6~ׯ8d("f9	lE-,5T,N2``Iwo &]kԐ%,d`Z&kf Cy[g>[hρ)mA,yyWx:>?YSJ s0߆ޅʷ:]%z{zg%	EfnLDO߅R0LyrV+-ּbnsت"ejNR!T۵Zlc0h[AV3BMiWiAG,`x
+\*
+/l 0y}OJU /,#נrvܭ'm̛@)QTJX B d
+u4r};;:LݯdkEe$fJ)-2eԿ'_~it51l<N	f0.n\O!E¾^mFoVPw%$i[#L	XUc{B*'J:Q$|Hϻf"TzՕe]e8*%M=`bI ͨ:6UՊMHsA9G];ǧH
+c`Ʋ]A->THHC"P:A];{a,i#BƐK$#F*kHEi uX~zeɟv<[bLi7( j`( v\r 6kKZ~m&kg_IGh9<VVvڙRE@L#XeXka}CHT>`iHR">PF[V,RBwKP1$qvRLgIR!ţX+çoxGЉRnNDg;}PDtɩ0<FzYy|"iUSVRmN+'\%*ȩr\fXб]9y$5}xE~爙9ч^k">Ec~$f(*и[kR`Zұ?2內_)tYf:pyaj >Y]/i31)KTZpĐo_ۆ6}h܏ώpGY]=Δ,qTmAj/*1o~</M%fioCjڢʏA|Zδ{|q\VRILmNTK8IU_rjM4/Ap>zT-RRN!-HjsZr9 oǮE\Ӏ#f0	Fmx00tg7uw5Zi9vsz=77kDp6ܞ&qKS6oPK    R]qBt+       pagekite/acl.pyks6~6iFd"ӏt2Wʍح\';IUUIHBL,AYV] $Hw4ž'OZj^L'Wʠ\dBw`JHf"L2VQ	x?i&x<YTR *+Vzvys]@.~nΤ	
+,b<&{Y@fOU*tVA"ugKQ$$8OǸ%y\Ze(NJ!@IKq+$ΡU)sGU*'+ZX([E%ʹ&|ЛLD;2zq.d"r- FhEЀw+>wln,p}\Iw@H/Aᥣdu 
+8/At(DvW,sѶ䍀)ȜqTJYwZLY A~~ջ ?[na0R@q8Vgѿ@o/nnZWuop?}Yp#c$~Y6P)ZbiS#gY
+AY!(n0d_nřP"1@G?\UdVUr"Rt?3(G(C׉]iUr/*VJ 9&eL6EU.w2lGn+S)i'p&ׁ,4-P7dz|U)ڒ9qQp"@U@MNkUXE5.*vw>_ݾ؃F/v8<M)017Sk4F~`H8|e.MGҜ$		<
+᏿ES<&e'}*iNܐ;bNVPGD>f@9VkIٚE	-~;p00n}Z!Εڐ$
+㋤NEJo_ʠ+ZԮ 2΁ã"cyh${\TuGrcRpQ_c\TɌ-(MbMѨ> FTPJ1]dXcAƑɬBL`s2la:Ȗ3,8VqDB!;|.,tG4G.);XX":)24˔%"Nw1qFPDZ,3(9rWyB<K.s']NºL5$:
+qpͫ\8,5[Y^ h&az,QqdF慴-e_,ƥHX*6 2Ɲ&pGMr1x-bj:~6D]7߾5,g.OX
+/Ão{{??}!Mcj<&Ca.łBڋWpԬҧ?;;p%2-?6}Fћy+7&Rbt`$y/&ߨQzz>J[Tu\ͬ:%J
+#k|Uy/VWhcGZL	EɓW-;#+E\HkFĽawDĜ5\PF5NĖMWԭކ5ŗ*dw0hV."m\B۬|q4ͨ(yJ#7$g_Eǡ<tAl1VJ#\â#HCtk=,]ᕘf=f[`p7+IÇSD q$ Y\	M9f$jBAE#4ζfs/M#c7.A6"q&Sp鬌*bڼ[nKE%M~E]?JP@kls,IrB[5%B"v&GSa&>v}ب)5~8cKrWC1"{4n}75wc3eIkz
+D.SN)>gYC}͡Au×#g eB;,uȂG.  vm4wXݨP%ˠoly#'{
+?=kM?N#&DɠeMt}l1'rva),n,qEPKnS3~Sܼڝ#2ȱ{bZtv;dEI^[Z-</G~`#X}r]s֬;[Gl3v47T!gbS`c ',
+}ǟόQ6E8laIw*x'Q(lOQoLt§7-Bk֨A;rD: +FMw`
+壎6)r6u~' ̘#a68gn&lFϜ߼`rj{Baj< Ѝt7w/Furݐ1/ycAL u9V44lP`m"lfQ7s095._6>],#I6]qqޟ
+
+63Dï]e2Y\կ9gλ&B.$JG3+Ml9_	DDWTЯ昏B࿹%Dp=Mn ZPA/w"qP-L4\kvP?Bz 6k,a]9")R`¿u.3#9״腊5xi'Kj8TKMRYU0k]~DZ
+l"7)yOSVO2ewRFeDUjGЮU<A	1 |T@tbTr<Mx]*4j^+2[L5¨k{H`S(4G"4GǈqwSL=Mo~L¯UȍMt@ӹ@LJ]5ҿWa6
+@;{sb^7bv=:DڰTYj1x;]U_u#fdvf/dki1(*cZӬ}Fv_PK    RS]Qc  `)     pagekite/ratelimit.pyZnFMQXJdNڢFi!;@Ckbr(n}s9dA`s9;ɓXzebfyYeLQUj2M_L5W|:VKu:I/d,e'eE^V*<]Vz"ϝ5T_˹*1V,"|[SAbź47J=?<:~Vu*Jo:/_y2PQן23j̢R6:(2ZƤZ<VQ_uTBԱUi\@ZIִ@,;DE˅%ARI\3]F:_NS3Sf3UhΡGzGH}?];]ZA+Ս*TyAz wIa62Ü8\4USV'˴*qtهOx|rl;- 0)ZտǯGODλ:Vћcua|~vq2PBkH}\	+ԝXWI-xuZPjiu1;Qg7KU G7JTW}e5ռjp-yys
+{Ak ?URG1bA`ZuD]UΥ~k/BoPzr(g^eVX>1?tOz2	i(5D"rf^oɪ.z81ݽΗ[Yj,AZ@ܫ[]|JqȋʽYBznR	,D(т 6F2'ذRɕ2:PN~þ3,G9-((VuG綧VZѰD<c1?Er'4>= ϴxͯ' }#q< fslL5_ZŔ}-3M ׂ IYؖsw<i;^G?;<=9H	dL5҄@)q'FgмcJ<bC=u ێ<Cqd*bT8$S	ĄTy9&A$K𺧞n@  u2TW?Zef8uX8vB;HEupRКDN?˧NxknVE*gꨯY5WTHu}q}!Zn/<ɿk?KG $-G4#;Қ,=KڨJOW2%KꖰrvLy^}i+ILql#Ҍ9*`wDqCn.3*/ӭ?Q6
+h9Cxrbih^vк;ĳG5p?:PhUΐIZXScGm}6tv≓{e8$Gɇ<n"? >8jCop4G"`#07ʮT]LNQ
+ϸ(A
+V:}țj\b/&3AjREu	OřV^2Ƚ{=B!FWACM-4ѮE̴E7g2JqǣfVb֭pR'~ב$#-wleY@4 k];Qd;QlňG}qr3o|NJkop<]Kٲʓđ益;6=DLg=fk܇˹kq)MgU6hn[:_"@scWzTsTQ{	B)Q8(Z[xTjVMTa+m%|U^ZA\(S'DcgQQHo'[zzߎ9&Y諢ѓ;&{˘tnHPvW=y296;Ud87\R7y bڕ)QJU8""Wd:p𑈘mФ#/Z㷼/Fq+uoJ܇5P[gp%[c>&\:{Gw4Hv @Шit @xxu)E\_KA'Q_e!Q-B<5zQ(5J
+4!1Щ`FPڒuaՒC\R%eFV4\>ˡ/9mhY%Gr4" M(K4mzᵔY@a"Lk'o'?]\cKӹ{es>ln/NLn&SFPoP-t8C=߭dC\,}5BH|aC&gndOdtN,;I藤C?ݫֻ4!zR_\e.qa.+V4LDO~hBZѓ9_K
+s8(8w{G!r'hXe?ϼj'^e)MZwWa傠)j%ZHWp~F0hJX ^4͑TRC`N%퍋uq9Y!k)r ~j
+h6ZF'l=F:Ih➳:Mt(_˘a`pn`I(6G6pcsD+lS5;p%&\jS7N9]15>pRM:Hnb`M}kg}v˱aW,/+~0wuM9
+IP.9|qwQwqst(ȵ	fߴn״Ƥ歛uLS$f.Tj˫<U3pc=*r@nC ^?LlҞyOhtp:aWa
+%I6YMzԈc>잤=jCP"h1׹m#)J)wn61<:vx,f؞
+CNqZ$?p.Z_l;Φ3ma42oc;-C0|a8	#ـf΄`VՈڣWu7Q-+۠2¼
+Ώ;@_Bj͢ötB"O"Hv9溞ĨA'SS$Qي'K-Fm:PŤ7'Q8SvͷƆ
+g˹nM7HN'tȥ/E^t72IL+Zҫ^&H*jĽ{ю,Y#DN05$9be p'Añycl!ؖ`#!v+E1%qe}@4(_	$Qm>Uzh_mi΁|H`SpCoʵXPI5GHDcBL8 ˊs]|ɶ4MXg[vUYL,73v	S#;5
+Qa O,p !(wFhN	_r]09qp3`pՃ栔PK    WR]=[Ȏ       pagekite/routing.pyX]o},2ї:؍Q]ǐeȥŚⲻ(E=O[vA.gg̜9WqNioүl23#J&J0Ԛo4֐UZi|	D5-IiK-JׅҖҨrៃ`z19>S*5$,v BK0bãٕRƊЕVȒ\%!<
+4+s,ſƨ<
+XsDKIF%v#<*)9jt	ZvyڮU&[^( 0
++0h~/oI"e.\fiD4$ WJƴܺ}\W0\G$SUjgTy`eT2a}cp\n,ȤFD0%|1f/l6l
+#UzOhv1"[F#//b~yv}јƳf:YHt-ȅ}kA,H3<v bZ	$(Z@d
+ibC[GH(WvDF>^Y[l6>/C2'Ʈ2RĘv?2o9AXH#[j}XRd<G{ LC3%s@-yĆ'iO{$yFR.־'0V%12t~Ecro~&K`,|8GhH"Z	1r3@AY#C $Zh
+7_o{aCLvn؍/aNs(DE"p4"#JI$	)@Ty0.np,W6T[:@GB4xV!0¬/QIuaHrtL2~etvV܌UYɚC46V{OMxlq}_>pL?LƳX{xb\I.#d#/L?yzr8ILED8`h,ncDq׾pN3)}mLt{&Sqqm&E
+MRF-f1yw7#/EM!8mً/*Jm{pXiûH0p~FMȷGw7Xn+F4kUSgw*ؤzWseH*ac&<gʵ	Qpɛvy<-4ic݅*UO=zyNpKG&G;:r7#V\ݝsam!bmaOQv̓+; cl(/H΋;CC%<U.Scib7*_Rܴ .HTmki6cv&0}b|\Pըe5.&Vj;㶛H3]Zp{T0\hݦrko}ѳCZ?*Ǌu~:UkXts/(VU5ӟH3dWsmCwwa<TKlהdVpHxQMv_3ӏ/K X巈o?Jzbh}N.qXKƞ4;AЫYVh=`LX<9wnXc4khYK`׿wAeA?R[\<;K!'_1]5Ty>GFKXkpY濌#}<:76/ҫx$Czi/t/_KZv;{m_=zMuxpGDuCIvb|<[Χem< c']zGџ[2d[8|:O_9޸{PK    S]ۃ(       pagekite/tls.pyYm6_1H[*uum[^+YlueQ'JH.hE3<3C?y$XQߨ<YR&k-ߗ$ʴy٨+R۸)%lćFQ\?y-If5[A8/
+' j(ڦEQdPVh n3[抲*
+s#F!:fg<|~9z)R5q讖!BmuӢ-f9*%lWrS;1 %fk^A%j|)oXSa'<;@[XF;Jthe(Et׮<<CQ[o}^A`iՠW&D5
+dj5D*^4~]x~),s++gi8>/
+ZjbDD׫`r'v;mţ0"`Z-1zu-&t7Yoo&{/g!R-yfARyppfƣ[?BqS-WvcbAoGwQ))|m~n6iaD??FT{Ƀ螚|'l.>!0ƎbJŘ0˛hF ;^?IY| My*c
+Q!6qr%W1GLk(eJq{򉨛<lhEwwoD4@J=RfaSVA1tBIT#:ou<S2J~bMpFy:X_8J$N"?h:ElaV\ _j+́u\Ul	B|-8:ѾP`q.	aJU#/f5vAvIL/p-%(/8tCA\l@Bx'5$rȃxYZH"fm@/MS0<|5o"jkQg`t84[:ntnw]o/CCi?iпV1f9ȶETL
+q`ٻw.r	ʨ/㯏!UCwqъY]zlNn+U{WȅjYup_Yl@z~$ЪPj \^8F
+8-\")Ti!G=!B>_bNg%-o=ÆU6*s46ktѶw!@oŖ1DJxIZ!!)rhN0>5JXii^VJ1i^ҧirNE*FGܹa] .; ^0ld(֡c0	( & "a1_pGnaJ}:NQcH"nCϭ騝' L@`Ut/X+?4yz>j4vGfv¨m~Ppl1ӧJM[96+r$8>[0pva7DY{KYr2ٍ9Vr1։:U݊Q2Llsd`>v.G:K	vj7&)m{$V
+LϟҬ9ĶŚp(UKh+ZK5W"~4UR)k<ZE6bǨdTAuG"Er`阧5(G6TSCYQܚ!Nn2f0Kn&B3ҟ>͌nUL|HO5Qr[T§hLבYf,V}W-ށ&s[4_
+[SX5|-4[nw-Ғn4< s>ιm:NTsybu+a1'cqxC\5	Kͼd
+2ޝxJCcQsEoeԥ.Eg,ay.o)JFT=tl0pnϳD]晡xYCuAJDW&||KYP;-允czqW4G5Pʡq}X3j6HAy}?˫1vc˯#Ź:)՝T!rSGXT%d~uaGL.]
+eȏL	},ng+gFfmQͩAq^ꂾ.
+`@ӧGyf;d?&K;Lgz)ur	DN.hIsj;U#uԽ]MG]Vyranﰸq6J߬luer{왻+IJCL<-F6F/H0)¶ePs5OYJ&gJ.S4N_:szc=.~k}ety)bth$G<}BhpI׆O i%u¡.8K=a,܇Ȣ;3%DoV{攎2?3u5@K<5-/Ef\N~ᓨ3ס~ᤪӹqbe>rEQ#[r՟v&ͺ%*%pyk(1Nٰꠕǀ1ź&ꦽ'DF:8-0	V2K['F?kB%>pg; r~6+;.r14+]<1όǏ(D׉6`8^U_ř8Ӣi\4sٺ	S|PjI}?lGֲq.usyU] FT[:ӎr7:c\ w͟ڤxtQۇ٩5y
+_I$]^ܷru	λ9?PK    (gzZXM/  ٶ     sockschain/__init__.py}w8r`		idvt8@o6c$66kٽl@2؝XRT*UJw(<r?~ZȽ^}qMŰP,s_0rQUu?ڇމۡASt](y*F"t"'|tfM/lwQR2pfnd#?/`Nz2>b!A!V1ݩ ;t	n;3Gw_; yߋi\l	lpv&F
 i0j(bPDx$x"Ei@U Czo,
 8KNجQ4(
 ڀ"<!c-F 
@@ -755,6 +900,141 @@ u4q
 5!MZhPwgdSБyMgrogC<Wctx83^Շ~d7V3i0}YGk55
 )#sF.To_[UI~*SCg4UҨf&~[Y}dSV7hsIU0ϰ@ כ[bbXE>qlN!3	<C̺'{2FHh8d(x(-9]Vfھ0A5NcID{pg?BHYU&k&
 {m٥R9& ΢廒viַNJi?YDѹ$>0Ko 4\觥/:?(҈xq Bw1]睾b,)I)(V3.s=KjK0&	CEg'
-]oʗ:I}`JD(7aH5>S@D!~0$>Jy"X&f8whbءkډf4:C'niQ0x?cD#ux!_*nN OJ-4F@kiDc DS/UV^F"jCM.4_B6UCx!MA=2JaՂ^ʒAr'ݴ(!Q%(8X,l_6nAc;>2RAp_衽R-!ڪ7ĠWЋC"x0kb)?+Ԓ"W0eWTf,?,\Yv{֠ua,GmDE;xM}crϖJ[7F8*'ɘGQyN@ٷA;PK    uZa68   J      __main__.pySVUHOKR(-Iӵ pe($fg&fsa(M. PK    V\@                  pagekite/android.pyPK    V,  w             .  pagekite/httpd.pyPK    tZ<!  y            [  pagekite/pk.pyPK    V_                pagekite/yamond.pyPK     uZ                      A& pagekite/ui/PK    V׳h               P pagekite/logparse.pyPK    VknI=                pagekite/logging.pyPK    ZzZd<&  r             X pagekite/manual.pyPK    ׺pQ{N               D pagekite/__init__.pyPK    nZV!                F pagekite/__main__.pyPK     tuZ                      A[ pagekite/proto/PK    V  
-             [ pagekite/compat.pyPK    tZ
-               Gc pagekite/common.pyPK    V[&f               m pagekite/dropper.pyPK    uZ֊  K%             -q pagekite/ui/basic.pyPK    VA  '             w} pagekite/ui/nullui.pyPK    ׺pQ                      8 pagekite/ui/__init__.pyPK    V  9             o pagekite/ui/remote.pyPK    Vĵ  2             ! pagekite/proto/proto.pyPK    VPfs  *             U pagekite/proto/ws_abnf.pyPK    [uZҎ<  #"             y pagekite/proto/filters.pyPK    VM               7 pagekite/proto/__init__.pyPK    tZ   ew             p pagekite/proto/selectables.pyPK    V &  "             s pagekite/proto/parsers.pyPK    	V0I  #             pagekite/proto/conns.pyPK    (gzZXM/  ٶ             ; sockschain/__init__.pyPK    ^P7   =              k sockschain/__main__.pyPK    =rR!               k six.pyPK    uZa68   J               __main__.pyPK      o  	   
\ No newline at end of file
+]oʗ:I}`JD(7aH5>S@D!~0$>Jy"X&f8whbءkډf4:C'niQ0x?cD#ux!_*nN OJ-4F@kiDc DS/UV^F"jCM.4_B6UCx!MA=2JaՂ^ʒAr'ݴ(!Q%(8X,l_6nAc;>2RAp_衽R-!ڪ7ĠWЋC"x0kb)?+Ԓ"W0eWTf,?,\Yv{֠ua,GmDE;xM}crϖJ[7F8*'ɘGQyN@ٷA;PK    uZa68   J      __main__.pySVUHOKR(-Iӵ pe($fg&fsa(M. PK    S]  ]     pagekite/zchunks.pyYms۸_&J$ZvUF)glǕK}HPdL<皛i3K.'O2̈́RLX*[@f엣HnՀ3Lyde<oBX܉;|r|' K%,2u[OV+fAXL5s%"352?!l2bZ^aXł3 >6ʅ]3]g"^CVL~^DWxDl\$<c"Z\EƗ$1Ȅ`J
+q,	?B9,cQN,w¥`ME⋬EZ"C{wv0D&;켘#	ID	ơ PlBĪJ9e"݉LӋRePA@ɔ6u~iymϐ83)졬(\B@22xŴ5<dlzhP5rpBaNƓ|MZGA?<<>9^ogɤØp<=>8d26Bs$_L|(VT,Yzq[.}_yx,6j?B%22%><O;;]$+NlX7yX~<Z
+[nY %
+a{1PǮQwsJXd*?s)V
+0M")_ǒh<&Z3x:ts@nlh<;pz>Ff %69UTZdlLh} N98 k{î^~Ewwwv=yΚ$ُ@ x^LgYu$\$p:/*-@0-		)aL %xY-Ǉ'|4Bmu.Mvߋ<؇2Pj`#6<Ey5 o>_ƛO+/|sk<oiZ&=nYI_X]sppj gl}sBlxGfмsng?_?ϫϽ:6UW&d<kKkk=y! `bRw^Ezڴdxz/ڦ{oΦ痳?3F9;_f@s\#*WK\J@X%yHrbg c #l#X	Dz.7e5EV$X=`WB-+=?`X%,Q1$^Fٟ	~z.'dBvʵ.hM;?'Rު㤚Hm_+4X%iBhY+ݐ΄Hj[٭_j̋k=Tful9-EZ#ӓ	!Q_!l+%5q-^X=)x+CiV{\ݳ-Y΃\doX#) ^_p9^e'+s;붕	zK'v$	'H=FF0<N+A-h]9,D3+2&9<RI3c7\BՎx0(LzdF@`(JqZ0cGnKu
+hC6ODw'ZK}`(Q"*,J|6sqZvц/ѩIKK@_&1僢T({4{̪un*;jD1>%#L2"%\Bbw:mcCWbЦ׬ k7WZsˤݹQ,0yh*"}VK=h(KpѻJ ng|f ZW"sjRMXk{6Iv-^Ku}Ai1.n 7_%G	[?*Eo_Gp<--ihcӋ䅎&|?ǤY6dAg6"PM8KPk}a=~^?KNTV|pi6duj%bN8.$ᤱv?FsJ ,KUԴq5o`Fd?@, s] mr&ij).K۱|4~ѹ?
+-)έezX)D#wR
+)UheCB60	%W)f n,tT.Nb!>T~8fK9Lݗ)Z:ˋ$1fqPC$CB:قҝ;'1^	+|BNsr),p6 䑋V4PN'mKsYj"-J',䌃R@3]oœ*fAt")/+dv<w&<kV-#ǤHHwp5 ~:<<A̉[]]qbr9{=V^t^鿬Yjgڊ(ei,69Y
+iF'0vU?=FջƄ҅Ł=~:\cZ))>!zuTSgAf|ou<]lٶUF$P@<UjzyWAw([3w4iFmߗLL,]ީW1uQKoV↴+vo궡n$m5No[>*UFWt%֢{}i֍̣gdv	GUӥS?6X0j~+1wvU0ky0Gsw'H.o.ǂ&הB7ф	]B~l^N<sEp-^'D$O"@Rbeais] 8{ӷ}	4g}3/AlMw:?VjMʶkَUHEltRtzy22\3h<0bάtM@Dеq?س(TD[3,X>KqĤ!'K	r1+-/NTחe@+|5`)wb#8w;pt?PQ+V{ۄ*LCEգFŘ	?E4~M PK    :R]s  F+     pagekite/loopmon.pynF]_q@ ahp\18 @#5EjIʪR\f!%%.v7@,q8sѳgz$4ϗdeU**ɳ!Ph˰,\,.!J4ŪR0?X-7DPed,Y"=CzY/`2U&H˼ yDmǤD&z˛SR[v@d~.Cܚ^=$
+w/7Er?hp8xy48PSaF2z(G)ӻ"Kz&,	;CA0
+g:,6
+"qՕL3<Xq2*U#**U,J"O ǳ*rEeSZM$$RY Dh>wdn4p#xTxT^LHVDyyHUs.a0Fd|rN
+VR |>}m|>>9VJ %d)¬NOw_ӛk8Opi pC$~[3VPc$-/)Kc
+
+!B2.^`&h +tVf^UzU(?RW^oZ+QUCտWJy`|@i/=A<DH!,XG't n1ǷʘZMJS5aR!t
+xw,vg]`/%}o^rN_,Ͽ*|q:C.;o>`UY>:Ryhb u0#fNKey0EA[vQ>GfJ2148en)Fیi.P7\Ip}򲚏k9*yY	|T9l|kWU@&r F&Ѫ(D^pġ܍a=/@йHhQF.oP/2 \RtX)F#)7@\&@iF)%g-Ϫt)e#?{E+?I3t:%[/#LQfKIY^VoX䏤T:I$qRrr
+X^='y!BqB0V'+IA#RjHH!r:
+s(5	ߓn.>~()$(jSi*H(\EjH,AJb;TRS1#MR鑑,#[h2aQ:68Ŋ/f2FUmrU,spN
+j;b`^+||uDDrL$YRM&nҙG൧WuKzy)G*EZrݥOxڲ F/|w>wİ5"WiqDo)Nx*5lO:kd(5FeI!YK*f-h(UEIU:eL bV8GQvVnzB9hC:KEq<ZcbR w|l1Z}drLV{w_k֘k1O"4fl@k~!YK<-%PS
+V"d2ZKd-Nr$_-~|׀F[ˑ!ymxMVvlvq9m%Lʀl|nij"|Զ 첌l-'RKk5Fy>> X`hC`xijC%jtgyoK>t PwZO	{u>(-% 6J38CReyگ-3r^t!	DE?5(nF#eQ1o|6Hut=ax`yK-BƬ$-󗿶2mYgdR}u,#kܺ]?n-a% uͺ1.s,\fEM]5`^HmՓ3.um5yS+}	8lHS[J۾MFkVZ
+W>.vt|'=O2G5^鵼rt%`w"NYQL)V@
+9Am|xSIiXWo lr>&ZՎYtkmTnfH|AX&Ndo3d}5Eḫ,~t,jeGyeƨ5FAUE6t'T@>*G>4j4;Tʽ*wۘ=Uy-[]и# k&nkذ~h\qBX^VTLFYTL 8&8b:uGTK~jPd+M^wCЏ5&H?8r1L69R9mq]Y=Nr݁v:&ȸu6>ǎȪSjFDreY!Ω~b3	8󆎞UMǸlI%(/}Hntn( YZ{<wFw4r*{ezXgÝF2d&M=r0;$bYU[a)bNǗ7i)B>!,6F0~[fu53IL; уԚ![/͚/BLCs	ZY$oϧ>*k(cÓܚ.j=e"<}m&&&"L3>5""\F<hLD.sZ!`TӋǓ_Oo'.=.K,:$K7t;GLR2pQr`72tlQ!+V$"=I!AB.+t$)@b%Ʀf~8ӫ
+~fQa@״ACqФ5JNMIYX^ku*Np!kY3'߱vz?Iy~B33hBjZnn4	;
+?Jut[φdoi"D6\D6PNmn)6=^=n`7鵦/b@2pF:ڡsdJf:fͲCR5P]CIWb [oKˋ0]xآNtdd0HQsq,@u{w;&ϐe3HWq lvM/vn.Mm'DaitƎ$ljklDV߸`R^sxo:GosGij,E+>XcSn.Ƶ0W'Ko={w]SlOZ{BCs%.Y;1,d<ӠT8fVҼemQ=0|9:zm];1nQgW.ԺxbDu#m8K2mWWοzܺ=MS:d@"_r_c=Ʉsw6}R2us8"T:lLu,6޳>
+{3l0`O/{z\,.R^"9P}wz=F /G W_G^;t	׭m9=[D+u^[78e<LvCdTjw
+ڌp1CH2;{wCtF4{
+agtgtrVEܙV}|yPK    zS]#`>3  /     pagekite/bench.py}}w۶!ȴ[}q[ɱv%QkITI*w  @Q=괎De0&Y8-$U9MT⇠PӬT˸Qu&y(X_-~T.-jwweK<"]̳QRj*n"bҕ&],TtF4Y5FL?d4ZENzT S[HUDiI0PyGWBeUe*5e%ZJ-)5;'$iDCƙeqK2ˇlCj>a1bAJ$3UD4]$y4h'~eVSt?~Rx3ZbL|&*O2aLqfDX;g)褟eqHpʎTyQՌc +i1A*w4(j$:ƃ
+84m(ASiJ,ۄF&ɝU~Ej`0Y@e*ٌzMHi7_颤QRS4[}P$%b.JбCnQ8[>ʹTA+&@9<F%IĨ|K/RuZĹ:Io=NHP=d+☴(tH'B{$8<j1N(|.G?Է矔:L<S&$'6ΈQ(0Oi2Vh]j0ԻJH}zazҭu% UD6zȫU*7͖%Fx"	*ɊTԏGG;Ks|N%{bױ| ߟ\GoNN?wֻH}<:;P?]|py)u$"<i2Ng?tlgQ~N GDU݊gz^JD-RӲ\E7U7{3iLv44.th~߳|[78dFx1%962Z)mjE~-mOsō}[(
+JUEVD<?ՌefNcEGu9䯲c=MjzgZr򳏵j]_IC(OʠG]AN˺@=WRuq>>Ƨ'}Euqr<GWQd
+^CjhlBZoO}:N.LWAGzW,x,y=|ŲtHA}(W_^vC󜠑ʷ[	bȕ) 10UNHyBoD:QO.7'5 K.)I{" d&p>^{8*0GP]F1}{~IzgD#'">U*q֡vebth]TUL2jFۃ»Wf{rZ("Qv"UVƨ=xy&"fp~@clGtINh)<}H#~սV="]epA< 4P_fi\Г)dWA7F/npG˩PSvH1?Z-`ԇi/a:K4)0U䂄b
+hYc#ruV<D$aAX@$'!PWejtFTRZvX!R>izs#"Q$紟ܗoRqooh>)"WޗFF <H@C(	/#,4D=DO>0uG4v6_d_\}-c
+,]jDnbV[`EHpU_ukD˂hkT`
+USU2L	_㯈@.
+N߿)_
+?wY7o44EogԌH3eqi(=jA,$屌yiak4U8	iо:5fg(H-$F	2t$r,Ҽ4='B=vV`dZ1g jFCrD! @,GV*adbF٨LJz;q|XۃWP<P)w4/N?S%Z޺{/z7N\?G;:](7|0#s%Re0f ZiP(RtNsO:;E%YkIVݑǍ9Yvp,¯Jq_`G~$&	y	hQ#'ԿNOwh*E!a Et@p1B/\ئ3Cl5e Lb簈j;x0_QȂ՜jăd;`b]A uvLlT?ЋMv}ԴZ-tF\N]Q!U<4x$MYJ?}m^Kֺv*t|ՅVyO ѫ.cDj|T㛭5iP9U&n¦("({Z%HPFKL3 髑?IAZ&&)AzHXϋE
+?҂v߶~4cdB3]NAzu,
+ܒ9
+PձxPlF
+"\LwX,(ܾD%{,evQ[	m$Mh
+
+78l*xu K־`ՒgZ1dѣ@\2/<-6E`^[Fz2ꖪ3upf!	Za
+c2tlVdQ+b敤Y<ܲt("
+54TkD#3
+!\ j+)" 	fhֱTr6iUMfqQ(ހN:|>svW|q١Aa?Za[H}{grĿ`(`Bxp	ӂHGp%w,KE*i/%WƑ{GQ#oh9x0 g=uE~!YY[4xzkBkqEoeR?XvɊheVi-I \Pv0AE^G!I5/?Pګ<8tyr^[ ]5f1|ڷz"3hgN~89LGo:'h{-0FZcIӅ^{djWĞ,Zp(1Yx/D/T/p;Z<0C|4G	/F]ݓw%Fah`	K\꡴d|V釓<p_(:f%im%uckjRJ0Z]8	<J@XǋG˃}pO=1Cf+(̒	pUɫMz9rKP]XlDdņ)0=^>K42敧f`PP1W@.g(ɓW/^]5
+E|"g)u;vtxxmD4@#QHR.ɔtA3Շ+RIUye{{l^nU!rh63JfLԥas,l9v<_k4,fw6q"9~Uf`r8h0N+M}uYt#dwt4n-znIQJ7,oRJZpg{Q7Ie.veW^81$f2*YykܟT	npW-&2s؁_4~f뱴-hqTBWnW}5+eMۇ#ݸ҂[F@ѿ//Q)fmfbN;mr,YܔSݧ%q.vT(ujw½,NYLA.A7p{ۥM⹿)RsNjPslW|e9c&fJ2-J3l<o\Gyr!Ha4]-@ks6ir@VHe
+TYI]O*\aKmHtuzF	yh*;DoyZɸn_rOn/W({xF̖HK7)%qF!I[F{ml)G
+Ff!hd-L5m[<*3FԱA+1+M*9fo@HZz݊zo읲_B&8R><,Lz!pE"o>k9:_Wp`*vYٲPϠ!lIt̶YCS{`rD齠@豍j]Рkuj֔JH"H0gw0!ƀ"2Wt #P^F8ԈDF45e2TN϶=B\h"و:ǟ@DQ0/_n(M-Cgv;knI3FHjm?Q%#X}2ʿuѾg.Sn*MFEAVoPZ)0s{VmETknhi^MܦԈ418 	k٨g'pޫS[/N1WUoCMb1ػaЕD3ڰҚDҊ
+nN'"F*3U7@a N{"ۚĨHVt7/@'!kMB vbUr~U%ہc)yWW!z8uY+X,pT
+c'n8fi ְ~ycN 6 Qm/!Bh
+4֜(+Oz3Gm/|uҝJӵ%}-xqYĉ鷥grRʰnk:[*8;2Mq_ʆlF0)'/f|\^Yw7h؂Y&F31WJɴQ6!1Dʥ)۸|(1qŪԧc NSOy֌TDoNĝcv?7wdO^pjcѢ	#o&zPc&+2K1%mmaH7JcXT/~ʟPV>&k6ز.ӖXjΰ\1l~'k<![ݵ#]*qjMҼ@V:!$f؈f%:-('7}RnHDZi;c,B~ۦ!;gB]wqvc&3HdfTۧփ	Oخ5aJ]'; .ypA胎iV!W3=HԅP(3ݓj0=>amJMa݅F8b47ó M՗&ŬhmP`ݺu{ʺȒaVe9@s<"'X[G"qس+=kp?9p;r׶ p`~m<zrڍϘt ]v[lDO$)ڱ*]3"y:8(b!pq WMZ͒G,MJ\|^Wf?i)|Ry@,nqlp㢲3|Z^/S0o謆bEVo4O\Ʃxi7QPO%s3gsVtܰQ3n7,M0Zajs扫 ,I!iKWzJ}WQTTdU*h$;cvNYZ:)w\X-pH>jxS
+S3m4E{GnFG>GEBs|jLz
+9Ș7 `BT{w(~Lx"Y]LoR؁TeDI2(Fy,Mc4*R09{Zt1MNâlD٣F9:-|£ yFH.Ca\=gh:6C$=z\WU^͞s:0M[k<i&}1}4pfuAmI2uG:Ԯٜ `++ $PPB}Ei1NPװ1sp2OV9
+v爑09.n\Q&*,ɣ2WiAl%=Of 'hHv7V̶IWbۉ\wMӒ,>CKGeHѯxIzWǟ?<꿗)
+pA MaZkr _R{NoO~8tvf(u
+U*5vRcBiΒ`Xiejc-zb8L2mG+}'kF~q`t
+V}]W	2(J6aiaؓÒV7
+} 6}U<C'z2[I\ gMǇ"l2AZB@k8 ѝ3_C]Pdmf4sdQ^&|([ahE%I.S5sU';"JN>Jj:6}"ۖ<@=wr%`W~jk_!jss6GˏYG;]Y2J/ޜ^ءje67d*_d؇qzg
+lFjNw4U}GlYghPq&v"o{yK6A9yC͑v!b7 ܠw䍓-	;h6fX2W;*3GyiiWȈ:tNE>KÁ/jۛnn3|UG#͜/SN)UMbCy߄įNZ:|jX&IPݢe
+o yІ8q4'mǜ-1&H	EQy]$E:I|,Bx4)o8iLzv6-o.]dC*ȏMv{MRnf)*%^mӠU>96*}X8);p\u7FRFC'apy<8>n?.h?}>#zugI8)G2h(J/Wq8IJW4Z'm֝y˕6yfIVe
+b6but^u&t?gd̇/;:n!9r|q64vҰx.343TP4Khg`u"M io+ DO p7pӡ<ƍڔSE1&Pz~1~Q>j?U#2=ʸ+z^~6ݴ!2Op%9 h DFmF}࡛5Lҳ&He"cȤ}^GFG/ykY1Pe-kN`ǩ3$5.ѻi2L5%Ϲq*B3>4o=:t*B8UL'TJƖtR$=5ٗ4][ZȞ|'$ށ.g.qG϶%v|q}c#36XUTw/TW)5Z\r}'3FoPeD5/kRgFȲ޻UM|i;DΞQ磈yhИVs!X8-az9v Ӳi,FN{['w."j.##bYvv}HI&6l	yu=pjSVCTI@ʎ,,9}᧱^O$l?umZu,3o00ZF
+2!sB|ƗX7ė$a_ | poB&u36)\^3<b4'j)o=}VȘd2r!lvFn
+}SN< e>um
+7@\  xcDJG|@'6051Qm̈Y>8Y=Dˡb:꠽nJ+=-fkim2 T[]6?C zR}hh	1OPgFb#3Ɖ6^s^uo#9:o|xJ0}`9joqWx;94PzڢVOUǵb%IZK6KWl<&?G9S>m5cXL|/*23HdIupl\1)1׀h-6O)$lN0/_=al\ݯ[0y8s͈hf狫 ҁci`;[:g_lY<Wz={j</@e5Hm֍Tvݑ3燽mѬl;D<Whڒ\-RNqݫQulxAVƥ!VInxL@mQ*Vi5PunX\f$~](["%_jltR[2ft;hj`'~9E@=WX"uyJYUksdj(^'ZtTKk6;Z5XmYs߿٫[w}d`JH[GКxn8A}`ͲidJ$ybƑ0|aG&cLxY.mupx+zO|rE&z/jmT}Z+z"-kvdt/NQ2HRFp9gϐ|7?@dHy:>#$n%O$1g4tBN2~艤`)shXZndJq*Zsᮅݱ,^mWYtz-Qu|w/ECȡB_xHUnL͸*c-~C_*͑TMI-I)A%o#
+,@Z-=˖̭|@(N<6sm(oH4z=XXr/TUpC><(gصc[,&n&xl7gyU2@;+ෘ#+ΗhF-cZ,<KN(j?nMP}QAF7g.A'_%JP=[:b.;qf*A(igX}gt|)D(5)*ק v+zu.(W !|ɻ@΁%,}/0U,*~;YvfɫI'}n( >L5)\m8|Ȝd:7U~ChAY,OrI
+/#6y*,#^-KP7UnY`5(G䨆D_ˍO=%)g.Agđ*.'s5NpiLYzoW]`+iRT+?|WfnOb3(w"*n<%fhYk-Vw	x]Io'(8؂F,08xtnw\Tt7)}lz8P|2&FB7(uuIg}vM\_PӃ*tC`>[HQmF8^۝.ŒHv؊-Omzb6o埌`dm߃J><M4U94eEż0'}L:^ѣ7XعYYPh
+}7וI0p<ϋ/G·ȱ)M&$ι']7v{}$J/-J;hŽ <eo_י8@iՓ=DMV9|HNbw;6 [\ǦMF	}̧5O[s欻xL*qh*)4/iq ^ֵ=w)ӨTi:*!_wdSnT('=	UOuŊ;g=Ʃ3?)᜜IIj.7控3kYvH!UҦ܋,VI?"_6w8Ь6l77rޞ6Sig&O2[qu G}2gӛXܧixʂah[gTQ{©NamY-6tҒ-+tU~l[<jL$wpt.ce~j	pc0]Z},#		f-\
+\h̙G9-농$`fِ-\	PŷJEr4~(pp\'xǚɂ l|}ux`):KSꯇz+Mdretss1׽uG|s!iytSI: BQH]d| 
+#$tGW4^XV%!DڼTo19qM<#<'@_5#U*ss
+f
+:AڭM9 L#Xھ~ Rx#bP<%.4S*:OgQpJ>v6
+>@_-3VJ_`gL+M@,2]mzͮYVFxOϼ߯z1S>~"wwŸ4|8*VuG,M]b9h^sKHW1NѰfBFP&BZ),M<CMǠe>aCXdf3TMpdB=ps8)	8~D+.	t+W^q'^i:H#\n@Jd#I{SfdΉ2n"LI6!5%I&
+~|mGgߟޝllC4>M>Q	@9374=8=wz~	;W=/G#zDU|1)ZbQ'MnѱCl$Z]Wmګ$8pܸrm{Wp_1򈉬%}sv"g.bZ	P'YG]ttTBoW	׮4k UTO9_ckN-;͇*aߺ#rVbHoNFp;h zplW7 jpU@&@ e_G8l*cqPDIJ\Tv[$$B'iΕT f4dR r2vqu)h]:"c)0R밅Q+>}۹KĦWSģ{VNJnՆca8nɧW];Vr6|Ӗ!6M=O'KWV&^FxQ.GD|y.`6	e3a_͟Y߬[W'v(1%Dn<q~^Pؼ%FْOdoؑ&vFκ9хɀ1Y$XRIfE$m(<cޱϭՐ^7$hn%B[RJ񞧈LΩM#sx&
+Вv&V)m/WEBnmmOUH Ww56<dU
+U~#}}Пxt
+e%ʊMa{eglCUX;[b]l~TƮU),]B&/8+^3$q :W7^S7G3Rie`^d
+a	')471dWWd6Z-zGDO(jmTi`fM#|79t6]sڅq^#}rUJl$Iq栘fqO|0J!4FdB,(n -%3d(yFB'D5i2_;#2Ssk"ޖ}YDnY#Bm{
+',.`ЭUO0'&7C\^h)`Gi7׳eWM[ŝ_gy<:4S9YCI:baiq@UTA0
+!K[GJ#`N6$5Tf  7ɗ.FF13:OtuUC #Ҷ?K婂=P,.	HaՒ)_bF|!)r9oqA+=#e2K`]67<К򀉜%Ax*ںBSX0+\Xz۱e^FnDǠ*NSvt$fzGqSrI;iAi)+2mQ_{3M:rĞgC7W֓cBH.8q49_N TT^%`SwOA^շݗ/`<{?{ (&cH.N8<yR\Vjgڛ˝Fi&}.CP;Q M\BT]WQ<D(x}Yo/q&PK    TS]ʣ  *6     pagekite/tests_framer.py[{s۶_N5MK#۵MiOj(	S$CVOv|zz=-bv~ѕL*&ȥʕ$gRTއYߋIe7U.ŭ(/!A&䉠7Ad&TFd.$sX	_Ox2cOHc1Xfw3HF(xB	  $0L`'T"d0Na_rg|R4ȲA`8HWyAITQOo&KF JVİ ЍE81@ʈL ^B`E=y2OQ7Iv{E!b]2d!@(aTd@#@,d!Y(e
+FY`wr:q.I,kļp3P>Jba5$>᜴{#Dgy/`7`|CO1 mA:iCDE.}۰ql{fxrxu~q}{!:'EsL*Kq,rn{fB  
+&l*ϾYn7V,L	pI <ˤ Cg y2'K| Ye6W4~^_e, 70
+G}8h)>Q3v8hj6%!f#:0+ij @p$I.lD!yΫ,I%3pFJQ(9)"OBquǻ'i{z}g21dH	t@,_"׿]tӳWw˫凮87ݻOc/J}ZRP&c+'P"p$80YڍYzn8W$,ӓbOO~$?F6J"4ieq1T,/Y1*1'4#p~;Oay2)3aS<j#fb͉7>j4( ە$SsU Zd/xe)؎_!)@ Q@g,'B`&q:%#EH^'_o#z}aeEf]=Je<ƸֱB:ty͸V5ĉbR\:<Bqp3WMSGPA4kyf=LUt&Zh	[.n/ -?MHNrGsM|W@o>|xoC%t1bs.bM/ 	BNdkVe.:[%LBЌ\֓gE-e73E9FӢ7JhX\EHH~ 2 f6OXW^`_krb"?sQPxG:bOs(	ƘOꠤ=Ԁ;$&OkwYWzgfXSe]h.~\pVYŨI{
+q/p\ .c:M,2@OnY7{	C+A@{J	Bvu=8tw~lnDAFm=HĹX&+3~9LGl8f Ch4ѴڬKZv4ieY˸ڶ1H@BS&gH~B^daZ;H^'0J^'~
+Gg?w(H1\9Ǉ BDJ}Z슖NA_sPT2^ <6Av~G2/CsqI
+dȼ剶'!;a1owǘ*4#c1#ݯwbxwww[fO7z-YbGl_~G 	cҒ~a4-#rQC$8-WqV83C5ns95tx mcoǄkוv̝5ݽ^}^}Rkg5K>EXfFvûEC8(q?`p#6aM<:s.O=Ԡx<>9SqQP$wXp)ǯG@xSqsF!]ռo.dۃIÛV䠒I]ST'qg`_];ҧң[T9rXBMe aw7f4}3T;.LWwP2  q[kxc2Mg&(A)Gn7 VLV9&$<ropv~F.\,}4RDeܫ*a'l/0ۧSzcLm2dς4/Fc6]ww\aG챰w͆wyƅ/Ad`I'zs ;JϫHSHeh|	6}%w՘aӵ6;h?F[m]hV,nWn1ijVSP
+μY1KBŚ1?x=x߸OJz-$`[<[lmanTm<)Vrz^q4b(J'n!~ߊ]!HBďփκZƝ%λ/Bk?#3kdO:4h&JIK8}jwOB*G@Zr9MEvXZ	P2'vEVv;P5{HXpM=]Ըfbسwu{
+ՆL":	tvYZvY%GM/+uAuiNMl"rs˜*Sh%S)qcM	&;XAXɡJ©+ǉJ?h?[ΙMWҏ%E^}^$ۮ/]UFA՟Ĺ0&q1n#&YT@*5߱M6FBfR*Q3P%4yh#0"97J)#U"@YNS+֟Pv-lصUV7C6YOVfE|8NtgTqJ!9tן[;F=d,GWq<Q>ITRu@Yq>Ili -Q(k{H_r28	<dP;b)(PRJBK-F3evG_n`}eᥘ\JQ̓rL*ڟ~\?lsÓQYL<%=}!:]|{1i|] ^=sPWPVN+e]LCҩU3п! |m({}6<W{%y9)j3KVW 2(a`A1%{RGY !3Lx	%SpB-PK9I[f y<uY{ ,y< }fТ*U㵦xgҔJ:u}4c&>$5_jBgJpHWʓ(G[Yx|*5*V_q=/[lek GodF$k}@wˋpP:CcNR8(R-DAGQU	:l^ZM~ѱ|qn.:6qeo^Twm}G4'.՚p)F4?e/kzY_/" r551L'9Qr8D<.AQc7D8ʽ)wBiHQHOl~ϓXsyV^}.=vsB˛odv {U>rX+ejh*Cۊ)%O%sgM%+Q%JAzf
+pH/R '||U52]/&_Ӥ%hj*wVa^H<^{Noy#Ϊ,!47cn=ӘИ-er4XZ~ѱnq6<ܴj=oN3^*.e^T]X<~¹ @aiC!FyT-x{yV.3=ZCxln#]oksۇuUH t[gXeSZl:>x}N:/hS_{#!FrdKh.]uBfu}֚fWGGkJ		hpѨF%ޒ`(i<\޵ub5.o	.{uW65W|5O4楫.ge:dckNܚwUly֫:+gG{vx/\ w;"6Bvl#1d܃"ig0nlPK    `S]v  !#     pagekite/tests_auth.pyZmsH_їK+I'$؅E0b!ɄE_bLO<t(=R&YNE2!Q3Hqey1*y^&y2SH"/䘖x4\&]`b9^E3KF39x̱ "h)V$R-^/HJd1%Tw+/ɲrK1dfW3q	Q",.KXlEˬ4Z|m5I$Oͳr:6ee[naCk Q^<,ayckM64-XSm}BE.&xDb*4,V^a\<NK̮PN)EҬY+#
+BXSɛEdۿ{ s&%`0x HU|۴q|+EMGU{wzj_`'F80MdmbybYAa^ӱz)E4H</M"E)SS+ƫR8b;Nr)Ieb	4h ccUS\ȧHy6'+L24bd>W4DDEB0P#*xX7jD!5x	.tA&I@	c'3V# <LgNuj]t4 .$APDFv}s5flw?R%xHB쓘IHk9~͗NYnuq᝜uINûf?t.ZхL{_':@Ʋq2wr&+/$KF?B	gt cVӧ2eӧ62ީY4.MlGC
+Wgud"V\cuiu|8tO߷8F(I+y~kc"3nB$*nBYj|ڳ
+ycz RtP?|~9V7]X 9{	MNO>_o1k&,58c@ЄDHWar[ FR(Z~䇑BFCgsL~"`/:Cڧ>WJ21f!pvS#Koё31Bq>0*90'ՎO̪0:|Haq<Ak7~/e|b|߷;gpa^#_!dlEaR{}h	5=>SE~|к"s7J`-X(|#Z~෽xm,y<LU`ȱ`4Ak@@,^huJ}$+ے8KlUyRyJq#[721+p
+0|jJ-)n|y<:&)1@vh}Q-e\׬c.S4.2fy"P9^y0(\ ?EH9IY:9:p]tOS}͟=xY]<,0_[EgDGWX"=Q7+.'#S&*EIQ)Y$+kcX^QV<dPo;8j%EE=Z DY= ZDd7`?";1%i#Wxɣv)eMj}>Cht*W.%M3l!WXysI**>MQK#wx4|V֨'7et<+.iU+oQ!SjthݫiXVf.<ktd\:bf&F0PmO[ğ\)z}FXH/olgM*=6t`_VrYd=)N3;F &?D+%1701eALEQa2/1z3	#0>txN[[	_ީ,E/	 Mܣ?Hܣq71GG>+p|sF3jo/^}n4H@^2}ޑА@3@$mzY/ϯR[Qu*]$;8=kqS#M$u՚nyme(VKW@+z"5vۂ? T>s͹ë+VIthn+\vڳk;&nlt?2_Yd^N\NʌwRnՔ~Ehnզg,'mё|#w3d>LG^*#([bmpξ;ﮏ0!fov֪F_Y:oImnrTMڎ-XQ&~;l[Lѽšn9b\45znDCXrjN_zm-];VWqBKKPmOBqgv[9Sς={{aǮ{qL
+Of:~0Ķ:c#{.k3ZXZNR
+j+(>xhY
+5)mIV;r-wѷ;5bEn7H2-ɘ,	4\i6
+BceY 6A5+<l~ʥNF#GluFpެ&P0aנ
+MmvfETVܚV<D(2nwoJtzB5?B5Ҥr1_Ȝo]~ԅ]1KtGQ4\؋?ۑꚠQatg_H\bxBFDחnv;Q('3A1?rT'_(\vכ>f.[usML/@==735[tͬ~Q=sk;׳ XP.Jm7N|c-bw۽ןU	-1WmjSOݛ
+~T[[Msoqc0ˍ@?pO(#5PK    `S]M
+       pagekite/tests_yamond.pyXmo_H`tdZq׃tsrF۰\S (r)1Hu"}fvmZ6ݙy/^x3-Zf)EZFԹQTQJVMuyX䪮Ye"<I]IJlfɄJ6H׵ـF%y^B2hnĬGtPHF%TfYK0VA>HiR"Y,$uFcZ 228GǇ9M{+VTGA%IDS/$^X&_$	ɠW:5J>^RT bh-5(0m+qB2f%3q{p罀_OV"q,Q$s]m#c-x(4[kUTV\.'g31_l	gȋRSNmMVe#NG'ÓဵF&礼Z՟d#7U⦭%
+ךN֪^dE'JJnb[
+b6D!"B[eW⢑jŅxwAqKUw*)u;/E*+-'״	-Λq,d'w6`+H\zMH!zeD<VLsY_An
+\V˼-B Tg^}yˏrGN5l_ qTR5[Wߜ_>oggөFfv>p1ngSiBz@JzlԐ#̩Yh:]!m/)jN<UpM>=>l6ѢjZ-KCB^dDRjPwoH2Ɋj- +ߋ}UPʱ)AU uԪ,摒n"pBGsY!ڽ71Ty5VjI<JHpKvf?k@Ly0ly9;oz6O_7m1~uOI?hгtzz~]\]]P	z	eRWntA\V(ӛxRm52
+UVԘCWjuY"m]rvv˴NǜgSAばfp(J嫇ńXY`JV2<EK:b4]K-a:<cx5yQIԐ~=Ƃi?p2hAw2#]XHVcQѪZ'`IH7/^Yf}íCAhBV9&2V] <@ C/☖xgL9-c۬2:/5qUt~Z|s^#)QgtTb.,V((:]ͥcI@r*S0 E]LmKg),冚_Q9#83yp-''@џP=5zl1ԮPT+e-"ݘXTR&sY:񒲨mH7tEn SB⏈;rM5._Rؓ8!S|g} @ݷ\vAk#1yYC|\S&WP9|̨ow+SX<2I<f]1qq _%B^$G@eOmu[Xq`2.ᖣ˺H
+,7Aɻ۴`=ϼЬ0EԄKYrj٥St\Clp`QNGŎCІ^3JMP#
+v&IK?<%vd.O("p_;T8Ts참E؋%Ðt
+_,7j(}Iu;kTCz`80)70d?5]8^aX!x1_̾Ѽ75fa1q'\-bVF]+SUi:iѧiP8DZgr<Yop[O.r;~HW,gS
+
+26T`fbhVF]8=|\XScS&#}RJ֒U)wJvXs`Hi6D%ٔ5;sS?lQ!&?eƶi0I͖x\F(! xzYeB秎."˫	IIwW;\|wLE|Ӛ΢(##TȵB)z!9NͨjD߃B)]feV)l3iS*ԻK^phvB=d:TYjP15Ֆte(RFL`.A\mffZa,'9݆Cd$pZԀ?nM쩏V.s1fZT[Ƭ;/_!veQ\yȊ	,OŁ0&q¹loǯzvO$jfgzx&l?JvމG{qh60B."7Cn*U^}D8*e&'sL|[:RѨ[I=fqX'ߵ+#Lĭ-imiշ#Ae%C}]qbux2j]\E;G]}gpz̰{Me~ݝ๫?0D''^-'ō*'Q8xs@k{h`Գ)lI<`]+Lap{HtdoQtSvwtnTPK    S]wT       pagekite/workers.pyVn8}W(bo%;n`rq}A7-,6Tΐ&Ae<̜3Q4ZYܠH-d@e?jv<?o@
+YҺ#
+-VY*mZUW]OF\;Z
+~KA;(RlA:}]ro&wp~lNS` ,Q0YU#I"
+ǕFoA3/`+HDSikBqSV2۳*R4phuS`eh4|P0J&p-,,  l9}ck0^8uOh,?hnxO8Fn@OpμM0"uI2I`PY*5  W׻"l6]$_kZ'JR`Jǈhv'ד=O<`l1Z^g0]ΦwQ0Gkd0J	,|OL'&(X_cGBiI:IvH3w8=vbm6**dhHx0
+kƍQ͆7EQ3=fA/"`Jw.I*BWTzmZhibx,LtRa$
+T%؊U}CM!"C(o%z֑2UxHxn 
+Q2]8^#,IÔAc(!9t0CDP	:r݉=e5j'T":nʤy{( r
+;,h;}q7ÿVߖ刷Z$j~2
+CBUXI-MD|wnudfw)vǁ/r\;{ R"jճAR lrn|T2k{#;!iuiZ[j%U݄nȘyKmeuG:7qk̤;4ӊWCO,/lkz2~n;cgt*3CޫIjϮSõfE8NZꀾ<Zz/Y뿹㤻5vٞd!v6*;+}zZݐ"yu~g<uH~)G/ϬP]`m.Pg;?6OTvig@H_>[@tk4hK+Xز>=xv9k%͇^P6أwJdLNpqڠʨii|3m{I&Yew(nYPK    S]1aä	  U     pagekite/tests_lookups.pyYmoF_1Hь$P\9qڮ,_aE.ō(.]ZY._d[,vyfgϞ9SX𹔚A*FNIYǙ&@$Ld <OY#XlAVLoyD	Lmxטm}+	d8|(BeQL[9gf祔_W4XsF[FDD93T*ѥ24,Z*	R+uEHXaldP|.y#ߨ5GKI8S$E(, ];XCΖ|%44ee^990Y?'.es\&|^=["Ӹv9g1}
+SrdF α̷X&ahVҕB~āOLʌ0i7B.&q12lePZF"BEp
+Z oϯFq	oyeHEg"B,f	\Y3DxF ,&
+25Yi>Y."-ǚ鐇n\pIf"s^=܈4R*
+tz?d2:~	"vg~+ITP`ޒտ'p#~r:=_]9'h2==>Mzryq5 87)_klTpl/GLBvK}) |[Jl&h1|Psu~f	Yb"D-2mf;`̄Vb+=Wum-ȇceԨ^/c1ӥ2MKQ9ǧk8F3=m01O|qPK9L)8AƘXp;ѺXxI}/u~'aIТV>Zl1$]د~6 h%0h.i؆683(s3kW6rHHil	Y6 -"УqI,P,Eɭڮ]C"z; l]?rmYeu:<K~ߧ@0څH5.Dp$akiWGk3ƅ.}
+mũL5VGbonBn	v'"D72foməa̭6c(D|܌D&	5-+SUq7lQsOO\C^Zk$il
+a_\/xt7N1ax	nG.4~C<qsld{n3FI|!{N!mHO$75ʢnT7mQ\|ҿYZqQH"Rҽ[/a[_WKFǈ<=bJ}6fX^{zʞنU:kHK{_-5uMюX,1?5V<z}3̀w*l!I-Yiʊ_&K=5w@EC>BXK.%ފ%WgY$	..__a~eMe:ܡc"Ik.@k5]))&xXyxšN۸%PwG-5b0Il"_04v8ĲVukFH=T Bm kyfu3m&	CΪя-	3A,En.
+!@w2d}Ӫo/+:Zih	0Ͳ%wzʛ=1\ufaVv t;p寢Z㝱QE"Z"t.fV-CC6g<C7f:+3g{br_=/ĿmU`>l_lˮ=}'ML?pb>$oKOeF/ߟ'eT.ji 4;<qp\ؙ~t{|JP69 5<O$Ġݻ/rH)ټB7?͐?j[u38zdyۯk`=j*l=-G{3zfw#㵎L|xH~Ɨ]3W+41TоJfTn.Nw@>𡅖}ث]m',U|燽NpeE}=9=idF(]Ng>L=fs5PK    S]|  0     pagekite/tests_flow.pyUo6~_q?ڍQ	,A-,6T<#-;Ɋl/ǻO,E,@)rֈ
+\J\*3k16AJj^`ZrnWp(ECKg@8F
+iȥ@E֕+RF4X -ZA"9ǥ0BV>)=b&.܆;슢!
+ACv^AOB9ʱ!pP@qvTCWx/Fs^q\Ckf_Z-[kxVh1T?[l6@JI4Y*7t1bU98=yurtzrz2#W{WFE2
+=9ʍh70o5F} X]5lt9WԘBД%4ߵ.D*X |_eFGThv)E3 [Ѽ,7oB0X5 d7Ɠwh X}<rڇ;4{,hBCJ7~B)U0V *4NY<x/tH{ÕxԟǋݏϧizO|$lrE:]\]/.q`X@?Zd:.[j%dni#iH͎͸ԤLrxMKP~kΎuRmXnCvK*Tt-6poH8&qaIf<gEye[<?txFG	9
+V 1JvV?t.hIre|`[I7Ep/2> <t@o024.5-Xwz5h2y=V3}s1{>H9rl+ޱ$ɚ~Ξ%Ccr'hn[ZCX|}Flk"3F1~9k,feFX++1d]ow/|'U'JR}k!Z|`FPK    zS]\.       pagekite/tests_routing.pyXmOF_1B`rw|R)D
+A'Dή&Y;I$yyugb&z*Blr'"L`2rlXEs)yj|<0i2`2rBCf䐥i!iR<<sDȳ	~&{0AZM"TbǃP	?qq=T DI8AƆh|K=tȻXA\  1ʔFhvP^G'agZH2D]t۝˛OW`0ƐA3dkl0yp8LGZ}aľsW^.Ɛv.jو4ƚs0*c	LTєH aI&HE"A.#G@\+Y
+ !\K1G tb(gw0+]k!'ǩRZ\ʈp'^_|f`B:ОX%)8y @R/۾׺/^uٿi1w1w!	c
+h&P?#}{nss_׭^۾hw}un8wɱ iE2iYA85	q1,l2VKV 3?"nRkbmvrt4}Gi!oYdEY>6fK/.ϗiO)	曪yaʌy9&t0U63~BM+1Zno ?w|^A}ӊ" OZՀHo#}mߜ"Ò*D.4rTsKrz6B6aހ~'$(Ԙϟf7'32m_`^#y
+q在9K2p2B*D9w2vjAwN\:{:cQXFuQher%iE&8ЛWȑۘ*mVDb3^L'8F݀lABSX(5V6i\ikS2=ǯ.|INJי?5?5q)uR$Rm>/0<	$8xY_
+U愑^#5}.pmJC\gUZw^7h/fSLi9]Q0mlq*XXEKJ-mD㏄y3K%+)?S^cit+_}Uqt38c9K~JEJ;#Ļnڴqn)-*OVZV?oF[J(Ο;*wl^W_
+Z%Q+Ͳ@QfnZ
+^,xCRE.ֹfeyy8X*誆7f59	[I]bIKh۾߾?,ݘgG\*C`?>#QmJVΆAл4AReչ-EWԗUn5x0v\=fEA@/K NO4A{y@gPK    V\@                   pagekite/android.pyPK    S]̲_6                 pagekite/httpd.pyPK    S]CTM              D  pagekite/pk.pyPK    R]̿  .               pagekite/yamond.pyPK     uZ                      A pagekite/ui/PK    R]dZ_  >             . pagekite/logparse.pyPK    S]t  %             * pagekite/logging.pyPK    S]$OR*   }             8 pagekite/manual.pyPK    ׺pQ{N               c pagekite/__init__.pyPK    nZV!                .e pagekite/__main__.pyPK     tuZ                      Agz pagekite/proto/PK    R]<Wi               z pagekite/compat.pyPK    R]@  !              pagekite/common.pyPK    V[&f                pagekite/dropper.pyPK    uZ֊  K%              pagekite/ui/basic.pyPK    VA  '              pagekite/ui/nullui.pyPK    ׺pQ                       pagekite/ui/__init__.pyPK    V  9              pagekite/ui/remote.pyPK    S]s]  A7              pagekite/proto/proto.pyPK    rR]c  2             ^ pagekite/proto/ws_abnf.pyPK    lR]̸  6             h pagekite/proto/filters.pyPK    VM               y pagekite/proto/__init__.pyPK    TS]\*T=7  M              pagekite/proto/selectables.pyPK    V &  "             ** pagekite/proto/parsers.pyPK    S][ Q  A            83 pagekite/proto/conns.pyPK    S]pX  /              pagekite/timers.pyPK    R]qBt+                pagekite/acl.pyPK    RS]Qc  `)              pagekite/ratelimit.pyPK    WR]=[Ȏ                pagekite/routing.pyPK    S]ۃ(               \ pagekite/tls.pyPK    (gzZXM/  ٶ             P sockschain/__init__.pyPK    ^P7   =               sockschain/__main__.pyPK    =rR!               < six.pyPK    uZa68   J              a
+ __main__.pyPK    S]  ]             
+ pagekite/zchunks.pyPK    :R]s  F+              pagekite/loopmon.pyPK    zS]#`>3  /             & pagekite/bench.pyPK    TS]ʣ  *6             Z pagekite/tests_framer.pyPK    `S]v  !#             l pagekite/tests_auth.pyPK    `S]M
+               dy pagekite/tests_yamond.pyPK    S]wT                pagekite/workers.pyPK    S]1aä	  U             ) pagekite/tests_lookups.pyPK    S]|  0             g pagekite/tests_flow.pyPK    zS]\.                pagekite/tests_routing.pyPK    , , Q     
\ No newline at end of file